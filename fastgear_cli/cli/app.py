@@ -1,15 +1,34 @@
-from typing import Annotated
+from typing import Annotated, ClassVar
 
 import typer
 
 from fastgear_cli import __version__
-from fastgear_cli.cli.commands.add import add_app
-from fastgear_cli.cli.commands.init import init_app
-
-app = typer.Typer(help="Fastgear code generator", invoke_without_command=True)
-
-app.add_typer(init_app)
-app.add_typer(add_app)
+from fastgear_cli.cli.command_help import (
+    ADD_COMMAND_HELP,
+    DAEMON_COMMAND_HELP,
+    INIT_COMMAND_HELP,
+)
+from fastgear_cli.cli.lazy_group import LazyCommand, LazyTyperGroup
+
+
+class FastgearGroup(LazyTyperGroup):
+    lazy_commands: ClassVar[dict[str, LazyCommand]] = {
+        "init": LazyCommand(
+            "fastgear_cli.cli.commands.init:init_app",
+            help=INIT_COMMAND_HELP,
+        ),
+        "add": LazyCommand(
+            "fastgear_cli.cli.commands.add:add_app",
+            help=ADD_COMMAND_HELP,
+        ),
+        "daemon": LazyCommand(
+            "fastgear_cli.cli.commands.daemon:daemon_app",
+            help=DAEMON_COMMAND_HELP,
+        ),
+    }
+
+
+app = typer.Typer(help="Fastgear code generator", invoke_without_command=True, cls=FastgearGroup)
 
 
 @app.callback()
@@ -0,0 +1,91 @@
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+from fastgear_cli import __version__
+from fastgear_cli.configs.settings import get_daemon_socket_path
+
+FORWARDED_COMMANDS = frozenset({"add"})
+RESPONSE_CHUNK_SIZE = 65536
+DAEMON_READY_MESSAGE = b"\x06"
+DAEMON_READY_TIMEOUT_SECONDS = 2.0
+DAEMON_RESPONSE_TIMEOUT_SECONDS = 300.0
+
+
+def main() -> None:
+    exit_code = forward_command(sys.argv[1:])
+    if exit_code is None:
+        from fastgear_cli.cli.app import main as run_app
+
+        run_app()
+        return
+
+    sys.exit(exit_code)
+
+
+def forward_command(args: list[str]) -> int | None:
+    if not args or args[0] not in FORWARDED_COMMANDS or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    request = {
+        "version": __version__,
+        "cwd": str(Path.cwd()),
+        "args": args,
+        "color": sys.stdout.isatty(),
+        "env": dict(os.environ),
+    }
+    try:
+        connection = connect_to_daemon(get_daemon_socket_path())
+    except OSError:
+        return None
+
+    try:
+        with connection:
+            response = send_daemon_request(connection, request)
+    except (OSError, ValueError) as error:
+        sys.stderr.write(f"Lost connection to fg daemon: {error}\n")
+        return 1
+
+    if response.get("fallback"):
+        return None
+
+    sys.stdout.write(response["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(response["stderr"])
+    sys.stderr.flush()
+    return response["exit_code"]
+
+
+def connect_to_daemon(socket_path: Path) -> socket.socket:
+    connection = open_daemon_connection(socket_path)
+    try:
+        if connection.recv(len(DAEMON_READY_MESSAGE)) != DAEMON_READY_MESSAGE:
+            raise ConnectionError("fg daemon closed the connection before accepting requests")
+    except OSError:
+        connection.close()
+        raise
+    return connection
+
+
+def open_daemon_connection(socket_path: Path) -> socket.socket:
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(DAEMON_READY_TIMEOUT_SECONDS)
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        connection.close()
+        raise
+    return connection
+
+
+def send_daemon_request(connection: socket.socket, request: dict) -> dict:
+    connection.settimeout(DAEMON_RESPONSE_TIMEOUT_SECONDS)
+    connection.sendall(json.dumps(request).encode("utf-8"))
+    connection.shutdown(socket.SHUT_WR)
+
+    chunks = []
+    while chunk := connection.recv(RESPONSE_CHUNK_SIZE):
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks))
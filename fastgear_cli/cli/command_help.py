@@ -0,0 +1,3 @@
+INIT_COMMAND_HELP = "Create a new FastGear project"
+ADD_COMMAND_HELP = "Add new components to an existing FastGear project"
+DAEMON_COMMAND_HELP = "Keep fg warm in the background and serve add commands"
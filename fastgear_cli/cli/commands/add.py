@@ -1,8 +1,10 @@
+import os
 import re
 from pathlib import Path
 
 import typer
 
+from fastgear_cli.cli.command_help import ADD_COMMAND_HELP
 from fastgear_cli.cli.commands.helpers.add.controller import ask_service_path, validate_service_path
 from fastgear_cli.cli.commands.helpers.add.handler import create_component_files
 from fastgear_cli.cli.commands.helpers.add.module import add_module
@@ -11,21 +13,28 @@ from fastgear_cli.cli.commands.helpers.add.service import (
     ask_repository_path,
     validate_repository_path,
 )
+from fastgear_cli.cli.commands.helpers.add.spec import ModuleTask, load_add_spec, run_module_tasks
 from fastgear_cli.core.constants.enums import ElementTypeEnum
-from fastgear_cli.core.exceptions import FastgearCliError, InvalidInputError
-from fastgear_cli.core.models import AddElementConfig
+from fastgear_cli.core.exceptions import (
+    FastgearCliError,
+    InvalidInputError,
+    TemplateConflictError,
+)
+from fastgear_cli.core.formatting import FormattingQueue, formatting_batch
+from fastgear_cli.core.models import AddElementConfig, AddSpecConfig, ModuleSpecConfig
+from fastgear_cli.core.transaction import write_transaction
 from fastgear_cli.core.utils.file_tree_utils import FileTreeUtils
 
-add_app = typer.Typer(help="Add new components to an existing FastGear project")
+add_app = typer.Typer(help=ADD_COMMAND_HELP)
 
 
 @add_app.command()
 def add(
-    element_type: str = typer.Argument(
-        ...,
+    element_type: str | None = typer.Argument(
+        None,
         help="Element type: module | controller | service | entity | repository",
     ),
-    element_name: str = typer.Argument(..., help="Module name"),
+    element_name: str | None = typer.Argument(None, help="Module name"),
     path: Path = typer.Option(
         None,
         "--path",
@@ -34,10 +43,11 @@ def add(
         dir_okay=True,
         help="Base path where files should be created (defaults to current directory)",
     ),
-    use_folders: bool = typer.Option(
-        True,
+    use_folders: bool | None = typer.Option(
+        None,
         "--use-folders/--no-use-folders",
         help="Use nested folders (e.g. <module>/entities). Default is enabled.",
+        show_default=False,
     ),
     entity_path: str | None = typer.Option(
         None,
@@ -65,60 +75,270 @@ def add(
         "-n",
         help="Show what files would be created without actually creating them",
     ),
+    format_files: bool = typer.Option(
+        True,
+        "--format/--no-format",
+        help="Run ruff on updated __init__ files. Generated code is already ruff-clean, so --no-format skips the ruff subprocess.",
+    ),
+    spec_path: Path | None = typer.Option(
+        None,
+        "--from",
+        file_okay=True,
+        dir_okay=False,
+        help="TOML spec listing modules to generate in a single run (replaces ELEMENT_TYPE and ELEMENT_NAME)",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes used to generate independent modules from a --from spec",
+    ),
 ) -> None:
     try:
-        resolved_element_type = _parse_element_type(element_type)
-        resolved_element_name = _normalize_element_name(element_name)
-        base_dir = path or Path.cwd()
-
-        if resolved_element_type == ElementTypeEnum.MODULE:
-            files = add_module(
-                base_dir=base_dir,
-                module_name=resolved_element_name,
-                use_folders=use_folders,
+        spec = None
+        if spec_path is not None:
+            if element_type is not None or element_name is not None:
+                raise InvalidInputError("--from cannot be combined with an element type or name.")
+            _validate_spec_options(
                 entity_path=entity_path,
                 repository_path=repository_path,
                 service_path=service_path,
                 module_components=module_components,
-                dry_run=dry_run,
             )
-            output_base_dir = base_dir
-            success_message = f"\nAdded module {resolved_element_name} successfully!"
-        else:
-            if module_components is not None:
-                raise InvalidInputError(
-                    "--module-components can only be used with element type module."
-                )
+            spec = load_add_spec(spec_path)
+        elif element_type is None or element_name is None:
+            raise InvalidInputError("Element type and name are required unless --from is used.")
+        elif jobs > 1:
+            raise InvalidInputError("--jobs can only be used with --from.")
 
-            resolved_entity_path, resolved_repository_path, resolved_service_path = _resolve_paths(
-                element_type=resolved_element_type,
-                entity_path=entity_path,
-                repository_path=repository_path,
-                service_path=service_path,
-            )
-            config = AddElementConfig(
-                base_dir=base_dir,
-                element_type=resolved_element_type,
-                element_name=resolved_element_name,
-                use_folders=use_folders,
-                entity_path=resolved_entity_path,
-                repository_path=resolved_repository_path,
-                service_path=resolved_service_path,
-            )
-            files = create_component_files(config, dry_run=dry_run)
-            output_base_dir = config.base_dir
-            success_message = f"\nAdded {config.element_type} successfully!"
+        with (
+            write_transaction(Path.cwd()),
+            formatting_batch(format_files=format_files) as formatting_queue,
+        ):
+            if spec is not None:
+                files, added_modules = _add_from_spec(
+                    spec,
+                    path=path,
+                    use_folders=use_folders,
+                    jobs=jobs,
+                    dry_run=dry_run,
+                )
+                output_base_dir = Path(os.path.commonpath([Path.cwd(), *files]))
+                success_message = f"\nAdded {len(added_modules)} module(s) from spec successfully!"
+            else:
+                files, output_base_dir, success_message = _add_element(
+                    element_type=element_type,
+                    element_name=element_name,
+                    path=path,
+                    use_folders=True if use_folders is None else use_folders,
+                    entity_path=entity_path,
+                    repository_path=repository_path,
+                    service_path=service_path,
+                    module_components=module_components,
+                    dry_run=dry_run,
+                )
 
         if dry_run:
+            if spec is not None:
+                _display_spec_plan(spec, added_modules, path=path, use_folders=use_folders)
             FileTreeUtils.display_dry_run_output(files, output_base_dir)
             return
 
         typer.secho(success_message, fg=typer.colors.GREEN)
+        created_files, updated_files = _split_written_files(files, formatting_queue)
+        FileTreeUtils.display_write_report(
+            created_files,
+            updated_files,
+            formatting_queue.unchanged_files,
+            output_base_dir,
+        )
     except FastgearCliError as error:
         typer.secho(str(error), fg=typer.colors.RED)
         raise typer.Exit(code=1) from error
 
 
+def _add_element(
+    *,
+    element_type: str,
+    element_name: str,
+    path: Path | None,
+    use_folders: bool,
+    entity_path: str | None,
+    repository_path: str | None,
+    service_path: str | None,
+    module_components: str | None,
+    dry_run: bool,
+) -> tuple[list[Path], Path, str]:
+    resolved_element_type = _parse_element_type(element_type)
+    resolved_element_name = _normalize_element_name(element_name)
+    base_dir = path or Path.cwd()
+
+    if resolved_element_type == ElementTypeEnum.MODULE:
+        files = add_module(
+            base_dir=base_dir,
+            module_name=resolved_element_name,
+            use_folders=use_folders,
+            entity_path=entity_path,
+            repository_path=repository_path,
+            service_path=service_path,
+            module_components=module_components,
+            dry_run=dry_run,
+        )
+        return files, base_dir, f"\nAdded module {resolved_element_name} successfully!"
+
+    if module_components is not None:
+        raise InvalidInputError("--module-components can only be used with element type module.")
+
+    resolved_entity_path, resolved_repository_path, resolved_service_path = _resolve_paths(
+        element_type=resolved_element_type,
+        entity_path=entity_path,
+        repository_path=repository_path,
+        service_path=service_path,
+    )
+    config = AddElementConfig(
+        base_dir=base_dir,
+        element_type=resolved_element_type,
+        element_name=resolved_element_name,
+        use_folders=use_folders,
+        entity_path=resolved_entity_path,
+        repository_path=resolved_repository_path,
+        service_path=resolved_service_path,
+    )
+    files = create_component_files(config, dry_run=dry_run)
+    return files, config.base_dir, f"\nAdded {config.element_type} successfully!"
+
+
+def _split_written_files(
+    files: list[Path],
+    formatting_queue: FormattingQueue,
+) -> tuple[list[Path], list[Path]]:
+    queued_files = {*formatting_queue.written_files, *formatting_queue.unchanged_files}
+    rendered_files = [file_path.resolve() for file_path in files]
+    created_files = [
+        *formatting_queue.created_files,
+        *(file_path for file_path in rendered_files if file_path not in queued_files),
+    ]
+    updated_files = [
+        file_path
+        for file_path in formatting_queue.written_files
+        if file_path not in formatting_queue.created_files
+    ]
+    return created_files, updated_files
+
+
+def _validate_spec_options(
+    *,
+    entity_path: str | None,
+    repository_path: str | None,
+    service_path: str | None,
+    module_components: str | None,
+) -> None:
+    options = {
+        "--entity-path": entity_path,
+        "--repository-path": repository_path,
+        "--service-path": service_path,
+        "--module-components": module_components,
+    }
+    conflicting_options = [option for option, value in options.items() if value is not None]
+    if conflicting_options:
+        raise InvalidInputError(
+            f"--from cannot be combined with {', '.join(conflicting_options)}; "
+            "set them per module in the spec file instead."
+        )
+
+
+def _add_from_spec(
+    spec: AddSpecConfig,
+    *,
+    path: Path | None,
+    use_folders: bool | None,
+    jobs: int,
+    dry_run: bool,
+) -> tuple[list[Path], list[ModuleSpecConfig]]:
+    tasks = [
+        ModuleTask(
+            base_dir=_get_spec_module_base_dir(spec, module_spec, path=path),
+            module_name=_normalize_element_name(module_spec.name),
+            use_folders=_get_spec_module_use_folders(spec, module_spec, use_folders=use_folders),
+            module_components=module_spec.module_components,
+            entity_path=module_spec.entity_path,
+            repository_path=module_spec.repository_path,
+            service_path=module_spec.service_path,
+        )
+        for module_spec in spec.modules
+    ]
+    results = run_module_tasks(tasks, jobs=jobs, dry_run=dry_run)
+
+    files: list[Path] = []
+    added_modules: list[ModuleSpecConfig] = []
+    for module_spec, task, module_files in zip(spec.modules, tasks, results, strict=True):
+        if (
+            dry_run
+            and module_files is not None
+            and all(file_path in files for file_path in module_files)
+        ):
+            module_files = None
+        if module_files is None:
+            typer.secho(
+                f"Skipped module {task.module_name}: the content already exists.",
+                fg=typer.colors.YELLOW,
+            )
+            continue
+
+        added_modules.append(module_spec)
+        files.extend(file_path for file_path in module_files if file_path not in files)
+
+    if not added_modules:
+        raise TemplateConflictError("No new files created. The content may already exist.")
+
+    return files, added_modules
+
+
+def _display_spec_plan(
+    spec: AddSpecConfig,
+    added_modules: list[ModuleSpecConfig],
+    *,
+    path: Path | None,
+    use_folders: bool | None,
+) -> None:
+    cwd = Path.cwd().resolve()
+    typer.secho(f"\nModules to add: {len(added_modules)}", fg=typer.colors.CYAN)
+    for module_spec in added_modules:
+        module_name = _normalize_element_name(module_spec.name)
+        module_dir = (
+            _get_spec_module_base_dir(spec, module_spec, path=path) / module_name
+        ).resolve()
+        if module_dir.is_relative_to(cwd):
+            module_dir = module_dir.relative_to(cwd)
+        module_use_folders = _get_spec_module_use_folders(
+            spec, module_spec, use_folders=use_folders
+        )
+        layout = "folders" if module_use_folders else "flat"
+        components = ", ".join(component.value for component in module_spec.components)
+        typer.echo(f"  • {module_dir.as_posix()} ({layout}): {components}")
+
+
+def _get_spec_module_base_dir(
+    spec: AddSpecConfig,
+    module_spec: ModuleSpecConfig,
+    *,
+    path: Path | None,
+) -> Path:
+    return Path.cwd() / (module_spec.path or path or spec.path or "")
+
+
+def _get_spec_module_use_folders(
+    spec: AddSpecConfig,
+    module_spec: ModuleSpecConfig,
+    *,
+    use_folders: bool | None,
+) -> bool:
+    if module_spec.use_folders is not None:
+        return module_spec.use_folders
+    return spec.use_folders if use_folders is None else use_folders
+
+
 def _parse_element_type(value: str) -> ElementTypeEnum:
     try:
         return ElementTypeEnum(value.strip().lower())
@@ -0,0 +1,38 @@
+import typer
+
+from fastgear_cli.cli.command_help import DAEMON_COMMAND_HELP
+from fastgear_cli.configs.settings import get_daemon_socket_path
+from fastgear_cli.core.exceptions import FastgearCliError
+
+daemon_app = typer.Typer(help=DAEMON_COMMAND_HELP)
+
+
+@daemon_app.command()
+def daemon(
+    stop: bool = typer.Option(
+        False,
+        "--stop",
+        help="Stop the running daemon",
+    ),
+) -> None:
+    from fastgear_cli.cli.commands.helpers.daemon.server import serve_daemon, stop_daemon
+
+    socket_path = get_daemon_socket_path()
+    try:
+        if stop:
+            stop_daemon(socket_path)
+            typer.secho("Stopped fg daemon.", fg=typer.colors.GREEN)
+            return
+
+        serve_daemon(
+            socket_path,
+            on_ready=lambda: typer.secho(
+                f"fg daemon listening on {socket_path}",
+                fg=typer.colors.GREEN,
+            ),
+        )
+    except FastgearCliError as error:
+        typer.secho(str(error), fg=typer.colors.RED)
+        raise typer.Exit(code=1) from error
+    except KeyboardInterrupt:
+        typer.secho("\nStopped fg daemon.", fg=typer.colors.GREEN)
@@ -1,11 +1,15 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import questionary
-
+from fastgear_cli.cli.prompts.interaction import ensure_interactive
 from fastgear_cli.core.exceptions import InvalidInputError
-from fastgear_cli.core.render import run_ruff_format
-from fastgear_cli.core.utils.init_content_merge_utils import merge_required_line
+from fastgear_cli.core.formatting import (
+    get_ruff_first_party_modules,
+    get_ruff_line_length,
+    read_python_file,
+    write_python_file,
+)
+from fastgear_cli.core.utils.init_edit_utils import InitFileEdits, apply_init_edits
 from fastgear_cli.core.utils.init_file_utils import update_module_init
 from fastgear_cli.core.utils.python_validators_utils import (
     is_valid_python_identifier,
@@ -17,6 +21,9 @@ if TYPE_CHECKING:
 
 
 def ask_service_path() -> str | None:
+    ensure_interactive()
+    import questionary
+
     should_use_service = questionary.confirm(
         "Do you want to inject a service into this controller?",
         default=False,
@@ -102,12 +109,12 @@ def _update_parent_module_router_init(
     dry_run: bool,
 ) -> Path | None:
     init_path = base_dir / "__init__.py"
-    if not init_path.exists():
+    current_content = read_python_file(init_path)
+    if current_content is None:
         return None
 
     module_name = base_dir.name
     router_anchor_line = f"{module_name}_module_router = APIRouter()"
-    current_content = init_path.read_text(encoding="utf-8")
     if router_anchor_line not in current_content:
         return None
 
@@ -118,11 +125,14 @@ def _update_parent_module_router_init(
     )
     include_line = f"{module_name}_module_router.include_router({controller_name}_router)"
 
-    content = merge_required_line(current=current_content, required_line=import_line)
-    content = merge_required_line(
-        current=content,
-        required_line=include_line,
-        anchor_line=router_anchor_line,
+    edits = InitFileEdits()
+    edits.add_import(import_line)
+    edits.add_line(include_line, anchor_line=router_anchor_line)
+    content = apply_init_edits(
+        current_content,
+        edits,
+        line_length=get_ruff_line_length(init_path),
+        first_party_modules=get_ruff_first_party_modules(init_path),
     )
     if content == current_content:
         return None
@@ -130,6 +140,5 @@ def _update_parent_module_router_init(
     if dry_run:
         return init_path
 
-    init_path.write_text(content, encoding="utf-8")
-    run_ruff_format(init_path, base_dir)
+    write_python_file(init_path, content, base_dir)
     return init_path
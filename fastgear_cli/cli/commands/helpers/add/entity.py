@@ -1,11 +1,13 @@
 from pathlib import Path
 
-from fastgear_cli.core.models import AddElementConfig
-from fastgear_cli.core.render import run_ruff_format
-from fastgear_cli.core.utils.init_content_merge_utils import (
-    merge_required_line,
-    merge_symbol_list_assignment,
+from fastgear_cli.core.formatting import (
+    get_ruff_first_party_modules,
+    get_ruff_line_length,
+    read_python_file,
+    write_python_file,
 )
+from fastgear_cli.core.models import AddElementConfig
+from fastgear_cli.core.utils.init_edit_utils import InitFileEdits, apply_init_edits
 from fastgear_cli.core.utils.init_file_utils import update_module_init
 
 
@@ -64,12 +66,12 @@ def _update_parent_module_entities_init(
     dry_run: bool,
 ) -> Path | None:
     init_path = base_dir / "__init__.py"
-    if not init_path.exists():
+    current_content = read_python_file(init_path)
+    if current_content is None:
         return None
 
     module_name = base_dir.name
     entities_list_name = f"{module_name}_entities"
-    current_content = init_path.read_text(encoding="utf-8")
     if f"{entities_list_name} =" not in current_content:
         return None
 
@@ -79,11 +81,14 @@ def _update_parent_module_entities_init(
         else f"from .{entity_name}_entity import {entity_class_name}"
     )
 
-    content = merge_required_line(current=current_content, required_line=import_line)
-    content = merge_symbol_list_assignment(
-        current=content,
-        list_name=entities_list_name,
-        symbol_name=entity_class_name,
+    edits = InitFileEdits()
+    edits.add_import(import_line)
+    edits.extend_list(entities_list_name, [entity_class_name])
+    content = apply_init_edits(
+        current_content,
+        edits,
+        line_length=get_ruff_line_length(init_path),
+        first_party_modules=get_ruff_first_party_modules(init_path),
     )
     if content == current_content:
         return None
@@ -91,6 +96,5 @@ def _update_parent_module_entities_init(
     if dry_run:
         return init_path
 
-    init_path.write_text(content, encoding="utf-8")
-    run_ruff_format(init_path, base_dir)
+    write_python_file(init_path, content, base_dir)
     return init_path
@@ -1,22 +1,23 @@
 from pathlib import Path
 
-import questionary
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
 from fastgear_cli.cli.commands.helpers.add.controller import validate_service_path
 from fastgear_cli.cli.commands.helpers.add.handler import create_component_files
 from fastgear_cli.cli.commands.helpers.add.repository import validate_entity_path
 from fastgear_cli.cli.commands.helpers.add.service import validate_repository_path
+from fastgear_cli.cli.prompts.interaction import ensure_interactive
 from fastgear_cli.configs.settings import ROOT_DIR
 from fastgear_cli.core.constants.enums import ElementTypeEnum
 from fastgear_cli.core.exceptions import InvalidInputError, TemplateConflictError
-from fastgear_cli.core.models import AddElementConfig
-from fastgear_cli.core.render import run_ruff_format
-from fastgear_cli.core.utils.init_content_merge_utils import (
-    merge_required_line,
-    merge_symbol_list_assignment,
-    parse_symbol_list_assignment,
+from fastgear_cli.core.formatting import (
+    get_ruff_first_party_modules,
+    get_ruff_line_length,
+    read_python_file,
+    write_python_file,
 )
+from fastgear_cli.core.models import AddElementConfig
+from fastgear_cli.core.template_env import get_template_environment
+from fastgear_cli.core.utils.init_content_merge_utils import parse_symbol_list_assignment
+from fastgear_cli.core.utils.init_edit_utils import InitFileEdits, apply_init_edits
 
 MODULE_PROMPT_CHOICES = (
     ElementTypeEnum.CONTROLLER,
@@ -97,6 +98,9 @@ def add_module(
 
 def _resolve_module_components(module_components: str | None) -> list[ElementTypeEnum]:
     if module_components is None:
+        ensure_interactive()
+        import questionary
+
         selected = questionary.checkbox(
             "Which components do you want to add to this module?",
             choices=[choice.value for choice in MODULE_PROMPT_CHOICES],
@@ -255,24 +259,23 @@ def _update_module_init_from_template(
     if not has_controller and not has_entity:
         template_content = ""
 
-    if not init_path.exists():
-        content = template_content
+    current_content = read_python_file(init_path)
+    if current_content is None:
         if dry_run:
             return init_path
 
-        init_path.parent.mkdir(parents=True, exist_ok=True)
-        init_path.write_text(content, encoding="utf-8")
-        run_ruff_format(init_path, module_dir)
+        write_python_file(init_path, template_content, module_dir)
         return init_path
 
     if not template_content.strip():
         return None
 
-    current_content = init_path.read_text(encoding="utf-8")
     content = _merge_module_init_template_content(
         current=current_content,
         template_content=template_content,
         module_name=module_name,
+        line_length=get_ruff_line_length(init_path),
+        first_party_modules=get_ruff_first_party_modules(init_path),
     )
     if content == current_content:
         return None
@@ -280,8 +283,7 @@ def _update_module_init_from_template(
     if dry_run:
         return init_path
 
-    init_path.write_text(content, encoding="utf-8")
-    run_ruff_format(init_path, module_dir)
+    write_python_file(init_path, content, module_dir)
     return init_path
 
 
@@ -306,11 +308,7 @@ def _render_module_init_template(
     context: dict[str, str | bool],
 ) -> str:
     template_dir = ROOT_DIR / "templates" / "add" / "module" / ("folder" if use_folders else "flat")
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=select_autoescape(enabled_extensions=()),
-        keep_trailing_newline=True,
-    )
+    env = get_template_environment(template_dir)
     template = env.get_template("__init__.py.j2")
     return template.render(**context)
 
@@ -320,8 +318,10 @@ def _merge_module_init_template_content(
     current: str,
     template_content: str,
     module_name: str,
+    line_length: int,
+    first_party_modules: frozenset[str],
 ) -> str:
-    merged = current
+    edits = InitFileEdits()
     module_router_line = f"{module_name}_module_router = APIRouter()"
 
     for template_line in template_content.splitlines():
@@ -332,22 +332,17 @@ def _merge_module_init_template_content(
         parsed_assignment = parse_symbol_list_assignment(line)
         if parsed_assignment:
             list_name, symbol_names = parsed_assignment
-            for symbol_name in symbol_names:
-                merged = merge_symbol_list_assignment(
-                    current=merged,
-                    list_name=list_name,
-                    symbol_name=symbol_name,
-                )
-            continue
-
-        if line.startswith(f"{module_name}_module_router.include_router("):
-            merged = merge_required_line(
-                current=merged,
-                required_line=line,
-                anchor_line=module_router_line,
-            )
-            continue
-
-        merged = merge_required_line(current=merged, required_line=line)
-
-    return merged
+            edits.extend_list(list_name, symbol_names)
+        elif line.startswith(("from ", "import ")):
+            edits.add_import(line)
+        elif line.startswith(f"{module_name}_module_router.include_router("):
+            edits.add_line(line, anchor_line=module_router_line)
+        else:
+            edits.add_line(line)
+
+    return apply_init_edits(
+        current,
+        edits,
+        line_length=line_length,
+        first_party_modules=first_party_modules,
+    )
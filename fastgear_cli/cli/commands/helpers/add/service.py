@@ -1,8 +1,7 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import questionary
-
+from fastgear_cli.cli.prompts.interaction import ensure_interactive
 from fastgear_cli.core.exceptions import InvalidInputError
 from fastgear_cli.core.utils.init_file_utils import update_module_init
 from fastgear_cli.core.utils.python_validators_utils import (
@@ -15,6 +14,9 @@ if TYPE_CHECKING:
 
 
 def ask_repository_path() -> str | None:
+    ensure_interactive()
+    import questionary
+
     should_use_repository = questionary.confirm(
         "Do you want to inject a repository into this service?",
         default=False,
@@ -0,0 +1,168 @@
+import contextvars
+import io
+import os
+import sys
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from fastgear_cli.cli.commands.helpers.add.module import add_module
+from fastgear_cli.core.exceptions import InvalidInputError, TemplateConflictError
+from fastgear_cli.core.formatting import formatting_batch, write_python_file
+from fastgear_cli.core.models import AddSpecConfig
+from fastgear_cli.core.transaction import captured_write_transaction, get_write_path
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleTask:
+    base_dir: Path
+    module_name: str
+    use_folders: bool
+    module_components: str
+    entity_path: str | None = None
+    repository_path: str | None = None
+    service_path: str | None = None
+
+    @property
+    def module_dir(self) -> Path:
+        return (self.base_dir / self.module_name).resolve()
+
+
+@dataclass(slots=True)
+class ModuleGroupOutput:
+    results: list[list[Path] | None]
+    staged_files: dict[Path, bytes]
+    python_files: dict[Path, str]
+    stdout: str = ""
+    stderr: str = ""
+
+
+def load_add_spec(spec_path: Path) -> AddSpecConfig:
+    try:
+        data = tomllib.loads(spec_path.read_text(encoding="utf-8"))
+    except OSError as error:
+        raise InvalidInputError(
+            f"Unable to read spec file {spec_path}: {error.strerror}"
+        ) from error
+    except tomllib.TOMLDecodeError as error:
+        raise InvalidInputError(f"Invalid spec file {spec_path}: {error}") from error
+
+    try:
+        return AddSpecConfig.model_validate(data)
+    except ValidationError as error:
+        details = "\n".join(
+            f"  - {'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+            for item in error.errors()
+        )
+        raise InvalidInputError(f"Invalid spec file {spec_path}:\n{details}") from error
+
+
+def run_module_tasks(
+    tasks: list[ModuleTask],
+    *,
+    jobs: int,
+    dry_run: bool,
+) -> list[list[Path] | None]:
+    groups = partition_module_tasks(tasks)
+    if jobs <= 1 or len(groups) <= 1:
+        return [_run_module_task(task, dry_run=dry_run) for task in tasks]
+
+    results: list[list[Path] | None] = [None] * len(tasks)
+    root = Path.cwd()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(groups))) as executor:
+        futures = [
+            executor.submit(_run_module_group, root, [tasks[index] for index in group], dry_run)
+            for group in groups
+        ]
+        for group, future in zip(groups, futures, strict=True):
+            output = future.result()
+            _apply_module_group_output(output)
+            for index, module_files in zip(group, output.results, strict=True):
+                results[index] = module_files
+
+    return results
+
+
+def partition_module_tasks(tasks: list[ModuleTask]) -> list[list[int]]:
+    groups: list[tuple[list[Path], list[int]]] = []
+    for index, task in enumerate(tasks):
+        module_dir = task.module_dir
+        overlapping = [
+            group
+            for group in groups
+            if any(_dirs_overlap(module_dir, group_dir) for group_dir in group[0])
+        ]
+        if not overlapping:
+            groups.append(([module_dir], [index]))
+            continue
+
+        merged_dirs = [group_dir for group in overlapping for group_dir in group[0]]
+        merged_indexes = sorted(group_index for group in overlapping for group_index in group[1])
+        position = groups.index(overlapping[0])
+        groups = [group for group in groups if group not in overlapping]
+        groups.insert(position, ([*merged_dirs, module_dir], [*merged_indexes, index]))
+
+    return [indexes for _, indexes in groups]
+
+
+def _run_module_task(task: ModuleTask, *, dry_run: bool) -> list[Path] | None:
+    try:
+        return add_module(
+            base_dir=task.base_dir,
+            module_name=task.module_name,
+            use_folders=task.use_folders,
+            entity_path=task.entity_path,
+            repository_path=task.repository_path,
+            service_path=task.service_path,
+            module_components=task.module_components,
+            dry_run=dry_run,
+        )
+    except TemplateConflictError:
+        return None
+
+
+def _run_module_group(root: Path, tasks: list[ModuleTask], dry_run: bool) -> ModuleGroupOutput:
+    os.chdir(root)
+    return contextvars.Context().run(_capture_module_group, root, tasks, dry_run)
+
+
+def _capture_module_group(root: Path, tasks: list[ModuleTask], dry_run: bool) -> ModuleGroupOutput:
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with (
+        redirect_stdout(stdout),
+        redirect_stderr(stderr),
+        captured_write_transaction(root) as transaction,
+        formatting_batch(format_files=False) as journal,
+    ):
+        results = [_run_module_task(task, dry_run=dry_run) for task in tasks]
+        python_files = journal.drain()
+        staged_files = transaction.read_staged_files()
+
+    return ModuleGroupOutput(
+        results=results,
+        staged_files=staged_files,
+        python_files=python_files,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
+
+def _apply_module_group_output(output: ModuleGroupOutput) -> None:
+    sys.stdout.write(output.stdout)
+    sys.stderr.write(output.stderr)
+    for target, data in output.staged_files.items():
+        write_path = get_write_path(target)
+        write_path.parent.mkdir(parents=True, exist_ok=True)
+        write_path.write_bytes(data)
+
+    for target, content in output.python_files.items():
+        write_python_file(target, content, target.parent)
+
+
+def _dirs_overlap(first: Path, second: Path) -> bool:
+    return first.is_relative_to(second) or second.is_relative_to(first)
@@ -0,0 +1,217 @@
+import io
+import json
+import os
+import socket
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout, suppress
+from functools import cache
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer.main
+
+from fastgear_cli import __version__
+from fastgear_cli.cli.app import app
+from fastgear_cli.cli.client import (
+    DAEMON_READY_MESSAGE,
+    FORWARDED_COMMANDS,
+    RESPONSE_CHUNK_SIZE,
+    connect_to_daemon,
+    open_daemon_connection,
+    send_daemon_request,
+)
+from fastgear_cli.cli.prompts.interaction import non_interactive
+from fastgear_cli.configs.settings import TEMPLATES_DIR
+from fastgear_cli.core.exceptions import FastgearCliError, InteractionRequiredError
+from fastgear_cli.core.template_env import get_template_environment
+from fastgear_cli.core.template_manifest import TEMPLATE_SUFFIX, find_template_roots
+
+if TYPE_CHECKING:
+    from click import Command
+
+WARM_MODULES = (
+    "fastgear_cli.cli.commands.add",
+    "fastgear_cli.cli.commands.helpers.add.spec",
+)
+WARM_TEMPLATES_DIR = TEMPLATES_DIR / "add"
+SOCKET_FILE_MODE = 0o600
+SOCKET_UMASK = 0o177
+DAEMON_REQUEST_TIMEOUT_SECONDS = 5.0
+
+
+def serve_daemon(socket_path: Path, *, on_ready: Callable[[], None] | None = None) -> None:
+    warm_up()
+    _remove_stale_socket(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        with _restrictive_umask():
+            server.bind(str(socket_path))
+        try:
+            socket_path.chmod(SOCKET_FILE_MODE)
+            server.listen()
+            if on_ready is not None:
+                on_ready()
+            while True:
+                connection, _ = server.accept()
+                connection.settimeout(DAEMON_REQUEST_TIMEOUT_SECONDS)
+                with connection:
+                    request = _serve_connection(connection)
+                if request.get("stop"):
+                    return
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def stop_daemon(socket_path: Path) -> None:
+    try:
+        connection = connect_to_daemon(socket_path)
+    except OSError as error:
+        raise FastgearCliError(f"No fg daemon is listening on {socket_path}.") from error
+
+    with connection:
+        send_daemon_request(connection, {"stop": True})
+
+
+def warm_up() -> None:
+    get_app_command()
+    for module_name in WARM_MODULES:
+        import_module(module_name)
+
+    for template_root in find_template_roots():
+        if not template_root.is_relative_to(WARM_TEMPLATES_DIR):
+            continue
+        env = get_template_environment(template_root)
+        for template_path in template_root.rglob(f"*{TEMPLATE_SUFFIX}"):
+            env.get_template(template_path.relative_to(template_root).as_posix())
+
+
+def handle_daemon_request(request: dict) -> dict:
+    if request.get("stop"):
+        return {"stdout": "", "stderr": "", "exit_code": 0}
+
+    args = request.get("args")
+    if (
+        request.get("version") != __version__
+        or not isinstance(args, list)
+        or not args
+        or args[0] not in FORWARDED_COMMANDS
+    ):
+        return {"fallback": True}
+
+    error = _validate_request(request)
+    if error is not None:
+        return {"stdout": "", "stderr": f"{error}\n", "exit_code": 1}
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    previous_cwd = Path.cwd()
+    try:
+        os.chdir(request["cwd"])
+        with (
+            _client_environment(request["env"]),
+            redirect_stdout(stdout),
+            redirect_stderr(stderr),
+            non_interactive(),
+        ):
+            exit_code = _run_app(args, color=request.get("color") or None)
+    except InteractionRequiredError:
+        return {"fallback": True}
+    except Exception:  # noqa: BLE001
+        stderr.write(traceback.format_exc())
+        exit_code = 1
+    finally:
+        os.chdir(previous_cwd)
+
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+@cache
+def get_app_command() -> "Command":
+    return typer.main.get_command(app)
+
+
+def _run_app(args: list[str], *, color: bool | None) -> int:
+    try:
+        get_app_command().main(args=args, prog_name="fg", color=color)
+    except SystemExit as error:
+        return error.code if isinstance(error.code, int) else int(error.code is not None)
+    return 0
+
+
+def _serve_connection(connection: socket.socket) -> dict:
+    try:
+        connection.sendall(DAEMON_READY_MESSAGE)
+        request = _read_request(connection)
+    except OSError:
+        return {}
+
+    response = handle_daemon_request(request)
+    with suppress(OSError):
+        connection.sendall(json.dumps(response).encode("utf-8"))
+    return request
+
+
+def _validate_request(request: dict) -> str | None:
+    if not all(isinstance(arg, str) for arg in request["args"]):
+        return "Invalid daemon request: args must be strings."
+
+    cwd = request.get("cwd")
+    if not isinstance(cwd, str) or not Path(cwd).is_dir():
+        return f"Invalid daemon request: working directory {cwd!r} does not exist."
+
+    env = request.get("env")
+    if not isinstance(env, dict) or not all(
+        isinstance(key, str) and isinstance(value, str) for key, value in env.items()
+    ):
+        return "Invalid daemon request: env must map strings to strings."
+
+    return None
+
+
+@contextmanager
+def _client_environment(env: dict[str, str]) -> Iterator[None]:
+    previous_env = os.environ.copy()
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(previous_env)
+
+
+@contextmanager
+def _restrictive_umask() -> Iterator[None]:
+    previous_umask = os.umask(SOCKET_UMASK)
+    try:
+        yield
+    finally:
+        os.umask(previous_umask)
+
+
+def _read_request(connection: socket.socket) -> dict:
+    chunks = []
+    while chunk := connection.recv(RESPONSE_CHUNK_SIZE):
+        chunks.append(chunk)
+    try:
+        request = json.loads(b"".join(chunks))
+    except ValueError:
+        return {}
+    return request if isinstance(request, dict) else {}
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+
+    try:
+        connection = open_daemon_connection(socket_path)
+    except OSError:
+        socket_path.unlink(missing_ok=True)
+        return
+
+    connection.close()
+    raise FastgearCliError(f"An fg daemon is already listening on {socket_path}.")
@@ -1,9 +1,10 @@
-import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import questionary
 import typer
 
+from fastgear_cli.cli.command_help import INIT_COMMAND_HELP
 from fastgear_cli.cli.prompts.init_project import (
     ask_agent_tools,
     ask_ci_provider,
@@ -11,12 +12,14 @@ from fastgear_cli.cli.prompts.init_project import (
     ask_project_name,
     confirm_project_title,
 )
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
 from fastgear_cli.core.exceptions import TemplateConflictError
 from fastgear_cli.core.filesystem import create_template
 from fastgear_cli.core.models import ProjectInitConfig
 from fastgear_cli.core.utils.file_tree_utils import FileTreeUtils
+from fastgear_cli.core.uv_lock import background_uv_lock
 
-init_app = typer.Typer(help="Project initialization command")
+init_app = typer.Typer(help=INIT_COMMAND_HELP)
 
 
 @init_app.command()
@@ -32,18 +35,31 @@ def init(
         "-n",
         help="Show what files would be created without actually creating them",
     ),
+    static_copy_mode: StaticCopyModeEnum = typer.Option(
+        StaticCopyModeEnum.COPY,
+        "--static-copy-mode",
+        case_sensitive=False,
+        help="How static template files are copied (hardlinked files share storage with the "
+        "templates and must not be edited in place)",
+    ),
 ):
     try:
         base_dir = path or Path.cwd()
 
         config = _collect_project_info(base_dir)
-        files = _generate_project(config, dry_run=dry_run)
 
         if dry_run:
+            files = _generate_project(config, dry_run=True)
             FileTreeUtils.display_dry_run_output(files, base_dir)
             return
 
-        _run_uv_lock(config.project_dir)
+        with background_uv_lock(config.project_dir) as uv_lock_job:
+            _generate_project(
+                config,
+                dry_run=False,
+                on_file_written=uv_lock_job.notify_file_written,
+                static_copy_mode=static_copy_mode,
+            )
 
         typer.secho(
             f"\n🎉  Project '{config.project_name}' created successfully!",
@@ -75,7 +91,13 @@ def _collect_project_info(base_dir: Path) -> ProjectInitConfig:
     )
 
 
-def _generate_project(config: ProjectInitConfig, *, dry_run: bool) -> list[Path]:
+def _generate_project(
+    config: ProjectInitConfig,
+    *,
+    dry_run: bool,
+    on_file_written: Callable[[Path], None] | None = None,
+    static_copy_mode: StaticCopyModeEnum = StaticCopyModeEnum.COPY,
+) -> list[Path]:
     if config.project_dir.exists() and any(config.project_dir.iterdir()):
         raise TemplateConflictError(f"Directory '{config.project_dir}' already exists.")
 
@@ -87,28 +109,9 @@ def _generate_project(config: ProjectInitConfig, *, dry_run: bool) -> list[Path]
             config.conditional_files,
             config.conditional_dirs,
             dry_run=dry_run,
+            on_file_written=on_file_written,
+            use_cache=True,
+            static_copy_mode=static_copy_mode,
         )
     except FileExistsError as error:
         raise TemplateConflictError(f"Directory '{config.project_dir}' already exists.") from error
-
-
-def _run_uv_lock(project_dir: Path) -> None:
-    typer.secho("📦 Generating uv.lock...", fg=typer.colors.CYAN)
-    try:
-        subprocess.run(
-            ["uv", "lock"],
-            cwd=project_dir,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-    except subprocess.CalledProcessError as error:
-        typer.secho(
-            f"Failed to generate uv.lock: {error.stderr}",
-            fg=typer.colors.YELLOW,
-        )
-    except FileNotFoundError:
-        typer.secho(
-            "uv not found. Please install uv to generate the lock file.",
-            fg=typer.colors.YELLOW,
-        )
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import TYPE_CHECKING, ClassVar
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+if TYPE_CHECKING:
+    from click import Command, Context, HelpFormatter
+
+
+@dataclass(frozen=True, slots=True)
+class LazyCommand:
+    import_path: str
+    help: str | None = None
+
+    def load(self, name: str) -> "Command":
+        module_name, app_name = self.import_path.split(":", 1)
+        typer_app = getattr(import_module(module_name), app_name)
+        return typer.main.get_group(typer_app).commands[name]
+
+
+class LazyTyperGroup(TyperGroup):
+    lazy_commands: ClassVar[dict[str, LazyCommand]] = {}
+
+    _formatting_help = False
+
+    def list_commands(self, ctx: "Context") -> list[str]:
+        loaded_commands = super().list_commands(ctx)
+        return [
+            *loaded_commands,
+            *(name for name in self.lazy_commands if name not in loaded_commands),
+        ]
+
+    def get_command(self, ctx: "Context", cmd_name: str) -> "Command | None":
+        command = super().get_command(ctx, cmd_name)
+        lazy_command = self.lazy_commands.get(cmd_name)
+        if command is not None or lazy_command is None:
+            return command
+
+        if self._formatting_help:
+            return TyperCommand(name=cmd_name, help=lazy_command.help)
+
+        command = lazy_command.load(cmd_name)
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: "Context", formatter: "HelpFormatter") -> None:
+        self._formatting_help = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
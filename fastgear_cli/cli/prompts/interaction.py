@@ -0,0 +1,21 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fastgear_cli.core.exceptions import InteractionRequiredError
+
+_interactive: ContextVar[bool] = ContextVar("fastgear_interactive", default=True)
+
+
+@contextmanager
+def non_interactive() -> Iterator[None]:
+    token = _interactive.set(False)
+    try:
+        yield
+    finally:
+        _interactive.reset(token)
+
+
+def ensure_interactive() -> None:
+    if not _interactive.get():
+        raise InteractionRequiredError("This command needs interactive input.")
@@ -1,3 +1,33 @@
+import os
+import sys
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
+TEMPLATES_DIR = ROOT_DIR / "templates"
+
+CACHE_DIR_ENV_VAR = "FASTGEAR_CLI_CACHE_DIR"
+DAEMON_SOCKET_ENV_VAR = "FASTGEAR_CLI_DAEMON_SOCKET"
+DAEMON_SOCKET_FILE_NAME = "daemon.sock"
+
+
+def get_cache_dir() -> Path:
+    custom_cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if custom_cache_dir:
+        return Path(custom_cache_dir)
+
+    if sys.platform == "win32":
+        base_dir = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base_dir = Path.home() / "Library" / "Caches"
+    else:
+        base_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+    return base_dir / "fastgear-cli"
+
+
+def get_daemon_socket_path() -> Path:
+    custom_socket_path = os.environ.get(DAEMON_SOCKET_ENV_VAR)
+    if custom_socket_path:
+        return Path(custom_socket_path)
+
+    return get_cache_dir() / DAEMON_SOCKET_FILE_NAME
@@ -2,10 +2,12 @@ from .agent_tools_enum import AgentToolsEnum
 from .ci_provider_enum import CIProviderEnum
 from .database_provider_enum import DatabaseProviderEnum
 from .element_type_enum import ElementTypeEnum
+from .static_copy_mode_enum import StaticCopyModeEnum
 
 __all__ = [
     "AgentToolsEnum",
     "CIProviderEnum",
     "DatabaseProviderEnum",
     "ElementTypeEnum",
+    "StaticCopyModeEnum",
 ]
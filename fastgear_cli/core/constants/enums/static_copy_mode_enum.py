@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class StaticCopyModeEnum(StrEnum):
+    COPY = "copy"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
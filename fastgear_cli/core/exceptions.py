@@ -8,3 +8,7 @@ class InvalidInputError(FastgearCliError):
 
 class TemplateConflictError(FastgearCliError):
     """Raised when template generation cannot create any new file."""
+
+
+class InteractionRequiredError(Exception):
+    """Raised when a command needs a prompt while running without a terminal."""
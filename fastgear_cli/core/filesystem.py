@@ -1,8 +1,11 @@
+from collections.abc import Callable
 from pathlib import Path
 
 from fastgear_cli.configs.settings import ROOT_DIR
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
 from fastgear_cli.core.exceptions import TemplateConflictError
-from fastgear_cli.core.render import render_template
+from fastgear_cli.core.render import RENDER_STREAM_THRESHOLD, render_template
+from fastgear_cli.core.render_cache import render_template_cached
 
 
 def create_template(
@@ -13,19 +16,38 @@ def create_template(
     conditional_dirs: dict[str, bool] | None = None,
     *,
     dry_run: bool = False,
+    on_file_written: Callable[[Path], None] | None = None,
+    use_cache: bool = False,
+    static_copy_mode: StaticCopyModeEnum = StaticCopyModeEnum.COPY,
+    stream_threshold: int | None = RENDER_STREAM_THRESHOLD,
 ) -> list[Path]:
     conditional_files = conditional_files or {}
     conditional_dirs = conditional_dirs or {}
 
     template_root = ROOT_DIR / "templates" / template_name
-    files = render_template(
-        template_root,
-        base_dir,
-        context,
-        conditional_files,
-        conditional_dirs,
-        dry_run=dry_run,
-    )
+    if use_cache and not dry_run:
+        files = render_template_cached(
+            template_root,
+            base_dir,
+            context,
+            conditional_files,
+            conditional_dirs,
+            on_file_written=on_file_written,
+            static_copy_mode=static_copy_mode,
+            stream_threshold=stream_threshold,
+        )
+    else:
+        files = render_template(
+            template_root,
+            base_dir,
+            context,
+            conditional_files,
+            conditional_dirs,
+            dry_run=dry_run,
+            on_file_written=on_file_written,
+            static_copy_mode=static_copy_mode,
+            stream_threshold=stream_threshold,
+        )
 
     if not files:
         raise TemplateConflictError("No new files created. The content may already exist.")
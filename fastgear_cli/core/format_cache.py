@@ -0,0 +1,92 @@
+import hashlib
+import os
+from collections.abc import Iterable
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+
+from fastgear_cli.configs.settings import get_cache_dir
+
+FORMAT_CACHE_DIR_NAME = "ruff-format"
+FORMAT_CACHE_MAX_ENTRIES = 2048
+FORMAT_CACHE_SUFFIX = ".py.txt"
+
+
+@cache
+def get_ruff_version() -> str | None:
+    try:
+        return metadata.version("ruff")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_format_cache_dir() -> Path:
+    return get_cache_dir() / FORMAT_CACHE_DIR_NAME
+
+
+def build_format_cache_key(
+    content: str,
+    file_key: str,
+    config_paths: list[Path],
+    first_party_modules: Iterable[str] = (),
+) -> str | None:
+    ruff_version = get_ruff_version()
+    if ruff_version is None:
+        return None
+
+    try:
+        config_contents = [config_path.read_bytes() for config_path in config_paths]
+    except OSError:
+        return None
+
+    digest = hashlib.sha256()
+    for part in (ruff_version, file_key, *sorted(first_party_modules)):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for config_content in config_contents:
+        digest.update(hashlib.sha256(config_content).digest())
+    digest.update(content.encode())
+    return digest.hexdigest()
+
+
+def load_formatted_source(cache_key: str) -> str | None:
+    cache_path = get_format_cache_dir() / f"{cache_key}{FORMAT_CACHE_SUFFIX}"
+    try:
+        formatted = cache_path.read_text(encoding="utf-8")
+        os.utime(cache_path)
+    except OSError:
+        return None
+    return formatted
+
+
+def store_formatted_source(cache_key: str, formatted: str) -> None:
+    cache_dir = get_format_cache_dir()
+    cache_path = cache_dir / f"{cache_key}{FORMAT_CACHE_SUFFIX}"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_key}.{os.getpid()}.tmp")
+        temp_path.write_text(formatted, encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError:
+        return
+
+    _evict_least_recently_used(cache_dir)
+
+
+def _evict_least_recently_used(cache_dir: Path) -> None:
+    try:
+        with os.scandir(cache_dir) as entries:
+            cached_entries = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in entries
+                if entry.name.endswith(FORMAT_CACHE_SUFFIX)
+            ]
+    except OSError:
+        return
+
+    if len(cached_entries) <= FORMAT_CACHE_MAX_ENTRIES:
+        return
+
+    cached_entries.sort()
+    for _, entry_path in cached_entries[: len(cached_entries) - FORMAT_CACHE_MAX_ENTRIES]:
+        Path(entry_path).unlink(missing_ok=True)
@@ -0,0 +1,394 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tomllib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+import typer
+
+from fastgear_cli.core.format_cache import (
+    build_format_cache_key,
+    load_formatted_source,
+    store_formatted_source,
+)
+from fastgear_cli.core.journal import FileJournal
+from fastgear_cli.core.transaction import get_read_path
+from fastgear_cli.core.utils.file_write_utils import write_text_if_changed
+from fastgear_cli.core.utils.import_block_utils import FIRST_PARTY_MODULES
+
+RUFF_COMMAND = (sys.executable, "-m", "ruff")
+RUFF_CONFIG_FILE_NAMES = (".ruff.toml", "ruff.toml", "pyproject.toml")
+DEFAULT_RUFF_SRC = (".", "src")
+DEFAULT_RUFF_LINE_LENGTH = 88
+PYTHON_SOURCE_SUFFIXES = (".py", ".pyi")
+
+
+class FormattingQueue(FileJournal):
+    def __init__(self, *, format_files: bool = True) -> None:
+        super().__init__()
+        self.format_files = format_files
+        self.written_files: list[Path] = []
+        self.created_files: list[Path] = []
+        self.unchanged_files: list[Path] = []
+
+    def flush(self) -> None:
+        pending = self.drain()
+
+        formatted = _format_pending_files(pending) if self.format_files else pending
+        for file_path, content in formatted.items():
+            is_new = not get_read_path(file_path).exists()
+            if content != self.get_loaded(file_path) and write_text_if_changed(file_path, content):
+                self.written_files.append(file_path)
+                if is_new:
+                    self.created_files.append(file_path)
+            else:
+                self.unchanged_files.append(file_path)
+            self._loaded[file_path] = content
+
+
+_active_queue: ContextVar[FormattingQueue | None] = ContextVar(
+    "fastgear_formatting_queue",
+    default=None,
+)
+
+
+@contextmanager
+def formatting_batch(*, format_files: bool = True) -> Iterator[FormattingQueue]:
+    active_queue = _active_queue.get()
+    if active_queue is not None:
+        yield active_queue
+        return
+
+    queue = FormattingQueue(format_files=format_files)
+    token = _active_queue.set(queue)
+    try:
+        yield queue
+    except BaseException:
+        _active_queue.reset(token)
+        queue.drain()
+        raise
+
+    _active_queue.reset(token)
+    queue.flush()
+
+
+def read_python_file(file_path: Path) -> str | None:
+    active_queue = _active_queue.get()
+    if active_queue is not None:
+        return active_queue.read(file_path)
+
+    try:
+        return get_read_path(file_path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def write_python_file(file_path: Path, content: str, project_dir: Path) -> None:
+    active_queue = _active_queue.get()
+    if active_queue is not None:
+        active_queue.write(file_path, content)
+        return
+
+    write_text_if_changed(file_path, format_python_source(content, file_path, project_dir))
+
+
+def format_python_source(content: str, file_path: Path, project_dir: Path) -> str:
+    cwd = project_dir.resolve()
+    resolved_path = file_path.resolve()
+    stdin_arguments = ["--stdin-filename", str(resolved_path), "-"]
+    config_path = _find_ruff_config(resolved_path.parent, {})
+    cache_key = build_format_cache_key(
+        content,
+        _get_file_key(resolved_path, config_path),
+        get_ruff_config_chain(config_path),
+        _get_first_party_modules(config_path),
+    )
+    cached_content = load_formatted_source(cache_key) if cache_key is not None else None
+    if cached_content is not None:
+        return cached_content
+
+    try:
+        checked_content = _run_ruff(["check", "--fix", *stdin_arguments], cwd, stdin=content)
+    except FileNotFoundError:
+        _report_missing_ruff()
+        return content
+    except subprocess.CalledProcessError as error:
+        _report_ruff_error([file_path], error)
+        return error.stdout or content
+
+    try:
+        formatted_content = _run_ruff(["format", *stdin_arguments], cwd, stdin=checked_content)
+    except subprocess.CalledProcessError as error:
+        _report_ruff_error([file_path], error)
+        return checked_content
+
+    if cache_key is not None:
+        store_formatted_source(cache_key, formatted_content)
+    return formatted_content
+
+
+def get_ruff_line_length(file_path: Path) -> int:
+    config_path = _find_ruff_config(file_path.resolve().parent, {})
+    line_length, _ = _get_ruff_option(config_path, ("line-length",), DEFAULT_RUFF_LINE_LENGTH)
+    return line_length
+
+
+def get_ruff_first_party_modules(file_path: Path) -> frozenset[str]:
+    return _get_first_party_modules(_find_ruff_config(file_path.resolve().parent, {}))
+
+
+def get_ruff_config_chain(config_path: Path | None) -> list[Path]:
+    chain: list[Path] = []
+    while config_path is not None and config_path not in chain:
+        chain.append(config_path)
+        extend = (_read_ruff_settings(config_path) or {}).get("extend")
+        if not isinstance(extend, str):
+            break
+        extend_path = Path(os.path.expandvars(extend)).expanduser()
+        config_path = (config_path.parent / extend_path).resolve()
+    return chain
+
+
+def _format_pending_files(pending: dict[Path, str]) -> dict[Path, str]:
+    files_by_config: dict[Path | None, dict[Path, str]] = {}
+    config_by_dir: dict[Path, Path | None] = {}
+    for file_path, content in pending.items():
+        config_path = _find_ruff_config(file_path.parent, config_by_dir)
+        files_by_config.setdefault(config_path, {})[file_path] = content
+
+    formatted: dict[Path, str] = {}
+    for config_path, files in files_by_config.items():
+        formatted.update(_format_in_staging(files, config_path))
+
+    return formatted
+
+
+def _format_in_staging(files: dict[Path, str], config_path: Path | None) -> dict[Path, str]:
+    config_arguments: list[str] = []
+    if config_path is not None:
+        config_arguments = [
+            "--config",
+            str(config_path),
+            "--config",
+            _build_src_override(config_path),
+        ]
+
+    config_chain = get_ruff_config_chain(config_path)
+    first_party_modules = _get_first_party_modules(config_path)
+    formatted: dict[Path, str] = {}
+    uncached_files: dict[Path, tuple[str, str | None]] = {}
+    for file_path, content in files.items():
+        cache_key = build_format_cache_key(
+            content,
+            _get_file_key(file_path, config_path),
+            config_chain,
+            first_party_modules,
+        )
+        cached_content = load_formatted_source(cache_key) if cache_key is not None else None
+        if cached_content is not None:
+            formatted[file_path] = cached_content
+        else:
+            uncached_files[file_path] = (content, cache_key)
+
+    if not uncached_files:
+        return formatted
+
+    with tempfile.TemporaryDirectory(prefix="fastgear-format-") as staging_dir:
+        staging_root = Path(staging_dir)
+        staged_files: dict[Path, Path] = {}
+
+        for index, (file_path, (content, _)) in enumerate(uncached_files.items()):
+            relative_path = (
+                file_path.relative_to(config_path.parent)
+                if config_path is not None
+                else Path(f"staged_{index}", file_path.name)
+            )
+            staged_path = staging_root / relative_path
+            staged_path.parent.mkdir(parents=True, exist_ok=True)
+            staged_path.write_text(content, encoding="utf-8")
+            staged_files[staged_path] = file_path
+
+        formatted_paths = _format_staged_files(list(staged_files), staging_root, config_arguments)
+
+        for staged_path, file_path in staged_files.items():
+            formatted[file_path] = staged_path.read_text(encoding="utf-8")
+            cache_key = uncached_files[file_path][1]
+            if staged_path in formatted_paths and cache_key is not None:
+                store_formatted_source(cache_key, formatted[file_path])
+
+        return formatted
+
+
+def _format_staged_files(
+    file_paths: list[Path],
+    cwd: Path,
+    config_arguments: list[str],
+) -> set[Path]:
+    try:
+        failed_files = _run_ruff_check(file_paths, cwd, config_arguments)
+        formattable_files = [path for path in file_paths if path not in failed_files]
+        if formattable_files:
+            _run_ruff(["format", *config_arguments, *map(str, formattable_files)], cwd)
+    except FileNotFoundError:
+        _report_missing_ruff()
+    except subprocess.CalledProcessError as error:
+        _report_ruff_error(file_paths, error)
+    else:
+        return set(formattable_files)
+
+    return set()
+
+
+def _run_ruff_check(file_paths: list[Path], cwd: Path, config_arguments: list[str]) -> set[Path]:
+    check_arguments = ["check", "--fix", *config_arguments]
+    try:
+        _run_ruff([*check_arguments, *map(str, file_paths)], cwd)
+    except subprocess.CalledProcessError as error:
+        if len(file_paths) == 1:
+            _report_ruff_error(file_paths, error)
+            return set(file_paths)
+    else:
+        return set()
+
+    failed_files: set[Path] = set()
+    for file_path in file_paths:
+        try:
+            _run_ruff([*check_arguments, str(file_path)], cwd)
+        except subprocess.CalledProcessError as error:
+            _report_ruff_error([file_path], error)
+            failed_files.add(file_path)
+
+    return failed_files
+
+
+def _run_ruff(arguments: list[str], cwd: Path, *, stdin: str | None = None) -> str:
+    result = subprocess.run(
+        [*RUFF_COMMAND, *arguments],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        input=stdin,
+    )
+    return result.stdout
+
+
+def _find_ruff_config(directory: Path, config_by_dir: dict[Path, Path | None]) -> Path | None:
+    if directory in config_by_dir:
+        return config_by_dir[directory]
+
+    config_path = None
+    for file_name in RUFF_CONFIG_FILE_NAMES:
+        candidate = directory / file_name
+        if candidate.is_file() and (
+            file_name != "pyproject.toml" or _read_ruff_settings(candidate) is not None
+        ):
+            config_path = candidate
+            break
+    else:
+        if directory.parent != directory:
+            config_path = _find_ruff_config(directory.parent, config_by_dir)
+
+    config_by_dir[directory] = config_path
+    return config_path
+
+
+def _read_ruff_settings(config_path: Path) -> dict | None:
+    try:
+        data = tomllib.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+
+    if config_path.name == "pyproject.toml":
+        return data.get("tool", {}).get("ruff")
+    return data
+
+
+def _get_file_key(file_path: Path, config_path: Path | None) -> str:
+    if config_path is None:
+        return file_path.as_posix()
+    return file_path.relative_to(config_path.parent).as_posix()
+
+
+def _list_top_level_modules(directory: Path) -> set[str]:
+    try:
+        children = list(directory.iterdir())
+    except OSError:
+        return set()
+
+    module_names = set()
+    for child in children:
+        if child.is_dir():
+            module_name = child.name
+        elif child.suffix in PYTHON_SOURCE_SUFFIXES:
+            module_name = child.stem
+        else:
+            continue
+        if module_name.isidentifier():
+            module_names.add(module_name)
+    return module_names
+
+
+def _get_ruff_option(
+    config_path: Path | None,
+    keys: tuple[str, ...],
+    default: object,
+) -> tuple[object, Path | None]:
+    for chain_path in get_ruff_config_chain(config_path):
+        value = _read_ruff_settings(chain_path)
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            return value, chain_path.parent
+    return default, config_path.parent if config_path is not None else None
+
+
+def _get_src_dirs(config_path: Path) -> list[Path]:
+    src_dirs, root = _get_ruff_option(config_path, ("src",), DEFAULT_RUFF_SRC)
+    return [(root / src_dir).resolve() for src_dir in src_dirs]
+
+
+def _get_isort_option(config_path: Path, key: str) -> list[str]:
+    value, _ = _get_ruff_option(config_path, ("lint", "isort", key), None)
+    if value is None:
+        value, _ = _get_ruff_option(config_path, ("isort", key), [])
+    return value
+
+
+def _get_first_party_modules(config_path: Path | None) -> frozenset[str]:
+    if config_path is None:
+        return FIRST_PARTY_MODULES
+
+    src_modules = {
+        module_name
+        for src_dir in _get_src_dirs(config_path)
+        for module_name in _list_top_level_modules(src_dir)
+    }
+    return frozenset(_get_isort_option(config_path, "known-first-party")) | (
+        src_modules - set(_get_isort_option(config_path, "known-third-party"))
+    )
+
+
+def _build_src_override(config_path: Path) -> str:
+    resolved_dirs = [src_dir.as_posix() for src_dir in _get_src_dirs(config_path)]
+    return f"src = {json.dumps(resolved_dirs)}"
+
+
+def _report_missing_ruff() -> None:
+    typer.secho(
+        "ruff not found in the current CLI environment.",
+        fg=typer.colors.YELLOW,
+    )
+
+
+def _report_ruff_error(file_paths: list[Path], error: subprocess.CalledProcessError) -> None:
+    file_names = ", ".join(f"'{file_path.name}'" for file_path in file_paths)
+    typer.secho(
+        f"Failed to apply ruff rules to {file_names}: {(error.stderr or '').strip()}",
+        fg=typer.colors.YELLOW,
+    )
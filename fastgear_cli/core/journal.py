@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from fastgear_cli.core.transaction import get_read_path
+
+
+class FileJournal:
+    def __init__(self) -> None:
+        self._loaded: dict[Path, str] = {}
+        self._pending: dict[Path, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, file_path: Path) -> bool:
+        return file_path.resolve() in self._pending
+
+    def read(self, file_path: Path) -> str | None:
+        resolved_path = file_path.resolve()
+        if resolved_path in self._pending:
+            return self._pending[resolved_path]
+        if resolved_path in self._loaded:
+            return self._loaded[resolved_path]
+
+        try:
+            content = get_read_path(file_path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        self._loaded[resolved_path] = content
+        return content
+
+    def write(self, file_path: Path, content: str) -> None:
+        self._pending[file_path.resolve()] = content
+
+    def get_loaded(self, file_path: Path) -> str | None:
+        return self._loaded.get(file_path.resolve())
+
+    def drain(self) -> dict[Path, str]:
+        pending, self._pending = self._pending, {}
+        return pending
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import re
+import time
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastgear_cli.configs.settings import get_cache_dir
+
+LOCK_FILE_NAME = "uv.lock"
+LOCK_SNAPSHOT_DIR_NAME = "uv-lock"
+LOCK_SNAPSHOT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+PROJECT_NAME_PLACEHOLDER = "fastgear-project-placeholder"
+
+
+@dataclass(frozen=True, slots=True)
+class LockSnapshot:
+    key: str
+    project_name: str
+
+    @classmethod
+    def from_pyproject(cls, pyproject_path: Path) -> "LockSnapshot | None":
+        try:
+            data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+            project_name = data["project"]["name"]
+        except (OSError, tomllib.TOMLDecodeError, KeyError):
+            return None
+
+        project = data.get("project", {})
+        lock_inputs = {
+            "version": project.get("version"),
+            "dynamic": project.get("dynamic", []),
+            "requires-python": project.get("requires-python"),
+            "dependencies": project.get("dependencies", []),
+            "optional-dependencies": project.get("optional-dependencies", {}),
+            "dependency-groups": data.get("dependency-groups", {}),
+            "build-system": data.get("build-system", {}),
+            "tool.uv": data.get("tool", {}).get("uv", {}),
+        }
+        key = hashlib.sha256(json.dumps(lock_inputs, sort_keys=True).encode()).hexdigest()
+        return cls(key=key, project_name=_normalize_project_name(project_name))
+
+    @property
+    def path(self) -> Path:
+        return get_cache_dir() / LOCK_SNAPSHOT_DIR_NAME / f"{self.key}.lock"
+
+    def is_fresh(self) -> bool:
+        try:
+            age = time.time() - self.path.stat().st_mtime
+        except OSError:
+            return False
+        return age <= LOCK_SNAPSHOT_MAX_AGE_SECONDS
+
+    def restore(self, project_dir: Path, *, allow_stale: bool = False) -> bool:
+        if not allow_stale and not self.is_fresh():
+            return False
+
+        try:
+            content = self.path.read_text(encoding="utf-8")
+            (project_dir / LOCK_FILE_NAME).write_text(
+                _replace_project_name(content, PROJECT_NAME_PLACEHOLDER, self.project_name),
+                encoding="utf-8",
+            )
+        except OSError:
+            return False
+        return True
+
+    def save(self, project_dir: Path) -> None:
+        try:
+            content = (project_dir / LOCK_FILE_NAME).read_text(encoding="utf-8")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(
+                _replace_project_name(content, self.project_name, PROJECT_NAME_PLACEHOLDER),
+                encoding="utf-8",
+            )
+            temp_path.replace(self.path)
+        except OSError:
+            return
+
+
+def _normalize_project_name(project_name: str) -> str:
+    return re.sub(r"[-_.]+", "-", project_name).lower()
+
+
+def _replace_project_name(content: str, old_name: str, new_name: str) -> str:
+    return re.sub(
+        rf'^name = "{re.escape(old_name)}"$',
+        f'name = "{new_name}"',
+        content,
+        flags=re.MULTILINE,
+    )
@@ -1,4 +1,5 @@
 from .add_element_config import AddElementConfig
+from .add_spec_config import AddSpecConfig, ModuleSpecConfig
 from .project_init_config import ProjectInitConfig
 
-__all__ = ["ProjectInitConfig", "AddElementConfig"]
+__all__ = ["ProjectInitConfig", "AddElementConfig", "AddSpecConfig", "ModuleSpecConfig"]
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from fastgear_cli.core.constants.enums import ElementTypeEnum
+
+MODULE_SPEC_COMPONENTS = (
+    ElementTypeEnum.CONTROLLER,
+    ElementTypeEnum.SERVICE,
+    ElementTypeEnum.REPOSITORY,
+    ElementTypeEnum.ENTITY,
+)
+
+
+class ModuleSpecConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = Field(..., min_length=1)
+    components: list[ElementTypeEnum] = Field(
+        default_factory=lambda: list(MODULE_SPEC_COMPONENTS),
+        min_length=1,
+    )
+    path: Path | None = Field(default=None)
+    use_folders: bool | None = Field(default=None)
+    entity_path: str | None = Field(default=None)
+    repository_path: str | None = Field(default=None)
+    service_path: str | None = Field(default=None)
+
+    @field_validator("components", mode="before")
+    @classmethod
+    def split_components(cls, v: str | list) -> list:
+        values = v.split(",") if isinstance(v, str) else v
+        if not isinstance(values, list):
+            return values
+        return [value.strip().lower() if isinstance(value, str) else value for value in values]
+
+    @field_validator("components")
+    @classmethod
+    def only_module_components(cls, v: list[ElementTypeEnum]) -> list[ElementTypeEnum]:
+        if ElementTypeEnum.MODULE in v:
+            raise ValueError("Use only: controller, service, repository, entity.")
+        return v
+
+    @property
+    def module_components(self) -> str:
+        return ",".join(component.value for component in self.components)
+
+
+class AddSpecConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    path: Path | None = Field(default=None)
+    use_folders: bool = Field(default=True)
+    modules: list[ModuleSpecConfig] = Field(..., min_length=1)
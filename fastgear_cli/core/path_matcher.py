@@ -0,0 +1,118 @@
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+@dataclass(slots=True)
+class _DirRuleNode:
+    include: bool | None = None
+    children: dict[str, "_DirRuleNode"] = field(default_factory=dict)
+
+
+class ConditionalPathMatcher:
+    def __init__(self, conditional_files: dict, conditional_dirs: dict) -> None:
+        self._file_rules: dict[str, bool] = {}
+        self._file_patterns: list[tuple[re.Pattern, bool]] = []
+        self._dir_rules = _DirRuleNode()
+        self._dir_name_rules: dict[str, bool] = {}
+        self._dir_patterns: list[tuple[re.Pattern, bool]] = []
+
+        for key, include in conditional_files.items():
+            if _is_glob(key):
+                self._file_patterns.append((_compile_glob(key), bool(include)))
+            else:
+                self._file_rules[key] = bool(include)
+
+        for key, include in conditional_dirs.items():
+            if _is_glob(key):
+                self._dir_patterns.append((_compile_glob(key), bool(include)))
+                continue
+
+            node = self._dir_rules
+            for part in key.split("/"):
+                node = node.children.setdefault(part, _DirRuleNode())
+            node.include = bool(include)
+            if "/" not in key:
+                self._dir_name_rules[key] = bool(include)
+
+    def includes_dir(self, rel_dir: str) -> bool:
+        return self._includes_dir_parts(rel_dir.split("/")[1:])
+
+    def includes_file(self, rel_path: str) -> bool:
+        parts = rel_path.split("/")
+        file_path = rel_path if len(parts) <= 1 else "/".join(parts[1:])
+
+        include = self._file_rules.get(file_path)
+        if include is None:
+            include = _match_patterns(self._file_patterns, file_path)
+        return include is not False
+
+    def _includes_dir_parts(self, dir_parts: Sequence[str]) -> bool:
+        node: _DirRuleNode | None = self._dir_rules
+        partial_path = ""
+        for part in dir_parts:
+            node = node.children.get(part) if node is not None else None
+            include = node.include if node is not None else None
+
+            if self._dir_patterns:
+                partial_path = f"{partial_path}/{part}" if partial_path else part
+                if include is None:
+                    include = _match_patterns(self._dir_patterns, partial_path)
+
+            if include is None:
+                include = self._dir_name_rules.get(part)
+            if include is False:
+                return False
+
+        return True
+
+
+def _is_glob(key: str) -> bool:
+    return not GLOB_CHARACTERS.isdisjoint(key)
+
+
+def _match_patterns(patterns: list[tuple[re.Pattern, bool]], path: str) -> bool | None:
+    for pattern, include in patterns:
+        if pattern.fullmatch(path):
+            return include
+    return None
+
+
+def _compile_glob(pattern: str) -> re.Pattern:
+    segments = pattern.split("/")
+    regex = ""
+    for index, segment in enumerate(segments):
+        is_last = index == len(segments) - 1
+        if segment == "**":
+            regex += ".*" if is_last else "(?:[^/]+/)*"
+            continue
+
+        regex += _translate_segment(segment)
+        if not is_last:
+            regex += "/"
+
+    return re.compile(regex)
+
+
+def _translate_segment(segment: str) -> str:
+    regex = ""
+    index = 0
+    while index < len(segment):
+        char = segment[index]
+        closing = segment.find("]", index + 2) if char == "[" else -1
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif closing != -1:
+            char_class = segment[index + 1 : closing].replace("\\", "\\\\")
+            if char_class.startswith("!"):
+                char_class = "^" + char_class[1:]
+            regex += f"[{char_class}]"
+            index = closing
+        else:
+            regex += re.escape(char)
+        index += 1
+    return regex
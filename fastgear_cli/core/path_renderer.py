@@ -0,0 +1,60 @@
+from typing import TYPE_CHECKING
+
+from fastgear_cli.core.template_env import get_path_template
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+EXPRESSION_START = "{{"
+EXPRESSION_END = "}}"
+STATEMENT_MARKERS = ("{%", "{#")
+
+
+class PathRenderer:
+    def __init__(self, env: "Environment", context: dict) -> None:
+        self._env = env
+        self._context = context
+        self._rendered_segments: dict[str, str] = {}
+        self._rendered_dirs: dict[str, str] = {"": ""}
+
+    def render(self, rel_path: str) -> str:
+        if not _has_jinja(rel_path):
+            return rel_path
+        if not _renders_per_segment(rel_path):
+            return get_path_template(self._env, rel_path).render(self._context)
+
+        dir_path, _, file_name = rel_path.rpartition("/")
+        return _join(self._render_dir(dir_path), self._render_segment(file_name))
+
+    def _render_dir(self, dir_path: str) -> str:
+        rendered_dir = self._rendered_dirs.get(dir_path)
+        if rendered_dir is None:
+            parent_path, _, dir_name = dir_path.rpartition("/")
+            rendered_dir = _join(self._render_dir(parent_path), self._render_segment(dir_name))
+            self._rendered_dirs[dir_path] = rendered_dir
+        return rendered_dir
+
+    def _render_segment(self, segment: str) -> str:
+        if not _has_jinja(segment):
+            return segment
+
+        rendered_segment = self._rendered_segments.get(segment)
+        if rendered_segment is None:
+            rendered_segment = get_path_template(self._env, segment).render(self._context)
+            self._rendered_segments[segment] = rendered_segment
+        return rendered_segment
+
+
+def _has_jinja(value: str) -> bool:
+    return EXPRESSION_START in value or any(marker in value for marker in STATEMENT_MARKERS)
+
+
+def _renders_per_segment(rel_path: str) -> bool:
+    return not any(marker in rel_path for marker in STATEMENT_MARKERS) and all(
+        segment.count(EXPRESSION_START) == segment.count(EXPRESSION_END)
+        for segment in rel_path.split("/")
+    )
+
+
+def _join(dir_path: str, name: str) -> str:
+    return f"{dir_path}/{name}" if dir_path else name
@@ -1,9 +1,24 @@
-import subprocess
-import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import typer
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
+from fastgear_cli.core.path_matcher import ConditionalPathMatcher
+from fastgear_cli.core.path_renderer import PathRenderer
+from fastgear_cli.core.template_env import get_template_environment
+from fastgear_cli.core.template_manifest import TemplateEntry, get_template_entries
+from fastgear_cli.core.transaction import get_write_path, is_staged
+from fastgear_cli.core.utils.directory_snapshot_utils import DirectorySnapshot
+from fastgear_cli.core.utils.file_copy_utils import copy_static_file
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+RENDER_MAX_WORKERS = 8
+RENDER_STREAM_THRESHOLD = 1024 * 1024
+RENDER_STREAM_BUFFER_SIZE = 64 * 1024
 
 
 def render_template(
@@ -14,121 +29,135 @@ def render_template(
     conditional_dirs: dict,
     *,
     dry_run: bool = False,
+    on_file_written: Callable[[Path], None] | None = None,
+    static_copy_mode: StaticCopyModeEnum = StaticCopyModeEnum.COPY,
+    stream_threshold: int | None = RENDER_STREAM_THRESHOLD,
 ) -> list[Path]:
-    env = Environment(
-        loader=FileSystemLoader(str(template_root)),
-        autoescape=select_autoescape(enabled_extensions=()),
-        keep_trailing_newline=True,
-    )
-
-    rendered_files: list[Path] = []
-
-    for tpl_path in template_root.rglob("*"):
-        rel = tpl_path.relative_to(template_root)
-
-        if (
-            tpl_path.is_dir()
-            or not _should_render_dir(rel, conditional_dirs)
-            or not _should_render_file(rel, conditional_files)
-        ):
-            continue
+    env = get_template_environment(template_root)
+    output_snapshot = DirectorySnapshot(output_root)
 
-        rendered_rel = env.from_string(str(rel)).render(**context)
-        out_path = output_root / rendered_rel
+    matcher = ConditionalPathMatcher(conditional_files, conditional_dirs)
+    path_renderer = PathRenderer(env, context)
 
-        if tpl_path.name.endswith(".j2"):
-            out_path = out_path.with_suffix("")
+    work_list: list[tuple[TemplateEntry, Path]] = []
 
-        if out_path.exists():
+    for entry in get_template_entries(template_root, include_dir=matcher.includes_dir):
+        if not matcher.includes_file(entry.rel_path):
             continue
 
-        rendered_files.append(out_path)
+        rendered_rel = (
+            path_renderer.render(entry.rel_path) if entry.has_jinja_path else entry.rel_path
+        )
+        out_path = output_root / rendered_rel
 
-        if dry_run:
-            continue
+        if entry.is_template:
+            out_path = out_path.with_suffix("")
 
-        out_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_snapshot.exists(out_path) or is_staged(out_path):
+            continue
 
-        if tpl_path.name.endswith(".j2"):
-            template = env.get_template(str(rel))
-            out_path.write_text(template.render(**context), encoding="utf-8")
-        else:
-            out_path.write_bytes(tpl_path.read_bytes())
+        work_list.append((entry, out_path))
+
+    rendered_files = [out_path for _, out_path in work_list]
+
+    if not dry_run:
+        write_paths = [get_write_path(out_path) for out_path in rendered_files]
+        output_snapshot.create_parent_directories(write_paths)
+        run_write_tasks(
+            [
+                partial(
+                    _write_entry,
+                    env,
+                    template_root,
+                    entry,
+                    out_path,
+                    write_path,
+                    context,
+                    static_copy_mode,
+                    stream_threshold,
+                )
+                for (entry, out_path), write_path in zip(work_list, write_paths, strict=True)
+            ],
+            on_file_written,
+        )
 
     return rendered_files
 
 
-def run_ruff_format(file_path: Path, project_dir: Path) -> None:
-    resolved_file_path = file_path.resolve()
-
-    base_command = [sys.executable, "-m", "ruff"]
-    check_command = [*base_command, "check", "--fix", str(resolved_file_path)]
-    format_command = [*base_command, "format", str(resolved_file_path)]
-
-    cwd = project_dir.resolve()
-    try:
-        subprocess.run(
-            check_command,
-            check=True,
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-        )
-        subprocess.run(
-            format_command,
-            check=True,
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-        )
-    except FileNotFoundError:
-        typer.secho(
-            "ruff not found in the current CLI environment.",
-            fg=typer.colors.YELLOW,
-        )
-    except subprocess.CalledProcessError as error:
-        typer.secho(
-            f"Failed to apply ruff rules to '{file_path.name}': {error.stderr.strip()}",
-            fg=typer.colors.YELLOW,
-        )
+def run_write_tasks(
+    tasks: list[Callable[[], Path]],
+    on_file_written: Callable[[Path], None] | None = None,
+) -> None:
+    if len(tasks) <= 1:
+        for task in tasks:
+            _notify_file_written(task(), on_file_written)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(RENDER_MAX_WORKERS, len(tasks)),
+        thread_name_prefix="fastgear-render",
+    ) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        try:
+            for future in as_completed(futures):
+                _notify_file_written(future.result(), on_file_written)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _write_entry(
+    env: "Environment",
+    template_root: Path,
+    entry: TemplateEntry,
+    out_path: Path,
+    write_path: Path,
+    context: dict,
+    static_copy_mode: StaticCopyModeEnum,
+    stream_threshold: int | None,
+) -> Path:
+    if entry.is_template:
+        render_to_file(env.get_template(entry.rel_path), write_path, context, stream_threshold)
+    else:
+        copy_static_file(template_root / entry.rel_path, write_path, static_copy_mode)
 
+    return out_path
 
-def _should_render_dir(rel_path: Path, conditional_dirs: dict) -> bool:
-    parts = rel_path.parts
-    if len(parts) <= 1:
-        return True
 
-    dir_parts = parts[1:-1]
-    if not dir_parts:
-        return True
-
-    for i in range(len(dir_parts)):
-        partial_path = "/".join(dir_parts[: i + 1])
-        single_part = dir_parts[i]
+def render_to_file(
+    template: "Template",
+    out_path: Path,
+    context: dict,
+    stream_threshold: int | None = RENDER_STREAM_THRESHOLD,
+) -> None:
+    chunks = template.generate(**context)
+    buffered_chunks: list[str] = []
+    buffered_size = 0
+    for chunk in chunks:
+        buffered_chunks.append(chunk)
+        buffered_size += len(chunk)
+        if stream_threshold is not None and buffered_size >= stream_threshold:
+            with out_path.open("w", encoding="utf-8", buffering=RENDER_STREAM_BUFFER_SIZE) as file:
+                file.writelines(buffered_chunks)
+                buffered_chunks.clear()
+                file.writelines(chunks)
+            return
+
+    out_path.write_text("".join(buffered_chunks), encoding="utf-8")
+
+
+def _notify_file_written(
+    out_path: Path,
+    on_file_written: Callable[[Path], None] | None,
+) -> None:
+    if on_file_written is not None:
+        on_file_written(out_path)
 
-        if partial_path in conditional_dirs and not conditional_dirs[partial_path]:
-            return False
-        if (
-            single_part in conditional_dirs
-            and partial_path not in conditional_dirs
-            and not conditional_dirs[single_part]
-        ):
-            return False
 
-    return True
+def _should_render_dir(rel_path: Path, conditional_dirs: dict) -> bool:
+    return ConditionalPathMatcher({}, conditional_dirs).includes_dir(rel_path.parent.as_posix())
 
 
 def _should_render_file(rel_path: Path | str, conditional_files: dict) -> bool:
-    rel_path = Path(rel_path)
-    if len(rel_path.parts) <= 1:
-        file_path = rel_path.as_posix()
-        if file_path in conditional_files:
-            return conditional_files[file_path]
-        return True
-
-    file_path = Path(*rel_path.parts[1:]).as_posix()
-
-    if file_path in conditional_files:
-        return conditional_files[file_path]
-
-    return True
+    return ConditionalPathMatcher(conditional_files, {}).includes_file(Path(rel_path).as_posix())
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import shutil
+import tempfile
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from fastgear_cli import __version__
+from fastgear_cli.configs.settings import get_cache_dir
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
+from fastgear_cli.core.path_renderer import PathRenderer
+from fastgear_cli.core.render import RENDER_STREAM_THRESHOLD, render_template, run_write_tasks
+from fastgear_cli.core.template_env import get_template_environment
+from fastgear_cli.core.template_manifest import (
+    get_packaged_template_entries,
+    get_template_entries,
+)
+from fastgear_cli.core.transaction import (
+    detached_from_write_transaction,
+    get_write_path,
+    is_staged,
+)
+from fastgear_cli.core.utils.directory_snapshot_utils import DirectorySnapshot
+from fastgear_cli.core.utils.file_copy_utils import copy_static_file
+
+RENDER_CACHE_DIR_NAME = "rendered"
+RENDER_CACHE_MANIFEST_NAME = "manifest.json"
+RENDER_CACHE_TREE_NAME = "tree"
+VARIANT_CONTEXT_SENTINELS = {
+    "project_name": "__fastgear_project_name__",
+    "project_title": "__fastgear_project_title__",
+}
+
+
+def render_template_cached(
+    template_root: Path,
+    output_root: Path,
+    context: dict,
+    conditional_files: dict,
+    conditional_dirs: dict,
+    *,
+    on_file_written: Callable[[Path], None] | None = None,
+    static_copy_mode: StaticCopyModeEnum = StaticCopyModeEnum.COPY,
+    stream_threshold: int | None = RENDER_STREAM_THRESHOLD,
+) -> list[Path]:
+    entry_dir = get_render_cache_dir() / build_render_cache_key(
+        template_root, context, conditional_files, conditional_dirs
+    )
+    cached_files = _load_cached_tree(entry_dir)
+    if cached_files is None and is_render_cacheable(template_root):
+        cached_files = _store_rendered_tree(
+            entry_dir,
+            template_root,
+            context,
+            conditional_files,
+            conditional_dirs,
+            stream_threshold,
+        )
+
+    if cached_files is None:
+        return render_template(
+            template_root,
+            output_root,
+            context,
+            conditional_files,
+            conditional_dirs,
+            on_file_written=on_file_written,
+            static_copy_mode=static_copy_mode,
+            stream_threshold=stream_threshold,
+        )
+
+    return _copy_cached_tree(
+        entry_dir,
+        template_root,
+        cached_files,
+        output_root,
+        context,
+        on_file_written,
+        static_copy_mode,
+    )
+
+
+def get_render_cache_dir() -> Path:
+    return get_cache_dir() / __version__ / RENDER_CACHE_DIR_NAME
+
+
+def build_render_cache_key(
+    template_root: Path,
+    context: dict,
+    conditional_files: dict,
+    conditional_dirs: dict,
+) -> str:
+    payload = {
+        "version": __version__,
+        "template_root": template_root.as_posix(),
+        "templates": _fingerprint_templates(template_root),
+        "context": {
+            key: value for key, value in context.items() if key not in VARIANT_CONTEXT_SENTINELS
+        },
+        "conditional_files": conditional_files,
+        "conditional_dirs": conditional_dirs,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def is_render_cacheable(template_root: Path) -> bool:
+    from jinja2 import nodes
+
+    env = get_template_environment(template_root)
+    for entry in get_template_entries(template_root):
+        sources = []
+        if entry.has_jinja_path:
+            sources.append(entry.rel_path)
+        if entry.is_template:
+            sources.append((template_root / entry.rel_path).read_text(encoding="utf-8"))
+
+        for source in sources:
+            ast = env.parse(source)
+            plain_outputs = {
+                id(node)
+                for output in ast.find_all(nodes.Output)
+                for node in output.nodes
+                if isinstance(node, nodes.Name)
+            }
+            if any(
+                node.name in VARIANT_CONTEXT_SENTINELS and id(node) not in plain_outputs
+                for node in ast.find_all(nodes.Name)
+            ):
+                return False
+
+    return True
+
+
+def _get_sentinels(context: dict) -> dict[str, str]:
+    return {key: value for key, value in VARIANT_CONTEXT_SENTINELS.items() if key in context}
+
+
+def _fingerprint_templates(template_root: Path) -> list[str] | list[tuple[str, int, int]]:
+    packaged_entries = get_packaged_template_entries(template_root)
+    if packaged_entries is not None:
+        return [entry.rel_path for entry in packaged_entries]
+
+    fingerprint = []
+    for entry in get_template_entries(template_root):
+        stat_result = (template_root / entry.rel_path).stat()
+        fingerprint.append((entry.rel_path, stat_result.st_size, stat_result.st_mtime_ns))
+    return fingerprint
+
+
+def _get_static_sources(template_root: Path, context: dict) -> dict[str, str]:
+    path_renderer = PathRenderer(get_template_environment(template_root), context)
+    return {
+        path_renderer.render(entry.rel_path) if entry.has_jinja_path else entry.rel_path: (
+            entry.rel_path
+        )
+        for entry in get_template_entries(template_root)
+        if not entry.is_template
+    }
+
+
+def _get_cache_copy_mode(static_copy_mode: StaticCopyModeEnum) -> StaticCopyModeEnum:
+    if static_copy_mode == StaticCopyModeEnum.HARDLINK:
+        return StaticCopyModeEnum.COPY
+    return static_copy_mode
+
+
+def _load_cached_tree(entry_dir: Path) -> list[dict] | None:
+    try:
+        cached_files = json.loads(
+            (entry_dir / RENDER_CACHE_MANIFEST_NAME).read_text(encoding="utf-8")
+        )["files"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    tree_dir = entry_dir / RENDER_CACHE_TREE_NAME
+    if not all((tree_dir / cached_file["path"]).is_file() for cached_file in cached_files):
+        return None
+
+    return cached_files
+
+
+def _store_rendered_tree(
+    entry_dir: Path,
+    template_root: Path,
+    context: dict,
+    conditional_files: dict,
+    conditional_dirs: dict,
+    stream_threshold: int | None,
+) -> list[dict] | None:
+    try:
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry_dir.parent))
+    except OSError:
+        return None
+
+    try:
+        tree_dir = staging_dir / RENDER_CACHE_TREE_NAME
+        with detached_from_write_transaction():
+            rendered_files = render_template(
+                template_root,
+                tree_dir,
+                {**context, **_get_sentinels(context)},
+                conditional_files,
+                conditional_dirs,
+                stream_threshold=stream_threshold,
+            )
+        sentinels = [sentinel.encode() for sentinel in _get_sentinels(context).values()]
+        static_sources = _get_static_sources(template_root, {**context, **_get_sentinels(context)})
+        cached_files = [
+            {
+                "path": rendered_file.relative_to(tree_dir).as_posix(),
+                "substitute": any(sentinel in rendered_file.read_bytes() for sentinel in sentinels),
+                "source": static_sources.get(rendered_file.relative_to(tree_dir).as_posix()),
+            }
+            for rendered_file in rendered_files
+        ]
+        (staging_dir / RENDER_CACHE_MANIFEST_NAME).write_text(
+            json.dumps({"files": cached_files}), encoding="utf-8"
+        )
+
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        staging_dir.replace(entry_dir)
+    except OSError:
+        return None
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    return cached_files
+
+
+def _copy_cached_tree(
+    entry_dir: Path,
+    template_root: Path,
+    cached_files: list[dict],
+    output_root: Path,
+    context: dict,
+    on_file_written: Callable[[Path], None] | None,
+    static_copy_mode: StaticCopyModeEnum,
+) -> list[Path]:
+    replacements = [
+        (sentinel, str(context[key])) for key, sentinel in _get_sentinels(context).items()
+    ]
+    tree_dir = entry_dir / RENDER_CACHE_TREE_NAME
+    output_snapshot = DirectorySnapshot(output_root)
+
+    work_list: list[tuple[Path, Path, bool, StaticCopyModeEnum]] = []
+    for cached_file in cached_files:
+        rel_path = cached_file["path"]
+        for sentinel, value in replacements:
+            rel_path = rel_path.replace(sentinel, value)
+
+        out_path = output_root / rel_path
+        if output_snapshot.exists(out_path) or is_staged(out_path):
+            continue
+
+        source = cached_file.get("source")
+        if static_copy_mode == StaticCopyModeEnum.HARDLINK and source is not None:
+            work_list.append((template_root / source, out_path, False, static_copy_mode))
+        else:
+            work_list.append(
+                (
+                    tree_dir / cached_file["path"],
+                    out_path,
+                    cached_file["substitute"],
+                    _get_cache_copy_mode(static_copy_mode),
+                )
+            )
+
+    write_paths = [get_write_path(out_path) for _, out_path, _, _ in work_list]
+    output_snapshot.create_parent_directories(write_paths)
+    run_write_tasks(
+        [
+            partial(
+                _copy_cached_file,
+                cached_path,
+                out_path,
+                write_path,
+                replacements if substitute else [],
+                copy_mode,
+            )
+            for (cached_path, out_path, substitute, copy_mode), write_path in zip(
+                work_list, write_paths, strict=True
+            )
+        ],
+        on_file_written,
+    )
+
+    return [out_path for _, out_path, _, _ in work_list]
+
+
+def _copy_cached_file(
+    cached_path: Path,
+    out_path: Path,
+    write_path: Path,
+    replacements: list[tuple[str, str]],
+    static_copy_mode: StaticCopyModeEnum,
+) -> Path:
+    if replacements:
+        content = cached_path.read_bytes()
+        for sentinel, value in replacements:
+            content = content.replace(sentinel.encode(), value.encode())
+        write_path.write_bytes(content)
+    else:
+        copy_static_file(cached_path, write_path, static_copy_mode)
+
+    return out_path
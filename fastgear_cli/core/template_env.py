@@ -0,0 +1,93 @@
+import os
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastgear_cli import __version__
+from fastgear_cli.configs.settings import TEMPLATES_DIR, get_cache_dir
+from fastgear_cli.core.template_manifest import (
+    TEMPLATE_SUFFIX,
+    find_template_roots,
+    get_compiled_template_archive,
+)
+
+PATH_TEMPLATE_CACHE_SIZE = 1024
+
+if TYPE_CHECKING:
+    from jinja2 import BaseLoader, BytecodeCache, Environment, FileSystemBytecodeCache, Template
+
+
+@cache
+def get_template_environment(template_root: Path) -> "Environment":
+    from jinja2 import ChoiceLoader, FileSystemLoader, ModuleLoader
+    from jinja2 import __version__ as jinja_version
+
+    loader: BaseLoader = FileSystemLoader(str(template_root))
+    compiled_archive = get_compiled_template_archive(template_root, jinja_version)
+    if compiled_archive is not None:
+        loader = ChoiceLoader([ModuleLoader(str(compiled_archive)), loader])
+
+    return _create_environment(loader, bytecode_cache=get_bytecode_cache())
+
+
+def compile_template_archives(
+    output_dir: Path,
+    templates_dir: Path = TEMPLATES_DIR,
+) -> dict[str, Path]:
+    from jinja2 import FileSystemLoader
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    archives: dict[str, Path] = {}
+    for template_root in find_template_roots(templates_dir):
+        root_key = template_root.relative_to(templates_dir).as_posix()
+        archive_path = output_dir / f"{root_key.replace('/', '__')}.zip"
+        _create_environment(FileSystemLoader(str(template_root))).compile_templates(
+            str(archive_path),
+            filter_func=lambda name: name.endswith(TEMPLATE_SUFFIX),
+            zip="deflated",
+            ignore_errors=False,
+        )
+        archives[root_key] = archive_path
+
+    return archives
+
+
+@cache
+def get_bytecode_cache() -> "FileSystemBytecodeCache | None":
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_dir = get_cache_dir() / __version__ / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    if not os.access(cache_dir, os.W_OK):
+        return None
+
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+@lru_cache(maxsize=PATH_TEMPLATE_CACHE_SIZE)
+def get_path_template(env: "Environment", source: str) -> "Template":
+    return env.from_string(source)
+
+
+def _create_environment(
+    loader: "BaseLoader",
+    bytecode_cache: "BytecodeCache | None" = None,
+) -> "Environment":
+    from jinja2 import Environment, select_autoescape
+
+    return Environment(
+        loader=loader,
+        autoescape=select_autoescape(enabled_extensions=()),
+        keep_trailing_newline=True,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+def clear_template_environments() -> None:
+    get_template_environment.cache_clear()
+    get_path_template.cache_clear()
+    get_bytecode_cache.cache_clear()
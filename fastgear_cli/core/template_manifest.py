@@ -0,0 +1,181 @@
+import json
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+
+from fastgear_cli import __version__
+from fastgear_cli.configs.settings import TEMPLATES_DIR
+
+MANIFEST_FILE_NAME = "manifest.json"
+COMPILED_TEMPLATES_DIR_NAME = "compiled"
+TEMPLATE_ROOT_PATTERNS = ("new_project", "add/*/*")
+TEMPLATE_SUFFIX = ".j2"
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateEntry:
+    rel_path: str
+    is_template: bool
+    has_jinja_path: bool
+
+    @classmethod
+    def from_rel_path(cls, rel_path: str) -> "TemplateEntry":
+        return cls(
+            rel_path=rel_path,
+            is_template=rel_path.endswith(TEMPLATE_SUFFIX),
+            has_jinja_path="{{" in rel_path or "{%" in rel_path,
+        )
+
+
+def get_template_entries(
+    template_root: Path,
+    *,
+    include_dir: Callable[[str], bool] | None = None,
+) -> tuple[TemplateEntry, ...]:
+    packaged_entries = get_packaged_template_entries(template_root)
+    if packaged_entries is not None:
+        return _filter_entries_by_dir(packaged_entries, include_dir)
+
+    return scan_template_entries(template_root, include_dir=include_dir)
+
+
+def get_packaged_template_entries(template_root: Path) -> tuple[TemplateEntry, ...] | None:
+    root_key = _get_root_key(template_root)
+    if root_key is None:
+        return None
+    return load_packaged_manifest().get(root_key)
+
+
+def scan_template_entries(
+    template_root: Path,
+    *,
+    include_dir: Callable[[str], bool] | None = None,
+) -> tuple[TemplateEntry, ...]:
+    rel_paths: list[str] = []
+    for dir_path, dir_names, file_names in os.walk(template_root):
+        rel_dir = Path(dir_path).relative_to(template_root).as_posix()
+        dir_names[:] = sorted(
+            dir_name
+            for dir_name in dir_names
+            if include_dir is None
+            or include_dir(dir_name if rel_dir == "." else f"{rel_dir}/{dir_name}")
+        )
+        rel_paths.extend(
+            file_name if rel_dir == "." else f"{rel_dir}/{file_name}"
+            for file_name in sorted(file_names)
+        )
+
+    return tuple(TemplateEntry.from_rel_path(rel_path) for rel_path in rel_paths)
+
+
+def find_template_roots(templates_dir: Path = TEMPLATES_DIR) -> list[Path]:
+    return sorted(
+        {
+            template_root
+            for pattern in TEMPLATE_ROOT_PATTERNS
+            for template_root in templates_dir.glob(pattern)
+            if template_root.is_dir()
+        }
+    )
+
+
+def build_manifest(templates_dir: Path = TEMPLATES_DIR, *, compiled: dict | None = None) -> dict:
+    manifest = {
+        "version": __version__,
+        "templates": {
+            template_root.relative_to(templates_dir).as_posix(): [
+                asdict(entry) for entry in scan_template_entries(template_root)
+            ]
+            for template_root in find_template_roots(templates_dir)
+        },
+    }
+    if compiled is not None:
+        manifest["compiled"] = compiled
+    return manifest
+
+
+def write_manifest(
+    output_path: Path,
+    templates_dir: Path = TEMPLATES_DIR,
+    *,
+    compiled: dict | None = None,
+) -> Path:
+    manifest = build_manifest(templates_dir, compiled=compiled)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return output_path
+
+
+@cache
+def load_raw_packaged_manifest() -> dict:
+    try:
+        raw_manifest = json.loads((TEMPLATES_DIR / MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if raw_manifest.get("version") != __version__:
+        return {}
+
+    return raw_manifest
+
+
+@cache
+def load_packaged_manifest() -> dict[str, tuple[TemplateEntry, ...]]:
+    return {
+        root_key: tuple(
+            TemplateEntry(
+                rel_path=entry["rel_path"],
+                is_template=entry["is_template"],
+                has_jinja_path=entry["has_jinja_path"],
+            )
+            for entry in entries
+        )
+        for root_key, entries in load_raw_packaged_manifest().get("templates", {}).items()
+    }
+
+
+def get_compiled_template_archive(template_root: Path, jinja_version: str) -> Path | None:
+    root_key = _get_root_key(template_root)
+    compiled = load_raw_packaged_manifest().get("compiled", {})
+    if root_key is None or compiled.get("jinja_version") != jinja_version:
+        return None
+
+    archive_name = compiled.get("archives", {}).get(root_key)
+    if archive_name is None:
+        return None
+
+    archive_path = TEMPLATES_DIR / archive_name
+    return archive_path if archive_path.is_file() else None
+
+
+def clear_packaged_manifest() -> None:
+    load_raw_packaged_manifest.cache_clear()
+    load_packaged_manifest.cache_clear()
+
+
+def _filter_entries_by_dir(
+    entries: tuple[TemplateEntry, ...],
+    include_dir: Callable[[str], bool] | None,
+) -> tuple[TemplateEntry, ...]:
+    if include_dir is None:
+        return entries
+
+    included_dirs: dict[str, bool] = {}
+    filtered_entries = []
+    for entry in entries:
+        rel_dir = entry.rel_path.rpartition("/")[0]
+        if rel_dir not in included_dirs:
+            included_dirs[rel_dir] = not rel_dir or include_dir(rel_dir)
+        if included_dirs[rel_dir]:
+            filtered_entries.append(entry)
+
+    return tuple(filtered_entries)
+
+
+def _get_root_key(template_root: Path) -> str | None:
+    try:
+        return template_root.relative_to(TEMPLATES_DIR).as_posix()
+    except ValueError:
+        return None
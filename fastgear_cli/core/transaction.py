@@ -0,0 +1,214 @@
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+STAGING_DIR_PREFIX = ".fastgear-staging-"
+STAGED_TREE_DIR_NAME = "tree"
+STAGED_EXTERNAL_DIR_NAME = "external"
+BACKUP_DIR_NAME = "backup"
+
+
+class WriteTransaction:
+    def __init__(self, root: Path) -> None:
+        self.root = root.resolve()
+        self._staging_dir: Path | None = None
+        self._staged: dict[Path, Path] = {}
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    def __contains__(self, target: Path) -> bool:
+        return target.resolve() in self._staged
+
+    def stage(self, target: Path) -> Path:
+        target = target.resolve()
+        staged_path = self._staged.get(target)
+        if staged_path is not None:
+            return staged_path
+
+        staging_dir = self._get_staging_dir()
+        if target.is_relative_to(self.root):
+            staged_path = staging_dir / STAGED_TREE_DIR_NAME / target.relative_to(self.root)
+        else:
+            staged_path = (
+                staging_dir / STAGED_EXTERNAL_DIR_NAME / str(len(self._staged)) / target.name
+            )
+        self._staged[target] = staged_path
+        return staged_path
+
+    def get_staged_path(self, target: Path) -> Path | None:
+        return self._staged.get(target.resolve())
+
+    def read_staged_files(self) -> dict[Path, bytes]:
+        return {
+            target: staged_path.read_bytes()
+            for target, staged_path in self._staged.items()
+            if staged_path.is_file()
+        }
+
+    def commit(self) -> None:
+        replaced: list[tuple[Path, Path]] = []
+        created_files: list[Path] = []
+        created_dirs: list[Path] = []
+        try:
+            for index, (target, staged_path) in enumerate(self._staged.items()):
+                if not staged_path.exists():
+                    continue
+
+                created_dirs.extend(_create_missing_dirs(target.parent))
+                if target.exists():
+                    backup_path = self._get_staging_dir() / BACKUP_DIR_NAME / str(index)
+                    backup_path.parent.mkdir(parents=True, exist_ok=True)
+                    _link_or_copy(target, backup_path)
+                    _move(staged_path, target)
+                    replaced.append((target, backup_path))
+                else:
+                    _move(staged_path, target)
+                    created_files.append(target)
+        except BaseException:
+            _restore(replaced, created_files, created_dirs)
+            raise
+        finally:
+            self.discard()
+
+    def discard(self) -> None:
+        if self._staging_dir is not None:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+            self._staging_dir = None
+        self._staged.clear()
+
+    def _get_staging_dir(self) -> Path:
+        if self._staging_dir is None:
+            self._staging_dir = _create_staging_dir(self.root)
+        return self._staging_dir
+
+
+_active_transaction: ContextVar[WriteTransaction | None] = ContextVar(
+    "fastgear_write_transaction",
+    default=None,
+)
+
+
+@contextmanager
+def write_transaction(root: Path) -> Iterator[WriteTransaction]:
+    active_transaction = _active_transaction.get()
+    if active_transaction is not None:
+        yield active_transaction
+        return
+
+    transaction = WriteTransaction(root)
+    token = _active_transaction.set(transaction)
+    try:
+        yield transaction
+    except BaseException:
+        _active_transaction.reset(token)
+        transaction.discard()
+        raise
+
+    _active_transaction.reset(token)
+    transaction.commit()
+
+
+@contextmanager
+def captured_write_transaction(root: Path) -> Iterator[WriteTransaction]:
+    transaction = WriteTransaction(root)
+    token = _active_transaction.set(transaction)
+    try:
+        yield transaction
+    finally:
+        _active_transaction.reset(token)
+        transaction.discard()
+
+
+@contextmanager
+def detached_from_write_transaction() -> Iterator[None]:
+    token = _active_transaction.set(None)
+    try:
+        yield
+    finally:
+        _active_transaction.reset(token)
+
+
+def get_write_path(target: Path) -> Path:
+    active_transaction = _active_transaction.get()
+    if active_transaction is None:
+        return target
+    return active_transaction.stage(target)
+
+
+def get_read_path(target: Path) -> Path:
+    active_transaction = _active_transaction.get()
+    if active_transaction is None:
+        return target
+    return active_transaction.get_staged_path(target) or target
+
+
+def is_staged(target: Path) -> bool:
+    active_transaction = _active_transaction.get()
+    return active_transaction is not None and target in active_transaction
+
+
+def _create_staging_dir(root: Path) -> Path:
+    existing_root = root
+    while not existing_root.is_dir() and existing_root.parent != existing_root:
+        existing_root = existing_root.parent
+
+    device = _get_device(existing_root)
+    for candidate in (Path(tempfile.gettempdir()), existing_root.parent):
+        try:
+            if _get_device(candidate) == device:
+                return Path(tempfile.mkdtemp(prefix=STAGING_DIR_PREFIX, dir=candidate))
+        except OSError:
+            continue
+
+    return Path(tempfile.mkdtemp(prefix=STAGING_DIR_PREFIX, dir=existing_root))
+
+
+def _get_device(path: Path) -> int:
+    return path.stat().st_dev
+
+
+def _create_missing_dirs(directory: Path) -> list[Path]:
+    missing_dirs: list[Path] = []
+    while not directory.is_dir():
+        missing_dirs.append(directory)
+        directory = directory.parent
+
+    created_dirs: list[Path] = []
+    for missing_dir in reversed(missing_dirs):
+        missing_dir.mkdir()
+        created_dirs.append(missing_dir)
+    return created_dirs
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    try:
+        destination.hardlink_to(source)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _move(source: Path, destination: Path) -> None:
+    try:
+        source.replace(destination)
+    except OSError:
+        shutil.move(source, destination)
+
+
+def _restore(
+    replaced: list[tuple[Path, Path]],
+    created_files: list[Path],
+    created_dirs: list[Path],
+) -> None:
+    for target, backup_path in reversed(replaced):
+        _move(backup_path, target)
+    for created_file in reversed(created_files):
+        created_file.unlink(missing_ok=True)
+    for created_dir in reversed(created_dirs):
+        try:
+            created_dir.rmdir()
+        except OSError:
+            continue
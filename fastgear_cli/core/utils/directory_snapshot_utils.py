@@ -0,0 +1,49 @@
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+
+class DirectorySnapshot:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._listings: dict[Path, dict[str, bool] | None] = {}
+        self._outside_dirs: dict[Path, bool] = {}
+
+    def exists(self, path: Path) -> bool:
+        listing = self._get_listing(path.parent)
+        return listing is not None and path.name in listing
+
+    def is_dir(self, path: Path) -> bool:
+        if path == self.root or not path.is_relative_to(self.root):
+            if path not in self._outside_dirs:
+                self._outside_dirs[path] = path.is_dir()
+            return self._outside_dirs[path]
+
+        listing = self._get_listing(path.parent)
+        return listing is not None and listing.get(path.name, False)
+
+    def create_parent_directories(self, file_paths: Iterable[Path]) -> None:
+        missing_dirs: set[Path] = set()
+        for file_path in file_paths:
+            directory = file_path.parent
+            while directory not in missing_dirs and not self.is_dir(directory):
+                missing_dirs.add(directory)
+                directory = directory.parent
+
+        for directory in sorted(missing_dirs, key=lambda path: len(path.parts)):
+            directory.mkdir(exist_ok=True)
+
+    def _get_listing(self, directory: Path) -> dict[str, bool] | None:
+        if directory not in self._listings:
+            self._listings[directory] = (
+                _scan_directory(directory) if self.is_dir(directory) else None
+            )
+        return self._listings[directory]
+
+
+def _scan_directory(directory: Path) -> dict[str, bool] | None:
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return None
@@ -0,0 +1,45 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
+
+FICLONE = 0x40049409
+
+
+def copy_static_file(
+    source: Path,
+    destination: Path,
+    mode: StaticCopyModeEnum = StaticCopyModeEnum.COPY,
+) -> None:
+    if mode == StaticCopyModeEnum.HARDLINK and _hardlink_file(source, destination):
+        return
+    if mode == StaticCopyModeEnum.REFLINK and _reflink_file(source, destination):
+        return
+
+    shutil.copyfile(source, destination)
+
+
+def _hardlink_file(source: Path, destination: Path) -> bool:
+    try:
+        os.link(source, destination)
+    except OSError:
+        return False
+    return True
+
+
+def _reflink_file(source: Path, destination: Path) -> bool:
+    if sys.platform != "linux":
+        return False
+
+    import fcntl
+
+    try:
+        with source.open("rb") as source_file, destination.open("wb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+
+    return True
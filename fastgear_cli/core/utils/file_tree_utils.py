@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import typer
@@ -12,6 +13,28 @@ class FileTreeUtils:
         FileTreeUtils.print_file_tree(files, base_dir)
         typer.secho(f"\nTotal: {len(files)} file(s)", fg=typer.colors.CYAN)
 
+    @staticmethod
+    def display_write_report(
+        created_files: list[Path],
+        updated_files: list[Path],
+        unchanged_files: list[Path],
+        base_dir: Path,
+    ) -> None:
+        report_files = [*created_files, *updated_files, *unchanged_files]
+        if not report_files:
+            return
+
+        report_dir = Path(os.path.commonpath([base_dir.resolve(), *report_files]))
+        if created_files:
+            typer.secho("\nCreated files:", fg=typer.colors.CYAN)
+            FileTreeUtils.print_file_tree(created_files, report_dir)
+        if updated_files:
+            typer.secho("\nUpdated files:", fg=typer.colors.CYAN)
+            FileTreeUtils.print_file_tree(updated_files, report_dir)
+        if unchanged_files:
+            typer.secho("\nUnchanged files (write skipped):", fg=typer.colors.CYAN)
+            FileTreeUtils.print_file_tree(unchanged_files, report_dir)
+
     @staticmethod
     def print_file_tree(files: list[Path], base_dir: Path) -> None:
         tree = FileTreeUtils._build_tree(files, base_dir)
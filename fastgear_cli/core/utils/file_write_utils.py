@@ -0,0 +1,19 @@
+import os
+from pathlib import Path
+
+from fastgear_cli.core.transaction import get_read_path, get_write_path
+
+
+def write_text_if_changed(file_path: Path, content: str) -> bool:
+    data = content.replace("\n", os.linesep).encode("utf-8")
+    current_path = get_read_path(file_path)
+    try:
+        if current_path.stat().st_size == len(data) and current_path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    write_path = get_write_path(file_path)
+    write_path.parent.mkdir(parents=True, exist_ok=True)
+    write_path.write_bytes(data)
+    return True
@@ -0,0 +1,297 @@
+import ast
+import re
+import sys
+from dataclasses import dataclass
+
+DEFAULT_LINE_LENGTH = 88
+FIRST_PARTY_MODULES = frozenset({"src"})
+INDENT = "    "
+
+
+@dataclass(frozen=True, slots=True)
+class ImportStatement:
+    module: str
+    level: int
+    names: tuple[str, ...]
+    is_from: bool
+    exploded: bool = False
+
+    @classmethod
+    def from_node(cls, node: ast.Import | ast.ImportFrom, source: str) -> list["ImportStatement"]:
+        if isinstance(node, ast.Import):
+            return [
+                cls(module=_format_alias(alias), level=0, names=(), is_from=False)
+                for alias in node.names
+            ]
+
+        segment = ast.get_source_segment(source, node) or ""
+        return [
+            cls(
+                module=node.module or "",
+                level=node.level,
+                names=tuple(_format_alias(alias) for alias in node.names),
+                is_from=True,
+                exploded="\n" in segment,
+            )
+        ]
+
+    def get_section(self, first_party_modules: frozenset[str]) -> int:
+        top_level = self.module.split(".")[0]
+        if self.level:
+            return 4
+        if top_level == "__future__":
+            return 0
+        if top_level in sys.stdlib_module_names:
+            return 1
+        if top_level in first_party_modules:
+            return 3
+        return 2
+
+    def render(self, line_length: int) -> str:
+        if not self.is_from:
+            return f"import {self.module}"
+
+        prefix = f"from {'.' * self.level}{self.module} import "
+        single_line = f"{prefix}{', '.join(self.names)}"
+        if not self.exploded and len(single_line) <= line_length:
+            return single_line
+        members = "".join(f"{INDENT}{name},\n" for name in self.names)
+        return f"{prefix}(\n{members})"
+
+
+@dataclass(slots=True)
+class ImportBlock:
+    start: int
+    end: int
+    statements: list[ImportStatement]
+    has_comments: bool
+    shares_lines: bool
+    next_node: ast.stmt | None
+
+
+def find_import_block(module: ast.Module, content: str) -> ImportBlock:
+    lines = content.splitlines()
+    body = module.body
+    start_index = 1 if body and _is_docstring(body[0]) else 0
+    end_index = start_index
+    while end_index < len(body) and isinstance(body[end_index], ast.Import | ast.ImportFrom):
+        end_index += 1
+
+    import_nodes = body[start_index:end_index]
+    next_node = body[end_index] if end_index < len(body) else None
+    if import_nodes:
+        block_start = import_nodes[0].lineno - 1
+        block_end = import_nodes[-1].end_lineno
+    else:
+        block_start = body[start_index - 1].end_lineno if start_index else 0
+        block_end = block_start
+
+    return ImportBlock(
+        start=block_start,
+        end=block_end,
+        statements=[
+            statement
+            for node in import_nodes
+            for statement in ImportStatement.from_node(node, content)
+        ],
+        has_comments=any("#" in line for line in lines[block_start:block_end]),
+        shares_lines=bool(import_nodes)
+        and (
+            import_nodes[0].col_offset != 0
+            or (next_node is not None and next_node.lineno == block_end)
+        ),
+        next_node=next_node,
+    )
+
+
+def get_module_imports(module: ast.Module, content: str) -> list[ImportStatement]:
+    return [
+        statement
+        for node in module.body
+        if isinstance(node, ast.Import | ast.ImportFrom)
+        for statement in ImportStatement.from_node(node, content)
+    ]
+
+
+def parse_import_line(import_line: str) -> list[ImportStatement] | None:
+    try:
+        nodes = ast.parse(import_line).body
+    except SyntaxError:
+        return None
+
+    if len(nodes) != 1 or not isinstance(nodes[0], ast.Import | ast.ImportFrom):
+        return None
+    return ImportStatement.from_node(nodes[0], import_line)
+
+
+def get_imported_names(statements: list[ImportStatement]) -> set[tuple[str, int, str]]:
+    return {
+        (statement.module, statement.level, name)
+        for statement in statements
+        for name in (statement.names or ("",))
+    }
+
+
+def merge_import_line(
+    content: str,
+    import_line: str,
+    *,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
+) -> str | None:
+    try:
+        module = ast.parse(content)
+    except SyntaxError:
+        return None
+
+    new_statements = parse_import_line(import_line)
+    block = find_import_block(module, content)
+    if new_statements is None:
+        return None
+
+    if get_imported_names(new_statements) <= get_imported_names(
+        get_module_imports(module, content)
+    ):
+        return content
+    if block.has_comments or block.shares_lines:
+        return append_import_statements(
+            content.splitlines(),
+            block,
+            new_statements,
+            line_length,
+            first_party_modules=first_party_modules,
+        )
+    return replace_import_block(
+        content.splitlines(),
+        block,
+        [*block.statements, *new_statements],
+        line_length,
+        first_party_modules=first_party_modules,
+    )
+
+
+def replace_import_block(
+    lines: list[str],
+    block: ImportBlock,
+    statements: list[ImportStatement],
+    line_length: int,
+    *,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
+) -> str:
+    head = lines[: block.start]
+    while head and not head[-1].strip():
+        head.pop()
+    tail = lines[block.end :]
+    while tail and not tail[0].strip():
+        tail.pop(0)
+
+    blank_lines_after = (
+        2
+        if isinstance(block.next_node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef)
+        else 1
+    )
+
+    parts = []
+    if head:
+        parts.append("\n".join(head) + "\n\n")
+    parts.append(render_import_block(statements, line_length, first_party_modules))
+    if tail:
+        parts.append("\n" * blank_lines_after + "\n".join(tail).rstrip() + "\n")
+    return "".join(parts)
+
+
+def append_import_statements(
+    lines: list[str],
+    block: ImportBlock,
+    statements: list[ImportStatement],
+    line_length: int,
+    *,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
+) -> str:
+    rendered = render_import_block(statements, line_length, first_party_modules).splitlines()
+    new_lines = [line for line in rendered if line.strip()]
+    return "\n".join([*lines[: block.end], *new_lines, *lines[block.end :]]).rstrip() + "\n"
+
+
+def render_import_block(
+    statements: list[ImportStatement],
+    line_length: int,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
+) -> str:
+    merged: dict[tuple[str, int, bool], ImportStatement] = {}
+    aliased: list[ImportStatement] = []
+    for statement in statements:
+        if not statement.is_from:
+            merged.setdefault((statement.module, 0, False), statement)
+            continue
+
+        plain_names = tuple(name for name in statement.names if " as " not in name)
+        aliased.extend(
+            ImportStatement(statement.module, statement.level, (name,), True)
+            for name in statement.names
+            if " as " in name
+        )
+        if not plain_names:
+            continue
+
+        key = (statement.module, statement.level, True)
+        existing = merged.get(key)
+        names = plain_names if existing is None else (*existing.names, *plain_names)
+        merged[key] = ImportStatement(
+            module=statement.module,
+            level=statement.level,
+            names=tuple(sorted(set(names), key=_member_key)),
+            is_from=True,
+            exploded=statement.exploded or (existing is not None and existing.exploded),
+        )
+
+    sections: dict[int, list[ImportStatement]] = {}
+    for statement in [*merged.values(), *dict.fromkeys(aliased)]:
+        sections.setdefault(statement.get_section(first_party_modules), []).append(statement)
+
+    rendered_sections = [
+        "\n".join(
+            statement.render(line_length)
+            for statement in sorted(sections[section], key=_statement_key)
+        )
+        for section in sorted(sections)
+    ]
+    return "\n\n".join(rendered_sections) + "\n"
+
+
+def _statement_key(statement: ImportStatement) -> tuple:
+    return (
+        statement.is_from,
+        -statement.level,
+        _natural_key(statement.module),
+        _member_key(statement.names[0]) if statement.names else (),
+    )
+
+
+def _member_key(name: str) -> tuple:
+    member = name.split(" as ", maxsplit=1)[0]
+    if len(member) > 1 and member.isupper():
+        member_type = 0
+    elif member[:1].isupper():
+        member_type = 1
+    else:
+        member_type = 2
+    return (member_type, _natural_key(member), member, name)
+
+
+def _natural_key(value: str) -> tuple:
+    return tuple(
+        int(part) if part.isdigit() else part for part in re.split(r"(\d+)", value.lower())
+    )
+
+
+def _format_alias(alias: ast.alias) -> str:
+    return alias.name if alias.asname is None else f"{alias.name} as {alias.asname}"
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
@@ -1,5 +1,12 @@
 import re
 
+from fastgear_cli.core.utils.import_block_utils import (
+    DEFAULT_LINE_LENGTH,
+    FIRST_PARTY_MODULES,
+    INDENT,
+    merge_import_line,
+)
+
 
 def convert_lines_to_content(lines: list[str]) -> str:
     if not lines:
@@ -7,10 +14,39 @@ def convert_lines_to_content(lines: list[str]) -> str:
     return f"{'\n'.join(lines).rstrip()}\n"
 
 
-def ensure_import_line(lines: list[str], import_line: str) -> list[str]:
+def render_list_assignment(
+    list_name: str,
+    values: list[str],
+    *,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    exploded: bool = False,
+) -> str:
+    single_line = f"{list_name} = [{', '.join(values)}]"
+    if values and (exploded or len(single_line) > line_length):
+        items = "".join(f"{INDENT}{value},\n" for value in values)
+        return f"{list_name} = [\n{items}]"
+    return single_line
+
+
+def ensure_import_line(
+    lines: list[str],
+    import_line: str,
+    *,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
+) -> list[str]:
     if import_line in lines:
         return lines
 
+    merged = merge_import_line(
+        convert_lines_to_content(lines),
+        import_line,
+        line_length=line_length,
+        first_party_modules=first_party_modules,
+    )
+    if merged is not None:
+        return merged.splitlines()
+
     insert_idx = 0
     while insert_idx < len(lines) and (
         lines[insert_idx].startswith("from ")
@@ -31,13 +67,20 @@ def merge_required_line(
     current: str,
     required_line: str,
     anchor_line: str | None = None,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
 ) -> str:
     lines = current.splitlines()
     if required_line in lines:
         return current
 
     if required_line.startswith(("from ", "import ")):
-        lines = ensure_import_line(lines, required_line)
+        lines = ensure_import_line(
+            lines,
+            required_line,
+            line_length=line_length,
+            first_party_modules=first_party_modules,
+        )
         return convert_lines_to_content(lines)
 
     if anchor_line and anchor_line in lines:
@@ -56,20 +99,30 @@ def merge_symbol_list_assignment(
     current: str,
     list_name: str,
     symbol_name: str,
+    quoted: bool = False,
+    line_length: int = DEFAULT_LINE_LENGTH,
 ) -> str:
     assignment_pattern = re.compile(
         rf"{re.escape(list_name)}\s*=\s*\[(.*?)]",
         re.DOTALL,
     )
     assignment_match = assignment_pattern.search(current)
+    symbol_value = f'"{symbol_name}"' if quoted else symbol_name
 
     if assignment_match:
         raw_values = assignment_match.group(1)
-        symbols = re.findall(r"[A-Za-z_][A-Za-z0-9_]*", raw_values)
+        symbols = re.findall(r"""["']([^"']+)["']""", raw_values) if quoted else []
+        if not symbols:
+            symbols = re.findall(r"[A-Za-z_][A-Za-z0-9_]*", raw_values)
         if symbol_name not in symbols:
             symbols.append(symbol_name)
 
-        merged_assignment = f"{list_name} = [{', '.join(symbols)}]"
+        merged_assignment = render_list_assignment(
+            list_name,
+            [f'"{symbol}"' for symbol in symbols] if quoted else symbols,
+            line_length=line_length,
+            exploded=raw_values.rstrip().endswith(","),
+        )
         merged = (
             f"{current[: assignment_match.start()]}"
             f"{merged_assignment}"
@@ -79,7 +132,8 @@ def merge_symbol_list_assignment(
 
     return merge_required_line(
         current=current,
-        required_line=f"{list_name} = [{symbol_name}]",
+        required_line=f"{list_name} = [{symbol_value}]",
+        line_length=line_length,
     )
 
 
@@ -0,0 +1,307 @@
+import ast
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from fastgear_cli.core.utils.import_block_utils import (
+    DEFAULT_LINE_LENGTH,
+    FIRST_PARTY_MODULES,
+    INDENT,
+    append_import_statements,
+    find_import_block,
+    get_imported_names,
+    get_module_imports,
+    parse_import_line,
+    replace_import_block,
+)
+from fastgear_cli.core.utils.init_content_merge_utils import (
+    convert_lines_to_content,
+    merge_required_line,
+    merge_symbol_list_assignment,
+    render_list_assignment,
+)
+
+
+@dataclass(slots=True)
+class InitFileEdits:
+    imports: list[str] = field(default_factory=list)
+    lists: dict[str, list[str]] = field(default_factory=dict)
+    quoted_lists: set[str] = field(default_factory=set)
+    lines: list[tuple[str, str | None]] = field(default_factory=list)
+
+    def add_import(self, import_line: str) -> None:
+        if import_line not in self.imports:
+            self.imports.append(import_line)
+
+    def extend_list(self, list_name: str, symbols: Iterable[str], *, quoted: bool = False) -> None:
+        list_symbols = self.lists.setdefault(list_name, [])
+        list_symbols.extend(symbol for symbol in symbols if symbol not in list_symbols)
+        if quoted:
+            self.quoted_lists.add(list_name)
+
+    def add_line(self, line: str, *, anchor_line: str | None = None) -> None:
+        if all(line != pending_line for pending_line, _ in self.lines):
+            self.lines.append((line, anchor_line))
+
+
+def apply_init_edits(
+    content: str,
+    edits: InitFileEdits,
+    *,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
+) -> str:
+    try:
+        module = ast.parse(content)
+    except SyntaxError:
+        return _apply_edits_sequentially(content, edits, line_length, first_party_modules)
+
+    lines = content.splitlines()
+    block = find_import_block(module, content)
+    if block.shares_lines:
+        return _apply_edits_sequentially(content, edits, line_length, first_party_modules)
+
+    replacements = _build_list_replacements(module, content, edits, line_length)
+    existing_lines = set(lines)
+    pending_lines = [
+        (line, anchor_line) for line, anchor_line in edits.lines if line not in existing_lines
+    ]
+
+    insertions: dict[int, list[str]] = {}
+    appended: list[str] = []
+    for line, anchor_line in pending_lines:
+        if anchor_line in appended:
+            appended.insert(appended.index(anchor_line) + 1, line)
+        elif anchor_line in existing_lines and lines.index(anchor_line) >= block.end:
+            insertions.setdefault(lines.index(anchor_line), []).append(line)
+        else:
+            appended.append(line)
+
+    defined_lists = {list_name for list_name, _, _ in replacements.values()}
+    for list_name, symbols in edits.lists.items():
+        if not symbols or list_name in defined_lists:
+            continue
+        if appended:
+            appended.append("")
+        appended.append(
+            render_list_assignment(
+                list_name,
+                _format_list_values(symbols, quoted=list_name in edits.quoted_lists),
+                line_length=line_length,
+            )
+        )
+
+    new_statements = []
+    imported_names = get_imported_names(get_module_imports(module, content))
+    for import_line in edits.imports:
+        statements = parse_import_line(import_line)
+        if statements is None:
+            continue
+        if not get_imported_names(statements) <= imported_names:
+            new_statements.extend(statements)
+            imported_names |= get_imported_names(statements)
+
+    changed_replacements = {
+        start_index: replacement
+        for start_index, replacement in replacements.items()
+        if replacement[2] is not None
+    }
+    if not (changed_replacements or insertions or appended or new_statements):
+        return content
+
+    tail = _edit_body_lines(lines, block.end, changed_replacements, insertions)
+    if appended:
+        while tail and not tail[-1].strip():
+            tail.pop()
+        if tail or block.end:
+            tail.append("")
+        for appended_line in appended:
+            tail.extend(appended_line.splitlines() or [""])
+
+    merged_lines = [*lines[: block.end], *tail]
+    if not new_statements:
+        return convert_lines_to_content(merged_lines)
+    if block.has_comments:
+        return append_import_statements(
+            merged_lines,
+            block,
+            new_statements,
+            line_length,
+            first_party_modules=first_party_modules,
+        )
+    return replace_import_block(
+        merged_lines,
+        block,
+        [*block.statements, *new_statements],
+        line_length,
+        first_party_modules=first_party_modules,
+    )
+
+
+def _build_list_replacements(
+    module: ast.Module,
+    content: str,
+    edits: InitFileEdits,
+    line_length: int,
+) -> dict[int, tuple[str, int, str | None]]:
+    lines = content.splitlines()
+    replacements: dict[int, tuple[str, int, str | None]] = {}
+    for node in module.body:
+        list_name = _get_list_assignment_name(node)
+        if list_name not in edits.lists or node.lineno - 1 in replacements:
+            continue
+
+        list_node = node.value
+        values = [_format_list_item(element, content) for element in list_node.elts]
+        new_values = [
+            value
+            for value in _format_list_values(
+                edits.lists[list_name],
+                quoted=list_name in edits.quoted_lists,
+            )
+            if value not in values
+        ]
+        if not new_values:
+            replacements[node.lineno - 1] = (list_name, node.end_lineno, None)
+            continue
+
+        list_source = ast.get_source_segment(content, list_node) or ""
+        is_tuple = isinstance(list_node, ast.Tuple)
+        closing_bracket = ")" if is_tuple else "]"
+        has_brackets = list_source.endswith(closing_bracket)
+        has_trailing_comma = has_brackets and _has_trailing_comma(lines, list_node)
+        closing_line = lines[node.end_lineno - 1]
+        if (
+            list_node.lineno != list_node.end_lineno
+            and list_node.end_lineno == node.end_lineno
+            and closing_line.strip() == closing_bracket
+            and has_trailing_comma
+        ):
+            indent = closing_line[: len(closing_line) - len(closing_line.lstrip())] + INDENT
+            assignment = "\n".join(
+                [
+                    *lines[node.lineno - 1 : node.end_lineno - 1],
+                    *(f"{indent}{value}," for value in new_values),
+                    closing_line,
+                ]
+            )
+            replacements[node.lineno - 1] = (list_name, node.end_lineno, assignment)
+            continue
+
+        prefix = "\n".join(
+            [
+                *lines[node.lineno - 1 : list_node.lineno - 1],
+                lines[list_node.lineno - 1][: list_node.col_offset],
+            ]
+        )
+        assignment = _render_sequence(
+            prefix,
+            [*values, *new_values],
+            is_tuple=is_tuple,
+            line_length=line_length,
+            exploded=has_trailing_comma and not (is_tuple and len(values) == 1),
+        )
+        suffix = lines[list_node.end_lineno - 1][list_node.end_col_offset :]
+        replacements[node.lineno - 1] = (list_name, node.end_lineno, f"{assignment}{suffix}")
+    return replacements
+
+
+def _edit_body_lines(
+    lines: list[str],
+    start_index: int,
+    replacements: dict[int, tuple[str, int, str | None]],
+    insertions: dict[int, list[str]],
+) -> list[str]:
+    edited: list[str] = []
+    line_index = start_index
+    while line_index < len(lines):
+        replacement = replacements.get(line_index)
+        if replacement is not None:
+            _, end_index, assignment = replacement
+            edited.extend(assignment.splitlines())
+            line_index = end_index
+        else:
+            edited.append(lines[line_index])
+            line_index += 1
+        edited.extend(insertions.get(line_index - 1, []))
+    return edited
+
+
+def _apply_edits_sequentially(
+    content: str,
+    edits: InitFileEdits,
+    line_length: int,
+    first_party_modules: frozenset[str],
+) -> str:
+    for import_line in edits.imports:
+        content = merge_required_line(
+            current=content,
+            required_line=import_line,
+            line_length=line_length,
+            first_party_modules=first_party_modules,
+        )
+    for line, anchor_line in edits.lines:
+        content = merge_required_line(
+            current=content,
+            required_line=line,
+            anchor_line=anchor_line,
+            line_length=line_length,
+        )
+    for list_name, symbols in edits.lists.items():
+        for symbol in symbols:
+            content = merge_symbol_list_assignment(
+                current=content,
+                list_name=list_name,
+                symbol_name=symbol,
+                quoted=list_name in edits.quoted_lists,
+                line_length=line_length,
+            )
+    return content
+
+
+def _get_list_assignment_name(node: ast.stmt) -> str | None:
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        target = node.targets[0]
+    elif isinstance(node, ast.AnnAssign) and node.value is not None:
+        target = node.target
+    else:
+        return None
+
+    if isinstance(target, ast.Name) and isinstance(node.value, ast.List | ast.Tuple):
+        return target.id
+    return None
+
+
+def _has_trailing_comma(lines: list[str], list_node: ast.List | ast.Tuple) -> bool:
+    if not list_node.elts:
+        return False
+
+    last_element = list_node.elts[-1]
+    after_element = lines[last_element.end_lineno - 1][last_element.end_col_offset :]
+    return after_element.lstrip().startswith(",")
+
+
+def _render_sequence(
+    prefix: str,
+    values: list[str],
+    *,
+    is_tuple: bool,
+    line_length: int,
+    exploded: bool,
+) -> str:
+    opening, closing = ("(", ")") if is_tuple else ("[", "]")
+    joined = ", ".join(values) + ("," if is_tuple and len(values) == 1 else "")
+    single_line = f"{prefix}{opening}{joined}{closing}"
+    if values and (exploded or len(single_line.splitlines()[-1]) > line_length):
+        items = "".join(f"{INDENT}{value},\n" for value in values)
+        return f"{prefix}{opening}\n{items}{closing}"
+    return single_line
+
+
+def _format_list_item(element: ast.expr, content: str) -> str:
+    if isinstance(element, ast.Constant) and isinstance(element.value, str):
+        return f'"{element.value}"'
+    return ast.get_source_segment(content, element) or ""
+
+
+def _format_list_values(symbols: list[str], *, quoted: bool) -> list[str]:
+    return [f'"{symbol}"' for symbol in symbols] if quoted else symbols
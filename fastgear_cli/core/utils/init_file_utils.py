@@ -1,7 +1,13 @@
-import re
 from pathlib import Path
 
-from fastgear_cli.core.render import run_ruff_format
+from fastgear_cli.core.formatting import (
+    get_ruff_first_party_modules,
+    get_ruff_line_length,
+    read_python_file,
+    write_python_file,
+)
+from fastgear_cli.core.utils.import_block_utils import DEFAULT_LINE_LENGTH, FIRST_PARTY_MODULES
+from fastgear_cli.core.utils.init_edit_utils import InitFileEdits, apply_init_edits
 
 
 def update_module_init(
@@ -16,20 +22,24 @@ def update_module_init(
     init_path = base_dir / module_dir / "__init__.py"
     import_line = f"from .{module_name}_{source_suffix} import {symbol_name}"
 
-    if not init_path.exists():
+    current = read_python_file(init_path)
+    if current is None:
         content = f'{import_line}\n\n__all__ = ["{symbol_name}"]\n'
     else:
-        current = init_path.read_text(encoding="utf-8")
-        content = merge_module_init_content(current, import_line, symbol_name)
+        content = merge_module_init_content(
+            current,
+            import_line,
+            symbol_name,
+            line_length=get_ruff_line_length(init_path),
+            first_party_modules=get_ruff_first_party_modules(init_path),
+        )
         if content == current:
             return None
 
     if dry_run:
         return init_path
 
-    init_path.parent.mkdir(parents=True, exist_ok=True)
-    init_path.write_text(content, encoding="utf-8")
-    run_ruff_format(init_path, base_dir)
+    write_python_file(init_path, content, base_dir)
     return init_path
 
 
@@ -37,36 +47,16 @@ def merge_module_init_content(
     current: str,
     import_line: str,
     symbol_name: str,
+    *,
+    line_length: int = DEFAULT_LINE_LENGTH,
+    first_party_modules: frozenset[str] = FIRST_PARTY_MODULES,
 ) -> str:
-    lines = current.splitlines()
-    if import_line not in lines:
-        insert_idx = 0
-        while insert_idx < len(lines) and (
-            lines[insert_idx].startswith("from ")
-            or lines[insert_idx].startswith("import ")
-            or not lines[insert_idx].strip()
-        ):
-            insert_idx += 1
-        lines.insert(insert_idx, import_line)
-        if insert_idx > 0 and lines[insert_idx - 1].strip():
-            lines.insert(insert_idx, "")
-
-    merged = "\n".join(lines).rstrip("\n")
-    all_match = re.search(r"__all__\s*=\s*\[(.*?)]", merged, re.DOTALL)
-
-    if all_match:
-        raw_items = all_match.group(1)
-        values = re.findall(r"""["']([^"']+)["']""", raw_items)
-        if not values:
-            values = re.findall(r"[A-Za-z_][A-Za-z0-9_]*", raw_items)
-        if symbol_name not in values:
-            values.append(symbol_name)
-        quoted_values = ", ".join(f'"{item}"' for item in values)
-        all_value = f"__all__ = [{quoted_values}]"
-        merged = f"{merged[: all_match.start()]}{all_value}{merged[all_match.end() :]}"
-    else:
-        if merged and not merged.endswith("\n\n"):
-            merged = f"{merged}\n\n"
-        merged = f'{merged}__all__ = ["{symbol_name}"]'
-
-    return f"{merged.rstrip()}\n"
+    edits = InitFileEdits()
+    edits.add_import(import_line)
+    edits.extend_list("__all__", [symbol_name], quoted=True)
+    return apply_init_edits(
+        current,
+        edits,
+        line_length=line_length,
+        first_party_modules=first_party_modules,
+    )
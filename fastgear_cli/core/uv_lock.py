@@ -0,0 +1,110 @@
+import subprocess
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import typer
+
+from fastgear_cli.core.lock_snapshots import LockSnapshot
+
+UV_LOCK_COMMAND = ("uv", "lock")
+PYPROJECT_FILE_NAME = "pyproject.toml"
+CANCEL_TIMEOUT_SECONDS = 5
+
+
+class UvLockJob:
+    def __init__(self, project_dir: Path) -> None:
+        self.project_dir = project_dir
+        self._process: subprocess.Popen | None = None
+        self._started = False
+        self._snapshot: LockSnapshot | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    def notify_file_written(self, file_path: Path) -> None:
+        if file_path == self.project_dir / PYPROJECT_FILE_NAME:
+            self.start()
+
+    def start(self) -> None:
+        if self._started:
+            return
+
+        self._started = True
+        self._snapshot = LockSnapshot.from_pyproject(self.project_dir / PYPROJECT_FILE_NAME)
+        if self._snapshot is not None and self._snapshot.restore(self.project_dir):
+            typer.secho("📦 Restored uv.lock from a cached snapshot.", fg=typer.colors.CYAN)
+            return
+
+        typer.secho("📦 Generating uv.lock...", fg=typer.colors.CYAN)
+        try:
+            self._process = subprocess.Popen(
+                list(UV_LOCK_COMMAND),
+                cwd=self.project_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except FileNotFoundError:
+            if not self._restore_stale_snapshot():
+                typer.secho(
+                    "uv not found. Please install uv to generate the lock file.",
+                    fg=typer.colors.YELLOW,
+                )
+
+    def wait(self) -> None:
+        self.start()
+        if self._process is None:
+            return
+
+        try:
+            _, stderr = self._process.communicate()
+        except BaseException:
+            self.cancel()
+            raise
+
+        if self._process.returncode == 0:
+            if self._snapshot is not None:
+                self._snapshot.save(self.project_dir)
+        elif not self._restore_stale_snapshot():
+            typer.secho(
+                f"Failed to generate uv.lock: {stderr}",
+                fg=typer.colors.YELLOW,
+            )
+        self._process = None
+
+    def cancel(self) -> None:
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.communicate(timeout=CANCEL_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+
+    def _restore_stale_snapshot(self) -> bool:
+        if self._snapshot is None or not self._snapshot.restore(self.project_dir, allow_stale=True):
+            return False
+
+        typer.secho(
+            "📦 uv lock is unavailable, restored uv.lock from an outdated cached snapshot.",
+            fg=typer.colors.YELLOW,
+        )
+        return True
+
+
+@contextmanager
+def background_uv_lock(project_dir: Path) -> Iterator[UvLockJob]:
+    job = UvLockJob(project_dir)
+    try:
+        yield job
+    except BaseException:
+        job.cancel()
+        raise
+
+    job.wait()
@@ -0,0 +1,44 @@
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class TemplateArtifactsBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        sys.path.insert(0, self.root)
+        from jinja2 import __version__ as jinja_version
+
+        from fastgear_cli.core.template_env import compile_template_archives
+        from fastgear_cli.core.template_manifest import (
+            COMPILED_TEMPLATES_DIR_NAME,
+            MANIFEST_FILE_NAME,
+            write_manifest,
+        )
+
+        self._artifacts_dir = Path(tempfile.mkdtemp(prefix="fastgear-cli-build-"))
+        archives = compile_template_archives(self._artifacts_dir / COMPILED_TEMPLATES_DIR_NAME)
+        compiled = {"jinja_version": jinja_version, "archives": {}}
+        for root_key, archive_path in archives.items():
+            archive_name = f"{COMPILED_TEMPLATES_DIR_NAME}/{archive_path.name}"
+            compiled["archives"][root_key] = archive_name
+            build_data["force_include"][str(archive_path)] = (
+                f"fastgear_cli/templates/{archive_name}"
+            )
+
+        manifest_path = write_manifest(self._artifacts_dir / MANIFEST_FILE_NAME, compiled=compiled)
+        build_data["force_include"][str(manifest_path)] = (
+            f"fastgear_cli/templates/{MANIFEST_FILE_NAME}"
+        )
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        artifacts_dir = getattr(self, "_artifacts_dir", None)
+        if artifacts_dir is not None:
+            shutil.rmtree(artifacts_dir, ignore_errors=True)
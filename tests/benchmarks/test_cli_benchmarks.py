@@ -0,0 +1,154 @@
+import itertools
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fastgear_cli.cli.commands.add import add_app
+from fastgear_cli.core.constants.enums import (
+    AgentToolsEnum,
+    CIProviderEnum,
+    DatabaseProviderEnum,
+)
+from fastgear_cli.core.filesystem import create_template
+from fastgear_cli.core.models import ProjectInitConfig
+
+pytest_plugins = ["tests.fixtures.benchmarks.benchmark_fixtures"]
+
+pytestmark = pytest.mark.benchmark
+
+runner = CliRunner()
+
+PROJECT_INIT_OPTIONS = list(
+    itertools.product(
+        (True, False),
+        ([], [AgentToolsEnum.GITHUB_COPILOT]),
+        (None, CIProviderEnum.GITHUB_ACTIONS),
+        (None, DatabaseProviderEnum.POSTGRESQL),
+    )
+)
+
+
+def _project_init_option_id(options: tuple) -> str:
+    use_docker, agent_tools, ci_provider, database_provider = options
+    return "-".join(
+        [
+            "docker" if use_docker else "no_docker",
+            "copilot" if agent_tools else "no_agents",
+            "actions" if ci_provider else "no_ci",
+            "postgresql" if database_provider else "no_database",
+        ]
+    )
+
+
+def _import_time_seconds(module_name: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, imported_module = line.removeprefix("import time:").split("|")
+        if imported_module.strip() == module_name:
+            return int(cumulative) / 1_000_000
+    raise AssertionError(f"'{module_name}' not found in -X importtime output")
+
+
+def _timed(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+@pytest.mark.describe("🧪  Benchmarks")
+class TestBenchmarks:
+    @pytest.mark.it("✅  Should import the CLI app within the baseline")
+    def test_app_import_time(self, benchmark_baselines):
+        seconds = benchmark_baselines.measure(
+            lambda: _import_time_seconds("fastgear_cli.cli.app"),
+            rounds=7,
+        )
+
+        benchmark_baselines.check("import_fastgear_cli.cli.app", seconds)
+
+    @pytest.mark.it("✅  Should render every project init combination within the baseline")
+    @pytest.mark.parametrize("options", PROJECT_INIT_OPTIONS, ids=_project_init_option_id)
+    def test_create_new_project(self, benchmark_baselines, options: tuple):
+        use_docker, agent_tools, ci_provider, database_provider = options
+
+        def run() -> float:
+            with tempfile.TemporaryDirectory() as base_dir:
+                config = ProjectInitConfig(
+                    base_dir=Path(base_dir),
+                    project_name="bench-project",
+                    project_title="Bench Project",
+                    use_docker=use_docker,
+                    agent_tools=agent_tools,
+                    ci_provider=ci_provider,
+                    use_database=database_provider is not None,
+                    database_provider=database_provider,
+                )
+                return _timed(
+                    create_template,
+                    "new_project",
+                    config.base_dir,
+                    config.context,
+                    config.conditional_files,
+                    config.conditional_dirs,
+                )
+
+        seconds = benchmark_baselines.measure(run, rounds=5)
+
+        benchmark_baselines.check(
+            f"create_template_new_project[{_project_init_option_id(options)}]", seconds
+        )
+
+    @pytest.mark.it("✅  Should add a module with all components within the baseline")
+    @pytest.mark.parametrize("use_real_ruff", [False, True], ids=["stubbed_ruff", "real_ruff"])
+    def test_add_module(
+        self,
+        benchmark_baselines,
+        request,
+        monkeypatch: pytest.MonkeyPatch,
+        use_real_ruff: bool,
+    ):
+        if not use_real_ruff:
+            request.getfixturevalue("stub_ruff")
+
+        def run() -> float:
+            with tempfile.TemporaryDirectory() as project_dir:
+                monkeypatch.chdir(project_dir)
+                format_cache_dir = Path(project_dir) / ".format-cache"
+                monkeypatch.setattr(
+                    "fastgear_cli.core.format_cache.get_format_cache_dir",
+                    lambda: format_cache_dir,
+                )
+                (Path(project_dir) / "pyproject.toml").write_text(
+                    '[project]\nname = "bench-project"\n\n[tool.ruff]\nline-length = 100\n',
+                    encoding="utf-8",
+                )
+                start = time.perf_counter()
+                result = runner.invoke(
+                    add_app,
+                    [
+                        "module",
+                        "billing",
+                        "--path",
+                        str(Path(project_dir) / "src" / "modules"),
+                        "--module-components",
+                        "controller,service,repository,entity",
+                    ],
+                )
+                elapsed = time.perf_counter() - start
+                assert result.exit_code == 0, result.output
+                return elapsed
+
+        seconds = benchmark_baselines.measure(run, rounds=3 if use_real_ruff else 5)
+
+        ruff_mode = "real_ruff" if use_real_ruff else "stubbed_ruff"
+        benchmark_baselines.check(f"add_module_all_components[{ruff_mode}]", seconds)
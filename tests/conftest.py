@@ -0,0 +1,40 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.configs.settings import CACHE_DIR_ENV_VAR
+from fastgear_cli.core.template_env import clear_template_environments
+
+BENCHMARK_ENV_VAR = "FG_BENCHMARK"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if os.getenv(BENCHMARK_ENV_VAR) == "1":
+        return
+
+    skip_benchmark = pytest.mark.skip(reason=f"Benchmarks only run with {BENCHMARK_ENV_VAR}=1")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    cache_dir = tmp_path_factory.mktemp("fastgear-cli-cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_dir))
+        clear_template_environments()
+        yield cache_dir
+    clear_template_environments()
+
+
+@pytest.fixture(autouse=True)
+def isolated_format_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    format_cache_dir = tmp_path / "ruff-format-cache"
+    monkeypatch.setattr(
+        "fastgear_cli.core.format_cache.get_format_cache_dir",
+        lambda: format_cache_dir,
+    )
+    return format_cache_dir
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import platform
+import re
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_UPDATE_ENV_VAR = "FG_BENCHMARK_UPDATE"
+BENCHMARK_TOLERANCE_ENV_VAR = "FG_BENCHMARK_TOLERANCE"
+BENCHMARK_BASELINES_ENV_VAR = "FG_BENCHMARK_BASELINES"
+DEFAULT_TOLERANCE_PERCENT = 25.0
+BASELINES_DIR = Path(__file__).resolve().parents[3] / ".benchmarks"
+REFERENCE_FILE_COUNT = 200
+REFERENCE_ROUNDS = 7
+
+
+def run_reference_workload() -> float:
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as work_dir:
+        for index in range(REFERENCE_FILE_COUNT):
+            content = json.dumps({"index": index, "values": list(range(50))}, indent=2)
+            file_path = Path(work_dir) / f"module_{index}.py"
+            file_path.write_text(content, encoding="utf-8")
+            hashlib.sha256(file_path.read_bytes()).hexdigest()
+    return time.perf_counter() - start
+
+
+def get_baselines_path() -> Path:
+    configured_path = os.getenv(BENCHMARK_BASELINES_ENV_VAR)
+    if configured_path:
+        return Path(configured_path)
+
+    machine_key = "-".join(
+        [
+            platform.node() or "unknown",
+            platform.machine() or "unknown",
+            platform.python_implementation(),
+            platform.python_version(),
+        ]
+    )
+    return BASELINES_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', machine_key)}.json"
+
+
+class BenchmarkBaselines:
+    def __init__(self, baselines_path: Path, *, tolerance_percent: float, update: bool) -> None:
+        self.baselines_path = baselines_path
+        self.tolerance_percent = tolerance_percent
+        self.update = update
+        self._baselines: dict[str, float] = (
+            json.loads(baselines_path.read_text(encoding="utf-8"))
+            if baselines_path.exists()
+            else {}
+        )
+        self._reference_seconds: float | None = None
+
+    @property
+    def reference_seconds(self) -> float:
+        if self._reference_seconds is None:
+            self._reference_seconds = self.measure(run_reference_workload, rounds=REFERENCE_ROUNDS)
+        return self._reference_seconds
+
+    def measure(self, run: Callable[[], float], *, rounds: int, warmup: int = 1) -> float:
+        for _ in range(warmup):
+            run()
+        return statistics.median(run() for _ in range(rounds))
+
+    def check(self, name: str, seconds: float) -> None:
+        ratio = round(seconds / self.reference_seconds, 3)
+        if self.update:
+            self._baselines[name] = ratio
+            return
+
+        baseline = self._baselines.get(name)
+        if baseline is None:
+            pytest.skip(
+                f"'{name}' took {seconds * 1000:.3f}ms ({ratio:.3f}x the reference workload); "
+                f"no baseline recorded in {self.baselines_path}. Run with "
+                f"{BENCHMARK_UPDATE_ENV_VAR}=1 on the base revision first."
+            )
+
+        limit = baseline * (1 + self.tolerance_percent / 100)
+        assert ratio <= limit, (
+            f"'{name}' took {seconds * 1000:.3f}ms ({ratio:.3f}x the reference workload), "
+            f"baseline is {baseline:.3f}x (limit {limit:.3f}x at {self.tolerance_percent:g}% "
+            "tolerance)"
+        )
+
+    def save(self) -> None:
+        self.baselines_path.parent.mkdir(parents=True, exist_ok=True)
+        self.baselines_path.write_text(
+            json.dumps(dict(sorted(self._baselines.items())), indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines() -> Iterator[BenchmarkBaselines]:
+    baselines = BenchmarkBaselines(
+        get_baselines_path(),
+        tolerance_percent=float(
+            os.getenv(BENCHMARK_TOLERANCE_ENV_VAR, str(DEFAULT_TOLERANCE_PERCENT))
+        ),
+        update=os.getenv(BENCHMARK_UPDATE_ENV_VAR) == "1",
+    )
+    yield baselines
+    if baselines.update:
+        baselines.save()
+
+
+@pytest.fixture
+def stub_ruff(mocker) -> None:
+    mocker.patch(
+        "fastgear_cli.core.formatting._run_ruff",
+        side_effect=lambda arguments, cwd, *, stdin=None: stdin or "",
+    )
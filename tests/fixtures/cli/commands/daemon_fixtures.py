@@ -0,0 +1,33 @@
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.cli.commands.helpers.daemon.server import serve_daemon, stop_daemon
+from fastgear_cli.configs.settings import DAEMON_SOCKET_ENV_VAR
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    socket_path = tmp_path / "fg.sock"
+    monkeypatch.setenv(DAEMON_SOCKET_ENV_VAR, str(socket_path))
+    return socket_path
+
+
+@pytest.fixture
+def running_daemon(daemon_socket: Path) -> Iterator[Path]:
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=serve_daemon,
+        args=(daemon_socket,),
+        kwargs={"on_ready": ready.set},
+        daemon=True,
+    )
+    thread.start()
+    assert ready.wait(timeout=30)
+
+    yield daemon_socket
+
+    stop_daemon(daemon_socket)
+    thread.join(timeout=5)
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    (project_path / "pyproject.toml").write_text(
+        '[project]\nname = "project"\n\n[tool.ruff]\nline-length = 30\n',
+        encoding="utf-8",
+    )
+    return project_path
+
+
+@pytest.fixture
+def python_files(project_dir: Path) -> list[Path]:
+    return [project_dir / name / "__init__.py" for name in ("controllers", "entities")]
+
+
+@pytest.fixture
+def unformatted_content() -> str:
+    return "__all__=['first_symbol','second_symbol']\n"
+
+
+@pytest.fixture
+def formatted_content() -> str:
+    return '__all__ = [\n    "first_symbol",\n    "second_symbol",\n]\n'
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def journal_file(tmp_path: Path) -> Path:
+    file_path = tmp_path / "billing" / "__init__.py"
+    file_path.parent.mkdir()
+    file_path.write_text("from .entities import Billing\n", encoding="utf-8")
+    return file_path
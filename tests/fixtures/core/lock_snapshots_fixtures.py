@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.configs.settings import CACHE_DIR_ENV_VAR
+
+PYPROJECT_TEMPLATE = """[project]
+name = "{project_name}"
+version = "0.1.0"
+requires-python = ">=3.11"
+dependencies = [
+    "fastapi>=0.128.0",
+]
+
+[tool.uv]
+default-groups = []
+
+[tool.ruff]
+line-length = {line_length}
+"""
+
+LOCK_TEMPLATE = """version = 1
+requires-python = ">=3.11"
+
+[[package]]
+name = "fastapi"
+version = "0.128.0"
+
+[[package]]
+name = "{project_name}"
+version = "0.1.0"
+source = {{ virtual = "." }}
+dependencies = [
+    {{ name = "fastapi" }},
+]
+"""
+
+
+@pytest.fixture
+def snapshot_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def make_project(tmp_path: Path, snapshot_cache_dir: Path):
+    def _make_project(project_name: str, *, line_length: int = 100) -> Path:
+        project_dir = tmp_path / project_name
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text(
+            PYPROJECT_TEMPLATE.format(project_name=project_name, line_length=line_length),
+            encoding="utf-8",
+        )
+        return project_dir
+
+    return _make_project
+
+
+@pytest.fixture
+def lock_content():
+    def _lock_content(project_name: str) -> str:
+        return LOCK_TEMPLATE.format(project_name=project_name)
+
+    return _lock_content
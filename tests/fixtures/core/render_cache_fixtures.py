@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.configs.settings import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture
+def render_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_path))
+    return cache_path
+
+
+@pytest.fixture
+def cacheable_template_root(tmp_path: Path) -> Path:
+    template_root = tmp_path / "templates" / "project"
+    project_dir = template_root / "{{project_name}}"
+    (project_dir / "src").mkdir(parents=True)
+    (project_dir / "README.md.j2").write_text("# {{ project_title }}\n")
+    (project_dir / "pyproject.toml.j2").write_text(
+        'name = "{{ project_name }}"\n{% if use_docker %}docker = true\n{% endif %}'
+    )
+    (project_dir / "src" / "main.py").write_text("print('hello')\n")
+    (project_dir / "docker").mkdir()
+    (project_dir / "docker" / "Dockerfile").write_text("FROM python:3.12\n")
+    return template_root
+
+
+@pytest.fixture
+def uncacheable_template_root(tmp_path: Path) -> Path:
+    template_root = tmp_path / "templates" / "filtered"
+    project_dir = template_root / "{{project_name}}"
+    project_dir.mkdir(parents=True)
+    (project_dir / "README.md.j2").write_text("# {{ project_name | upper }}\n")
+    return template_root
+
+
+@pytest.fixture
+def render_context() -> dict:
+    return {"project_name": "first-service", "project_title": "First Service", "use_docker": True}
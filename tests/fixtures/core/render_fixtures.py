@@ -84,3 +84,22 @@ def template_with_nested_conditional_file(template_root: Path) -> Path:
     (project_dir / "README.md").write_text("# README")
     (nested_dir / "copilot-instructions.md").write_text("# Copilot\n")
     return template_root
+
+
+@pytest.fixture
+def template_with_many_files(template_root: Path) -> Path:
+    for index in range(12):
+        (template_root / f"module_{index:02}").mkdir()
+        (template_root / f"module_{index:02}" / "__init__.py.j2").write_text(
+            f"# {{{{ project_title }}}} {index}\n"
+        )
+        (template_root / f"module_{index:02}" / "static.txt").write_text(f"static {index}\n")
+    return template_root
+
+
+@pytest.fixture
+def template_with_large_output(template_root: Path) -> Path:
+    (template_root / "seed.json.j2").write_text(
+        "{% for index in range(count) %}{{ probe(index) }}{% endfor %}\n"
+    )
+    return template_root
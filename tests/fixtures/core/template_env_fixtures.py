@@ -0,0 +1,54 @@
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from jinja2 import __version__ as jinja_version
+
+from fastgear_cli.configs.settings import CACHE_DIR_ENV_VAR
+from fastgear_cli.core.template_env import clear_template_environments, compile_template_archives
+from fastgear_cli.core.template_manifest import (
+    COMPILED_TEMPLATES_DIR_NAME,
+    MANIFEST_FILE_NAME,
+    clear_packaged_manifest,
+    write_manifest,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_path))
+    clear_template_environments()
+    yield cache_path
+    clear_template_environments()
+
+
+@pytest.fixture
+def template_root(tmp_path: Path) -> Path:
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "README.md.j2").write_text("# {{ project_title }}\n")
+    return template_dir
+
+
+@pytest.fixture
+def compiled_templates_dir(templates_dir: Path, packaged_manifest_dir: Path) -> Path:
+    shutil.copytree(templates_dir, packaged_manifest_dir, dirs_exist_ok=True)
+    archives = compile_template_archives(
+        packaged_manifest_dir / COMPILED_TEMPLATES_DIR_NAME,
+        packaged_manifest_dir,
+    )
+    write_manifest(
+        packaged_manifest_dir / MANIFEST_FILE_NAME,
+        packaged_manifest_dir,
+        compiled={
+            "jinja_version": jinja_version,
+            "archives": {
+                root_key: archive_path.relative_to(packaged_manifest_dir).as_posix()
+                for root_key, archive_path in archives.items()
+            },
+        },
+    )
+    clear_packaged_manifest()
+    return packaged_manifest_dir
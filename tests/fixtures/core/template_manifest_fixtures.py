@@ -0,0 +1,32 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.core.template_manifest import clear_packaged_manifest
+
+
+@pytest.fixture
+def templates_dir(tmp_path: Path) -> Path:
+    templates_path = tmp_path / "templates"
+    project_dir = templates_path / "new_project" / "{{project_name}}"
+    (project_dir / "docker").mkdir(parents=True)
+    (project_dir / "README.md.j2").write_text("# {{ project_title }}\n")
+    (project_dir / "docker" / "Dockerfile").write_text("FROM python:3.13\n")
+    entity_dir = templates_path / "add" / "entity" / "folder" / "entities"
+    entity_dir.mkdir(parents=True)
+    (entity_dir / "{{element_name}}_entity.py.j2").write_text("class {{ element_class_name }}:\n")
+    return templates_path
+
+
+@pytest.fixture
+def packaged_manifest_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    package_templates_dir = tmp_path / "package_templates"
+    package_templates_dir.mkdir()
+    monkeypatch.setattr(
+        "fastgear_cli.core.template_manifest.TEMPLATES_DIR",
+        package_templates_dir,
+    )
+    clear_packaged_manifest()
+    yield package_templates_dir
+    clear_packaged_manifest()
@@ -0,0 +1,31 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def staging_temp_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+    return temp_dir
+
+
+@pytest.fixture
+def transaction_root(tmp_path: Path, staging_temp_dir: Path) -> Path:
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "__init__.py").write_text("original = True\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def transaction_template_root(tmp_path: Path) -> Path:
+    template_root = tmp_path / "templates"
+    (template_root / "src" / "{{ element_name }}").mkdir(parents=True)
+    (template_root / "src" / "{{ element_name }}" / "__init__.py.j2").write_text(
+        "name = '{{ element_name }}'\n"
+    )
+    (template_root / "src" / "{{ element_name }}" / "py.typed").write_text("")
+    return template_root
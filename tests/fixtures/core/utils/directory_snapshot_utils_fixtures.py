@@ -0,0 +1,12 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def output_tree(tmp_path: Path) -> Path:
+    root = tmp_path / "output"
+    (root / "src" / "core").mkdir(parents=True)
+    (root / "README.md").write_text("# Readme\n")
+    (root / "src" / "main.py").write_text("print('hello')\n")
+    return root
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def static_file(tmp_path: Path) -> Path:
+    source = tmp_path / "asset.bin"
+    source.write_bytes(b"\x00static-asset\xff" * 1024)
+    return source
+
+
+@pytest.fixture
+def destination_file(tmp_path: Path) -> Path:
+    return tmp_path / "output" / "asset.bin"
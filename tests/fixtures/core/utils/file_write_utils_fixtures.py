@@ -0,0 +1,13 @@
+import os
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def existing_file(tmp_path: Path) -> Path:
+    file_path = tmp_path / "package" / "__init__.py"
+    file_path.parent.mkdir()
+    file_path.write_text("x = 1\n", encoding="utf-8")
+    os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+    return file_path
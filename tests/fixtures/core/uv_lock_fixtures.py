@@ -0,0 +1,28 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    return project_path
+
+
+@pytest.fixture
+def uv_lock_process() -> MagicMock:
+    process = MagicMock()
+    process.communicate.return_value = ("", "")
+    process.returncode = 0
+    process.poll.return_value = None
+    return process
+
+
+@pytest.fixture
+def mock_popen(mocker, uv_lock_process: MagicMock) -> MagicMock:
+    return mocker.patch(
+        "fastgear_cli.core.uv_lock.subprocess.Popen",
+        return_value=uv_lock_process,
+    )
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.cli.commands.helpers.add import spec
+from fastgear_cli.cli.commands.helpers.add.spec import ModuleTask, partition_module_tasks
+
+
+def _task(base_dir: Path, module_name: str) -> ModuleTask:
+    return ModuleTask(
+        base_dir=base_dir,
+        module_name=module_name,
+        use_folders=True,
+        module_components="entity",
+    )
+
+
+@pytest.mark.describe("🧪  PartitionModuleTasks")
+class TestPartitionModuleTasks:
+    @pytest.mark.it("✅  Should run independent modules in separate groups")
+    def test_splits_independent_modules(self, tmp_path: Path):
+        tasks = [_task(tmp_path, "billing"), _task(tmp_path, "invoice")]
+
+        assert partition_module_tasks(tasks) == [[0], [1]]
+
+    @pytest.mark.it("✅  Should keep nested and repeated module dirs in one group in spec order")
+    def test_groups_overlapping_modules(self, tmp_path: Path):
+        tasks = [
+            _task(tmp_path, "billing"),
+            _task(tmp_path, "invoice"),
+            _task(tmp_path / "billing", "payments"),
+            _task(tmp_path, "billing"),
+        ]
+
+        assert partition_module_tasks(tasks) == [[0, 2, 3], [1]]
+
+
+@pytest.mark.describe("🧪  RunModuleGroup")
+class TestRunModuleGroup:
+    @pytest.mark.it("✅  Should return worker output instead of printing it")
+    def test_captures_worker_output(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        def print_task(task: ModuleTask, *, dry_run: bool) -> None:
+            print(f"generated {task.module_name}")  # noqa: T201
+
+        monkeypatch.setattr(spec, "_run_module_task", print_task)
+
+        output = spec._capture_module_group(tmp_path, [_task(tmp_path, "billing")], False)
+
+        assert output.stdout == "generated billing\n"
+        assert capsys.readouterr().out == ""
@@ -0,0 +1,182 @@
+import io
+import os
+import socket
+import stat
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli import __version__
+from fastgear_cli.cli.client import forward_command
+from fastgear_cli.cli.commands.helpers.daemon import server
+from fastgear_cli.cli.commands.helpers.daemon.server import handle_daemon_request, serve_daemon
+from fastgear_cli.core.exceptions import FastgearCliError
+
+pytest_plugins = ["tests.fixtures.cli.commands.daemon_fixtures"]
+
+
+def _request(cwd: Path, *args: str) -> dict:
+    return {
+        "version": __version__,
+        "cwd": str(cwd),
+        "args": list(args),
+        "color": False,
+        "env": dict(os.environ),
+    }
+
+
+@pytest.mark.describe("🧪  HandleDaemonRequest")
+class TestHandleDaemonRequest:
+    @pytest.mark.it("✅  Should run add in the client directory and capture its output")
+    def test_runs_add_in_client_cwd(self, tmp_path: Path):
+        previous_cwd = Path.cwd()
+
+        response = handle_daemon_request(_request(tmp_path, "add", "entity", "customer"))
+
+        assert response["exit_code"] == 0
+        assert "Added entity successfully!" in response["stdout"]
+        assert (tmp_path / "entities" / "customer_entity.py").exists()
+        assert Path.cwd() == previous_cwd
+
+    @pytest.mark.it("✅  Should report command errors with their exit code")
+    def test_reports_errors(self, tmp_path: Path):
+        response = handle_daemon_request(_request(tmp_path, "add", "unknown", "customer"))
+
+        assert response["exit_code"] == 1
+        assert "Invalid element type." in response["stdout"]
+
+    @pytest.mark.it("❌  Should reject a request whose working directory does not exist")
+    def test_rejects_missing_cwd(self, tmp_path: Path):
+        response = handle_daemon_request(_request(tmp_path / "missing", "add", "entity", "x"))
+
+        assert response["exit_code"] == 1
+        assert "does not exist" in response["stderr"]
+
+    @pytest.mark.it("✅  Should run the command with the client environment")
+    def test_applies_client_environment(self, tmp_path: Path, monkeypatch):
+        seen_env = []
+        monkeypatch.setattr(
+            server, "_run_app", lambda *_, **__: seen_env.append(dict(os.environ)) or 0
+        )
+        previous_env = dict(os.environ)
+        client_env = {"NO_COLOR": "1", "FASTGEAR_CLI_CACHE_DIR": str(tmp_path / "cache")}
+
+        response = handle_daemon_request(
+            {**_request(tmp_path, "add", "entity", "customer"), "env": client_env}
+        )
+
+        assert response["exit_code"] == 0
+        assert seen_env == [client_env]
+        assert dict(os.environ) == previous_env
+
+    @pytest.mark.it("❌  Should reject a request without a valid environment")
+    def test_rejects_invalid_environment(self, tmp_path: Path):
+        response = handle_daemon_request(
+            {**_request(tmp_path, "add", "entity", "customer"), "env": {"NO_COLOR": 1}}
+        )
+
+        assert response["exit_code"] == 1
+        assert "env must map strings to strings" in response["stderr"]
+        assert not (tmp_path / "entities").exists()
+
+    @pytest.mark.it("❌  Should report unexpected command failures without raising")
+    def test_reports_unexpected_failures(self, tmp_path: Path):
+        (tmp_path / "blocker").write_text("", encoding="utf-8")
+
+        response = handle_daemon_request(
+            _request(tmp_path, "add", "module", "blocker", "--module-components", "entity")
+        )
+
+        assert response["exit_code"] == 1
+        assert "NotADirectoryError" in response["stderr"]
+
+    @pytest.mark.it("⚠️  Should ask the client to run in-process when a prompt is needed")
+    def test_falls_back_for_prompts(self, tmp_path: Path):
+        response = handle_daemon_request(_request(tmp_path, "add", "module", "billing"))
+
+        assert response == {"fallback": True}
+        assert not (tmp_path / "billing").exists()
+
+    @pytest.mark.it("⚠️  Should ask the client to run in-process for other versions and commands")
+    def test_falls_back_for_unsupported_requests(self, tmp_path: Path):
+        other_version = {**_request(tmp_path, "add", "entity", "customer"), "version": "0.0.0"}
+
+        assert handle_daemon_request(other_version) == {"fallback": True}
+        assert handle_daemon_request(_request(tmp_path, "init")) == {"fallback": True}
+
+
+@pytest.mark.describe("🧪  ServeDaemon")
+class TestServeDaemon:
+    @pytest.mark.it("✅  Should serve forwarded add commands over the socket")
+    def test_serves_forwarded_commands(self, running_daemon: Path, tmp_path: Path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        stdout = io.StringIO()
+
+        with redirect_stdout(stdout):
+            exit_code = forward_command(["add", "entity", "customer"])
+
+        assert exit_code == 0
+        assert "Added entity successfully!" in stdout.getvalue()
+        assert (tmp_path / "entities" / "customer_entity.py").exists()
+
+    @pytest.mark.it("✅  Should keep serving after a command fails")
+    def test_keeps_serving_after_failure(self, running_daemon: Path, tmp_path: Path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "blocker").write_text("", encoding="utf-8")
+
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            failed_exit_code = forward_command(
+                ["add", "module", "blocker", "--module-components", "entity"]
+            )
+            exit_code = forward_command(["add", "entity", "customer"])
+
+        assert failed_exit_code == 1
+        assert exit_code == 0
+        assert running_daemon.is_socket()
+
+    @pytest.mark.it("✅  Should keep serving when a client stalls before sending its request")
+    def test_drops_stalled_clients(self, running_daemon: Path, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(server, "DAEMON_REQUEST_TIMEOUT_SECONDS", 0.1)
+        monkeypatch.chdir(tmp_path)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled_client:
+            stalled_client.connect(str(running_daemon))
+            with redirect_stdout(io.StringIO()):
+                exit_code = forward_command(["add", "entity", "customer"])
+
+        assert exit_code == 0
+        assert (tmp_path / "entities" / "customer_entity.py").exists()
+
+    @pytest.mark.it("✅  Should only let the owner connect to the socket")
+    def test_restricts_socket_permissions(self, daemon_socket: Path):
+        socket_modes = []
+
+        def stop_when_ready() -> None:
+            socket_modes.append(stat.S_IMODE(daemon_socket.stat().st_mode))
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            serve_daemon(daemon_socket, on_ready=stop_when_ready)
+
+        assert socket_modes == [0o600]
+
+    @pytest.mark.it("✅  Should replace a stale socket left by a stopped daemon")
+    def test_replaces_stale_socket(self, daemon_socket: Path):
+        daemon_socket.touch()
+        bound_sockets = []
+
+        def stop_when_ready() -> None:
+            bound_sockets.append(daemon_socket.is_socket())
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            serve_daemon(daemon_socket, on_ready=stop_when_ready)
+
+        assert bound_sockets == [True]
+        assert not daemon_socket.exists()
+
+    @pytest.mark.it("❌  Should refuse to start when a daemon is already listening")
+    def test_refuses_second_daemon(self, running_daemon: Path):
+        with pytest.raises(FastgearCliError, match="already listening"):
+            serve_daemon(running_daemon)
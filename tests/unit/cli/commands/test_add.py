@@ -4,6 +4,7 @@ import pytest
 from typer.testing import CliRunner
 
 from fastgear_cli.cli.commands.add import add_app
+from fastgear_cli.core import formatting
 
 
 @pytest.fixture
@@ -55,13 +56,9 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.repository.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
-        mock_text = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.repository.questionary.text"
-        )
+        mock_text = mocker.patch("questionary.text")
 
         result = runner.invoke(add_app, ["repository", "invoice", "--path", str(temp_path)])
 
@@ -82,13 +79,9 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.repository.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = True
-        mock_text = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.repository.questionary.text"
-        )
+        mock_text = mocker.patch("questionary.text")
         mock_text.return_value.ask.return_value = (
             "src.modules.billing.entities.invoice_entity.Invoice"
         )
@@ -239,9 +232,7 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.service.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
         result = runner.invoke(add_app, ["service", "billing", "--path", str(temp_path)])
@@ -286,11 +277,9 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.service.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = True
-        mock_text = mocker.patch("fastgear_cli.cli.commands.helpers.add.service.questionary.text")
+        mock_text = mocker.patch("questionary.text")
         mock_text.return_value.ask.return_value = (
             "src.modules.billing.repositories.invoice_repository.InvoiceRepository"
         )
@@ -328,9 +317,7 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
         result = runner.invoke(add_app, ["controller", "billing", "--path", str(temp_path)])
@@ -385,13 +372,9 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = True
-        mock_text = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.text"
-        )
+        mock_text = mocker.patch("questionary.text")
         mock_text.return_value.ask.return_value = (
             "src.modules.billing.services.invoice_service.InvoiceService"
         )
@@ -429,9 +412,7 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
         existing_init = temp_path / "controllers/__init__.py"
@@ -455,9 +436,7 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
         module_path = temp_path / "modules" / "billing"
@@ -489,9 +468,7 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
         module_path = temp_path / "modules" / "billing"
@@ -864,13 +841,9 @@ class TestAddCommand:
         monkeypatch.chdir(temp_path)
         modules_root = temp_path / "src" / "modules"
 
-        mock_checkbox = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.module.questionary.checkbox"
-        )
+        mock_checkbox = mocker.patch("questionary.checkbox")
         mock_checkbox.return_value.ask.return_value = ["controller", "entity"]
-        mock_confirm = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.controller.questionary.confirm"
-        )
+        mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
         result = runner.invoke(add_app, ["module", "sales", "--path", str(modules_root)])
@@ -902,9 +875,7 @@ class TestAddCommand:
         temp_path: Path,
         mocker,
     ):
-        mock_checkbox = mocker.patch(
-            "fastgear_cli.cli.commands.helpers.add.module.questionary.checkbox"
-        )
+        mock_checkbox = mocker.patch("questionary.checkbox")
         mock_checkbox.return_value.ask.return_value = []
 
         result = runner.invoke(add_app, ["module", "sales", "--path", str(temp_path)])
@@ -928,3 +899,327 @@ class TestAddCommand:
 
         assert result.exit_code == 1
         assert "--module-components can only be used with element type module." in result.output
+
+    @pytest.mark.it("✅  Should format every touched file in a single ruff pass per command")
+    def test_formats_touched_files_in_single_ruff_pass(
+        self,
+        temp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mocker,
+    ):
+        monkeypatch.chdir(temp_path)
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        result = runner.invoke(
+            add_app,
+            [
+                "module",
+                "billing",
+                "--path",
+                str(temp_path / "src" / "modules"),
+                "--module-components",
+                "controller,service,repository,entity",
+            ],
+        )
+
+        assert result.exit_code == 0
+        ruff_commands = [call.args[0][3] for call in mock_run.call_args_list]
+        assert ruff_commands == ["check", "format"]
+
+    @pytest.mark.it("✅  Should write each touched __init__ file exactly once per command")
+    def test_writes_each_touched_init_once(
+        self,
+        temp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mocker,
+    ):
+        monkeypatch.chdir(temp_path)
+        mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+        mock_write = mocker.patch(
+            "fastgear_cli.core.formatting.write_text_if_changed",
+            wraps=formatting.write_text_if_changed,
+        )
+
+        result = runner.invoke(
+            add_app,
+            [
+                "module",
+                "billing",
+                "--path",
+                str(temp_path / "src" / "modules"),
+                "--module-components",
+                "controller,entity",
+            ],
+        )
+
+        assert result.exit_code == 0
+        written_files = [call.args[0] for call in mock_write.call_args_list]
+        assert len(written_files) == len(set(written_files))
+        assert temp_path / "src" / "modules" / "billing" / "__init__.py" in written_files
+
+    @pytest.mark.it("✅  Should report rendered files as created and merged files as updated")
+    def test_reports_created_and_updated_files(
+        self,
+        temp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(temp_path)
+        base_args = ["module", "billing", "--path", "src/modules", "--no-format"]
+        runner.invoke(add_app, [*base_args, "--module-components", "entity"])
+
+        result = runner.invoke(add_app, [*base_args, "--module-components", "controller,entity"])
+
+        assert result.exit_code == 0
+        created_report, updated_report = result.output.split("Updated files:")
+        assert "Created files:" in created_report
+        assert "billing_controller.py" in created_report
+        assert "__init__.py" in updated_report
+        assert "controllers" not in updated_report
+
+
+@pytest.fixture
+def spec_file(temp_path: Path) -> Path:
+    spec_path = temp_path / "spec.toml"
+    spec_path.write_text(
+        'path = "src/modules"\n'
+        "\n"
+        "[[modules]]\n"
+        'name = "Billing"\n'
+        'components = ["controller", "service", "repository", "entity"]\n'
+        "\n"
+        "[[modules]]\n"
+        'name = "audit-log"\n'
+        'components = "entity"\n'
+        "use_folders = false\n",
+        encoding="utf-8",
+    )
+    return spec_path
+
+
+@pytest.mark.describe("🧪  AddFromSpecCommand")
+class TestAddFromSpecCommand:
+    @pytest.mark.it("✅  Should create every module from the spec with a single ruff pass")
+    def test_creates_modules_from_spec(
+        self,
+        temp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mocker,
+    ):
+        monkeypatch.chdir(temp_path)
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        result = runner.invoke(add_app, ["--from", str(spec_file)])
+
+        assert result.exit_code == 0
+        assert "Added 2 module(s) from spec successfully!" in result.output
+        modules_root = temp_path / "src" / "modules"
+        assert (modules_root / "billing" / "controllers" / "billing_controller.py").exists()
+        assert (modules_root / "audit_log" / "audit_log_entity.py").exists()
+        assert "audit_log_entities = [AuditLog]" in (
+            modules_root / "audit_log" / "__init__.py"
+        ).read_text(encoding="utf-8")
+        ruff_commands = [call.args[0][3] for call in mock_run.call_args_list]
+        assert ruff_commands == ["check", "format"]
+
+    @pytest.mark.it("✅  Should print the aggregate plan without writing files in dry-run mode")
+    def test_prints_plan_in_dry_run(
+        self,
+        temp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(temp_path)
+
+        result = runner.invoke(add_app, ["--from", str(spec_file), "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "Modules to add: 2" in result.output
+        assert "src/modules/billing (folders): controller, service, repository, entity" in (
+            result.output
+        )
+        assert "src/modules/audit_log (flat): entity" in result.output
+        assert "Total: 11 file(s)" in result.output
+        assert not (temp_path / "src").exists()
+
+    @pytest.mark.it("⚠️  Should plan a repeated module the way the real run applies it")
+    def test_dry_run_skips_repeated_modules(
+        self,
+        temp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(temp_path)
+        (temp_path / "spec.toml").write_text(
+            'path = "src/modules"\n'
+            + "".join(
+                f'\n[[modules]]\nname = "{name}"\ncomponents = "entity"\n'
+                for name in ("customer", "invoice", "customer", "billing")
+            ),
+            encoding="utf-8",
+        )
+
+        plan = runner.invoke(add_app, ["--from", "spec.toml", "--dry-run", "--no-format"])
+        result = runner.invoke(add_app, ["--from", "spec.toml", "--no-format"])
+
+        assert plan.exit_code == 0
+        assert result.exit_code == 0
+        assert "Modules to add: 3" in plan.output
+        assert "Added 3 module(s) from spec successfully!" in result.output
+        skipped_message = "Skipped module customer: the content already exists."
+        assert skipped_message in plan.output
+        assert skipped_message in result.output
+
+    @pytest.mark.it("⚠️  Should skip modules that already exist and add the remaining ones")
+    def test_skips_existing_modules(
+        self,
+        temp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(temp_path)
+        runner.invoke(
+            add_app,
+            [
+                "module",
+                "billing",
+                "--path",
+                "src/modules",
+                "--module-components",
+                "controller,service,repository,entity",
+                "--no-format",
+            ],
+        )
+
+        result = runner.invoke(add_app, ["--from", str(spec_file), "--no-format"])
+
+        assert result.exit_code == 0
+        assert "Skipped module billing: the content already exists." in result.output
+        assert "Added 1 module(s) from spec successfully!" in result.output
+
+    @pytest.mark.it("✅  Should produce the same tree with worker processes as serially")
+    def test_parallel_matches_serial(
+        self,
+        temp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        spec_text = 'path = "src/modules"\n' + "".join(
+            f'\n[[modules]]\nname = "{name}"\n' for name in ("billing", "invoice", "audit_log")
+        )
+        trees = {}
+        for jobs in ("1", "2"):
+            project_dir = temp_path / f"jobs_{jobs}"
+            project_dir.mkdir()
+            (project_dir / "spec.toml").write_text(spec_text, encoding="utf-8")
+            monkeypatch.chdir(project_dir)
+
+            result = runner.invoke(
+                add_app,
+                ["--from", "spec.toml", "--jobs", jobs, "--no-format"],
+            )
+
+            assert result.exit_code == 0
+            assert "Added 3 module(s) from spec successfully!" in result.output
+            trees[jobs] = {
+                file_path.relative_to(project_dir): file_path.read_bytes()
+                for file_path in project_dir.rglob("*")
+                if file_path.is_file()
+            }
+
+        assert trees["2"] == trees["1"]
+
+    @pytest.mark.it("✅  Should let --path and --use-folders override the spec file defaults")
+    def test_cli_options_override_spec_defaults(
+        self,
+        temp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(temp_path)
+
+        result = runner.invoke(
+            add_app,
+            ["--from", str(spec_file), "--path", "app", "--no-use-folders", "--dry-run"],
+        )
+
+        assert result.exit_code == 0
+        assert "app/billing (flat): controller, service, repository, entity" in result.output
+        assert "app/audit_log (flat): entity" in result.output
+
+    @pytest.mark.it(
+        "✅  Should print the plan when --path does not start with the working directory"
+    )
+    def test_prints_plan_for_symlinked_path(
+        self,
+        temp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        project_link = temp_path.parent / f"{temp_path.name}_link"
+        project_link.symlink_to(temp_path, target_is_directory=True)
+        monkeypatch.chdir(temp_path)
+
+        result = runner.invoke(
+            add_app,
+            ["--from", str(spec_file), "--path", str(project_link / "app"), "--dry-run"],
+        )
+
+        assert result.exit_code == 0
+        assert "app/billing (folders): controller, service, repository, entity" in result.output
+        assert "Total: 11 file(s)" in result.output
+        assert not (temp_path / "app").exists()
+
+    @pytest.mark.it("❌  Should fail when --from is combined with per-element options")
+    @pytest.mark.parametrize(
+        "option",
+        [
+            ["--entity-path", "src.entities.Invoice"],
+            ["--repository-path", "src.repositories.InvoiceRepository"],
+            ["--service-path", "src.services.InvoiceService"],
+            ["--module-components", "entity"],
+        ],
+    )
+    def test_fails_when_combined_with_element_options(
+        self,
+        temp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        option: list[str],
+    ):
+        monkeypatch.chdir(temp_path)
+
+        result = runner.invoke(add_app, ["--from", str(spec_file), *option])
+
+        assert result.exit_code == 1
+        assert f"--from cannot be combined with {option[0]}" in result.output
+
+    @pytest.mark.it("❌  Should fail when --jobs is used without a spec")
+    def test_fails_when_jobs_used_without_spec(self):
+        result = runner.invoke(add_app, ["module", "billing", "--jobs", "2"])
+
+        assert result.exit_code == 1
+        assert "--jobs can only be used with --from." in result.output
+
+    @pytest.mark.it("❌  Should fail when --from is combined with an element type")
+    def test_fails_when_combined_with_element(self, spec_file: Path):
+        result = runner.invoke(add_app, ["module", "billing", "--from", str(spec_file)])
+
+        assert result.exit_code == 1
+        assert "--from cannot be combined with an element type or name." in result.output
+
+    @pytest.mark.it("❌  Should fail when neither an element nor a spec is given")
+    def test_fails_without_element_or_spec(self):
+        result = runner.invoke(add_app, [])
+
+        assert result.exit_code == 1
+        assert "Element type and name are required unless --from is used." in result.output
+
+    @pytest.mark.it("❌  Should report invalid spec entries")
+    def test_fails_with_invalid_spec(self, temp_path: Path):
+        spec_path = temp_path / "spec.toml"
+        spec_path.write_text('[[modules]]\nname = "billing"\ncomponents = ["module"]\n')
+
+        result = runner.invoke(add_app, ["--from", str(spec_path)])
+
+        assert result.exit_code == 1
+        assert f"Invalid spec file {spec_path}:" in result.output
+        assert "modules.0.components" in result.output
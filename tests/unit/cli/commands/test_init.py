@@ -1,4 +1,3 @@
-import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -6,6 +5,8 @@ import pytest
 from typer.testing import CliRunner
 
 from fastgear_cli.cli.commands.init import init_app
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
+from fastgear_cli.core.filesystem import create_template
 
 pytest_plugins = ["tests.fixtures.cli.commands.init_fixtures"]
 
@@ -21,6 +22,20 @@ def _mock_questionary_confirm(mocker: MagicMock, return_value: bool) -> MagicMoc
     )
 
 
+def _mock_uv_lock_process(
+    mocker: MagicMock,
+    returncode: int = 0,
+    stderr: str = "",
+) -> MagicMock:
+    mock_process = MagicMock()
+    mock_process.communicate.return_value = ("", stderr)
+    mock_process.returncode = returncode
+    return mocker.patch(
+        "fastgear_cli.core.uv_lock.subprocess.Popen",
+        return_value=mock_process,
+    )
+
+
 def _mock_ask_database_provider(mocker: MagicMock, return_value: str | None) -> MagicMock:
     return mocker.patch(
         "fastgear_cli.cli.commands.init.ask_database_provider",
@@ -51,7 +66,7 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mock_create = mocker.patch("fastgear_cli.cli.commands.init.create_template")
-        mocker.patch("fastgear_cli.cli.commands.init.subprocess.run")
+        _mock_uv_lock_process(mocker)
 
         result = runner.invoke(init_app, [str(temp_directory)])
 
@@ -85,7 +100,7 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mock_create = mocker.patch("fastgear_cli.cli.commands.init.create_template")
-        mocker.patch("fastgear_cli.cli.commands.init.subprocess.run")
+        _mock_uv_lock_process(mocker)
 
         result = runner.invoke(init_app, [str(custom_dir)])
 
@@ -114,7 +129,7 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mock_create = mocker.patch("fastgear_cli.cli.commands.init.create_template")
-        mocker.patch("fastgear_cli.cli.commands.init.subprocess.run")
+        _mock_uv_lock_process(mocker)
 
         result = runner.invoke(init_app, [str(temp_directory)])
 
@@ -174,13 +189,13 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mocker.patch("fastgear_cli.cli.commands.init.create_template")
-        mock_subprocess = mocker.patch("fastgear_cli.cli.commands.init.subprocess.run")
+        mock_popen = _mock_uv_lock_process(mocker)
 
         result = runner.invoke(init_app, [str(temp_directory)])
 
         assert result.exit_code == 0
-        mock_subprocess.assert_called_once()
-        call_args = mock_subprocess.call_args
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args
         assert call_args[0][0] == ["uv", "lock"]
         assert "Generating uv.lock" in result.output
 
@@ -205,10 +220,7 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mocker.patch("fastgear_cli.cli.commands.init.create_template")
-        mocker.patch(
-            "fastgear_cli.cli.commands.init.subprocess.run",
-            side_effect=subprocess.CalledProcessError(1, "uv lock", stderr="error"),
-        )
+        _mock_uv_lock_process(mocker, returncode=1, stderr="error")
 
         result = runner.invoke(init_app, [str(temp_directory)])
 
@@ -237,7 +249,7 @@ class TestInitCommand:
         _mock_ask_database_provider(mocker, return_value=None)
         mocker.patch("fastgear_cli.cli.commands.init.create_template")
         mocker.patch(
-            "fastgear_cli.cli.commands.init.subprocess.run",
+            "fastgear_cli.core.uv_lock.subprocess.Popen",
             side_effect=FileNotFoundError,
         )
 
@@ -267,7 +279,7 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mocker.patch("fastgear_cli.cli.commands.init.create_template")
-        mocker.patch("fastgear_cli.cli.commands.init.subprocess.run")
+        _mock_uv_lock_process(mocker)
 
         result = runner.invoke(init_app, [str(temp_directory)])
 
@@ -334,12 +346,12 @@ class TestInitCommand:
         mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
         _mock_ask_database_provider(mocker, return_value=None)
         mocker.patch("fastgear_cli.cli.commands.init.create_template", return_value=[])
-        mock_subprocess = mocker.patch("fastgear_cli.cli.commands.init.subprocess.run")
+        mock_popen = _mock_uv_lock_process(mocker)
 
         result = runner.invoke(init_app, [str(temp_directory), "--dry-run"])
 
         assert result.exit_code == 0
-        mock_subprocess.assert_not_called()
+        mock_popen.assert_not_called()
         assert "Generating uv.lock" not in result.output
 
     @pytest.mark.it("✅  Should pass dry_run=True to create_template")
@@ -371,3 +383,119 @@ class TestInitCommand:
 
         call_kwargs = mock_create.call_args.kwargs
         assert call_kwargs["dry_run"] is True
+
+    @pytest.mark.it("✅  Should start uv lock while the remaining files are still being written")
+    def test_starts_uv_lock_during_generation(
+        self,
+        mocker: MagicMock,
+        temp_directory: Path,
+        project_name: str,
+        project_title: str,
+    ):
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.ask_project_name",
+            return_value=project_name,
+        )
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.confirm_project_title",
+            return_value=project_title,
+        )
+        _mock_questionary_confirm(mocker, return_value=True)
+        mocker.patch("fastgear_cli.cli.commands.init.ask_agent_tools", return_value=[])
+        mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
+        _mock_ask_database_provider(mocker, return_value=None)
+        project_dir = temp_directory / project_name
+        generated_files: list[Path] = []
+        generate_project = mocker.patch(
+            "fastgear_cli.cli.commands.init.create_template",
+            side_effect=lambda *args, **kwargs: (
+                generated_files.extend(create_template(*args, **kwargs)) or generated_files
+            ),
+        )
+        files_at_start: list[Path] = []
+        generated_files_at_start: list[Path] = []
+        mock_popen = _mock_uv_lock_process(mocker)
+        mock_popen.side_effect = lambda *_args, **_kwargs: (
+            files_at_start.extend(path for path in project_dir.rglob("*") if path.is_file())
+            or generated_files_at_start.extend(generated_files)
+            or mock_popen.return_value
+        )
+
+        result = runner.invoke(init_app, [str(temp_directory)])
+
+        assert result.exit_code == 0
+        generate_project.assert_called_once()
+        mock_popen.assert_called_once()
+        assert project_dir / "pyproject.toml" in files_at_start
+        assert not generated_files_at_start
+        assert generated_files
+
+    @pytest.mark.it("❌  Should cancel uv lock when project generation fails")
+    def test_cancels_uv_lock_when_generation_fails(
+        self,
+        mocker: MagicMock,
+        temp_directory: Path,
+        project_name: str,
+        project_title: str,
+    ):
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.ask_project_name",
+            return_value=project_name,
+        )
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.confirm_project_title",
+            return_value=project_title,
+        )
+        _mock_questionary_confirm(mocker, return_value=True)
+        mocker.patch("fastgear_cli.cli.commands.init.ask_agent_tools", return_value=[])
+        mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
+        _mock_ask_database_provider(mocker, return_value=None)
+        project_dir = temp_directory / project_name
+
+        def write_pyproject_then_fail(*_args, on_file_written, **_kwargs):
+            on_file_written(project_dir / "pyproject.toml")
+            raise FileExistsError
+
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.create_template",
+            side_effect=write_pyproject_then_fail,
+        )
+        mock_popen = _mock_uv_lock_process(mocker)
+        mock_popen.return_value.poll.return_value = None
+
+        result = runner.invoke(init_app, [str(temp_directory)])
+
+        assert result.exit_code == 1
+        assert "already exists" in result.output
+        mock_popen.return_value.terminate.assert_called_once()
+        assert "created successfully" not in result.output
+
+    @pytest.mark.it("✅  Should pass the static copy mode to create_template")
+    def test_passes_static_copy_mode_to_create_template(
+        self,
+        mocker: MagicMock,
+        temp_directory: Path,
+        project_name: str,
+        project_title: str,
+    ):
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.ask_project_name",
+            return_value=project_name,
+        )
+        mocker.patch(
+            "fastgear_cli.cli.commands.init.confirm_project_title",
+            return_value=project_title,
+        )
+        _mock_questionary_confirm(mocker, return_value=True)
+        mocker.patch("fastgear_cli.cli.commands.init.ask_agent_tools", return_value=[])
+        mocker.patch("fastgear_cli.cli.commands.init.ask_ci_provider", return_value=None)
+        _mock_ask_database_provider(mocker, return_value=None)
+        mock_create = mocker.patch("fastgear_cli.cli.commands.init.create_template")
+        _mock_uv_lock_process(mocker)
+
+        result = runner.invoke(init_app, [str(temp_directory), "--static-copy-mode", "hardlink"])
+
+        assert result.exit_code == 0
+        call_kwargs = mock_create.call_args.kwargs
+        assert call_kwargs["static_copy_mode"] == StaticCopyModeEnum.HARDLINK
+        assert call_kwargs["use_cache"] is True
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from typer.testing import CliRunner
 
@@ -6,6 +10,25 @@ from fastgear_cli.cli.app import app
 
 runner = CliRunner()
 
+EAGER_MODULES = (
+    "fastgear_cli.cli.commands.add",
+    "fastgear_cli.cli.commands.init",
+    "jinja2",
+    "pydantic",
+    "questionary",
+)
+
+
+def _loaded_modules_after(code: str) -> set[str]:
+    script = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.splitlines())
+
 
 @pytest.mark.describe("🧪  App")
 class TestApp:
@@ -22,3 +45,57 @@ class TestApp:
 
         assert result.exit_code == 0
         assert f"v{__version__}" in result.output
+
+    @pytest.mark.it("✅  Should list every command in --help")
+    def test_help_lists_commands(self):
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "init" in result.output
+        assert "add" in result.output
+        assert "daemon" in result.output
+
+    @pytest.mark.it("✅  Should dispatch lazily loaded commands")
+    def test_dispatches_lazy_commands(self, tmp_path: Path):
+        result = runner.invoke(app, ["add", "entity", "customer", "--path", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "entities" / "customer_entity.py").exists()
+
+    @pytest.mark.it("✅  Should fail for unknown commands")
+    def test_fails_for_unknown_commands(self):
+        result = runner.invoke(app, ["unknown"])
+
+        assert result.exit_code != 0
+        assert "No such command" in result.output
+
+    @pytest.mark.it("✅  Should not import command modules when the app is imported")
+    def test_does_not_import_commands_on_import(self):
+        loaded_modules = _loaded_modules_after("import fastgear_cli.cli.app")
+
+        assert loaded_modules.isdisjoint(EAGER_MODULES)
+
+    @pytest.mark.it("✅  Should not import command modules to render --help")
+    def test_does_not_import_commands_for_help(self):
+        loaded_modules = _loaded_modules_after(
+            "from fastgear_cli.cli.app import app\n"
+            "try:\n"
+            "    app(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+
+        assert loaded_modules.isdisjoint(EAGER_MODULES)
+
+    @pytest.mark.it("✅  Should not import questionary for non-interactive add commands")
+    def test_does_not_import_questionary_for_non_interactive_add(self, tmp_path: Path):
+        loaded_modules = _loaded_modules_after(
+            "from fastgear_cli.cli.app import app\n"
+            "try:\n"
+            f"    app(['add', 'entity', 'customer', '--path', {str(tmp_path)!r}])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+
+        assert "fastgear_cli.cli.commands.add" in loaded_modules
+        assert "questionary" not in loaded_modules
@@ -0,0 +1,46 @@
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.cli import client
+from fastgear_cli.cli.client import forward_command
+
+pytest_plugins = ["tests.fixtures.cli.commands.daemon_fixtures"]
+
+
+@pytest.mark.describe("🧪  Client")
+class TestClient:
+    @pytest.mark.it("✅  Should run in-process when no daemon is listening")
+    def test_falls_back_without_daemon(self, daemon_socket: Path):
+        assert forward_command(["add", "entity", "customer"]) is None
+
+    @pytest.mark.it("✅  Should run in-process when the daemon does not accept the request in time")
+    def test_falls_back_when_daemon_is_busy(self, daemon_socket: Path, monkeypatch):
+        monkeypatch.setattr(client, "DAEMON_READY_TIMEOUT_SECONDS", 0.1)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as busy_daemon:
+            busy_daemon.bind(str(daemon_socket))
+            busy_daemon.listen()
+
+            assert forward_command(["add", "entity", "customer"]) is None
+
+    @pytest.mark.it("✅  Should only forward add commands")
+    def test_does_not_forward_other_commands(self, running_daemon: Path):
+        assert forward_command(["init"]) is None
+        assert forward_command(["daemon", "--stop"]) is None
+        assert forward_command([]) is None
+
+    @pytest.mark.it("✅  Should not import typer when forwarding")
+    def test_does_not_import_typer(self):
+        script = "import sys\nimport fastgear_cli.cli.client\nprint('\\n'.join(sys.modules))"
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+        assert "typer" not in result.stdout.splitlines()
@@ -0,0 +1,35 @@
+import pytest
+from pydantic import ValidationError
+
+from fastgear_cli.core.constants.enums import ElementTypeEnum
+from fastgear_cli.core.models import AddSpecConfig, ModuleSpecConfig
+
+
+@pytest.mark.describe("🧪  AddSpecConfig")
+class TestAddSpecConfig:
+    @pytest.mark.it("✅  Should default module components to every component")
+    def test_defaults_to_every_component(self):
+        module_spec = ModuleSpecConfig(name="billing")
+
+        assert module_spec.module_components == "controller,service,repository,entity"
+
+    @pytest.mark.it("✅  Should accept comma-separated components")
+    def test_accepts_comma_separated_components(self):
+        module_spec = ModuleSpecConfig(name="billing", components=" Controller, entity ")
+
+        assert module_spec.components == [ElementTypeEnum.CONTROLLER, ElementTypeEnum.ENTITY]
+
+    @pytest.mark.it("❌  Should reject module as a module component")
+    def test_rejects_module_component(self):
+        with pytest.raises(ValidationError):
+            ModuleSpecConfig(name="billing", components=["module"])
+
+    @pytest.mark.it("❌  Should reject unknown keys")
+    def test_rejects_unknown_keys(self):
+        with pytest.raises(ValidationError):
+            AddSpecConfig.model_validate({"modules": [{"name": "billing", "folders": True}]})
+
+    @pytest.mark.it("❌  Should require at least one module")
+    def test_requires_modules(self):
+        with pytest.raises(ValidationError):
+            AddSpecConfig.model_validate({"modules": []})
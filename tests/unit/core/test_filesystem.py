@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
 from fastgear_cli.core.exceptions import TemplateConflictError
 from fastgear_cli.core.filesystem import create_template
 
@@ -278,3 +279,112 @@ class TestCreateProjectIntegration:
         project_dir = output_directory / "my-project"
         assert (project_dir / "README.md").exists()
         assert (project_dir / "OPTIONAL.md").exists()
+
+    @pytest.mark.it("✅  Should notify each written file")
+    def test_notifies_each_written_file(
+        self,
+        mocker: MagicMock,
+        template_with_files: Path,
+        output_directory: Path,
+        sample_context: dict,
+    ):
+        mocker.patch(
+            "fastgear_cli.core.filesystem.ROOT_DIR",
+            template_with_files.parent.parent,
+        )
+        written_files: list[Path] = []
+
+        files = create_template(
+            "test_template",
+            output_directory,
+            sample_context,
+            on_file_written=written_files.append,
+        )
+
+        assert sorted(written_files) == sorted(files)
+
+    @pytest.mark.it("✅  Should not notify written files in dry-run mode")
+    def test_does_not_notify_in_dry_run(
+        self,
+        mocker: MagicMock,
+        template_with_files: Path,
+        output_directory: Path,
+        sample_context: dict,
+    ):
+        mocker.patch(
+            "fastgear_cli.core.filesystem.ROOT_DIR",
+            template_with_files.parent.parent,
+        )
+        on_file_written = MagicMock()
+
+        create_template(
+            "test_template",
+            output_directory,
+            sample_context,
+            dry_run=True,
+            on_file_written=on_file_written,
+        )
+
+        on_file_written.assert_not_called()
+
+    @pytest.mark.it("✅  Should use the rendered tree cache when requested")
+    def test_uses_render_cache_when_requested(
+        self,
+        mocker: MagicMock,
+        output_directory: Path,
+        sample_context: dict,
+    ):
+        mock_render = mocker.patch("fastgear_cli.core.filesystem.render_template")
+        mock_cached = mocker.patch(
+            "fastgear_cli.core.filesystem.render_template_cached",
+            return_value=[output_directory / "README.md"],
+        )
+
+        create_template("new_project", output_directory, sample_context, use_cache=True)
+
+        mock_cached.assert_called_once()
+        mock_render.assert_not_called()
+
+    @pytest.mark.it("✅  Should not use the rendered tree cache in dry-run mode")
+    def test_does_not_use_render_cache_in_dry_run(
+        self,
+        mocker: MagicMock,
+        output_directory: Path,
+        sample_context: dict,
+    ):
+        mock_render = mocker.patch(
+            "fastgear_cli.core.filesystem.render_template",
+            return_value=[output_directory / "README.md"],
+        )
+        mock_cached = mocker.patch("fastgear_cli.core.filesystem.render_template_cached")
+
+        create_template(
+            "new_project", output_directory, sample_context, dry_run=True, use_cache=True
+        )
+
+        mock_cached.assert_not_called()
+        mock_render.assert_called_once()
+
+    @pytest.mark.it("✅  Should hardlink static files when requested")
+    def test_hardlinks_static_files(
+        self,
+        mocker: MagicMock,
+        template_with_files: Path,
+        output_directory: Path,
+        sample_context: dict,
+    ):
+        mocker.patch(
+            "fastgear_cli.core.filesystem.ROOT_DIR",
+            template_with_files.parent.parent,
+        )
+
+        create_template(
+            "test_template",
+            output_directory,
+            sample_context,
+            static_copy_mode=StaticCopyModeEnum.HARDLINK,
+        )
+
+        static_source = template_with_files / "{{project_name}}" / "config.txt"
+        static_output = output_directory / "my-project" / "config.txt"
+        assert static_output.stat().st_ino == static_source.stat().st_ino
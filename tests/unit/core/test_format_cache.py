@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core.format_cache import (
+    build_format_cache_key,
+    load_formatted_source,
+    store_formatted_source,
+)
+
+
+@pytest.mark.describe("🧪  FormatCache")
+class TestFormatCache:
+    @pytest.mark.it("✅  Should return the stored formatted source for the same key")
+    def test_round_trips_formatted_source(self):
+        cache_key = build_format_cache_key("x=1\n", "pkg/__init__.py", [])
+
+        store_formatted_source(cache_key, "x = 1\n")
+
+        assert load_formatted_source(cache_key) == "x = 1\n"
+
+    @pytest.mark.it("✅  Should change the key with the content, file, ruff configs and layout")
+    def test_key_depends_on_inputs(self, tmp_path: Path):
+        config_path = tmp_path / "ruff.toml"
+        config_path.write_text('extend = "base.toml"\n')
+        base_config_path = tmp_path / "base.toml"
+        base_config_path.write_text("line-length = 100\n")
+        config_paths = [config_path, base_config_path]
+        base_key = build_format_cache_key("x=1\n", "pkg/__init__.py", config_paths, {"src"})
+
+        other_content_key = build_format_cache_key(
+            "x=2\n", "pkg/__init__.py", config_paths, {"src"}
+        )
+        other_file_key = build_format_cache_key("x=1\n", "other/__init__.py", config_paths, {"src"})
+        other_layout_key = build_format_cache_key("x=1\n", "pkg/__init__.py", config_paths, {"app"})
+        base_config_path.write_text("line-length = 80\n")
+        other_config_key = build_format_cache_key("x=1\n", "pkg/__init__.py", config_paths, {"src"})
+
+        assert (
+            len({base_key, other_content_key, other_file_key, other_layout_key, other_config_key})
+            == 5
+        )
+
+    @pytest.mark.it("⚠️  Should disable caching when the ruff version is unknown")
+    def test_disables_cache_without_ruff_version(self, mocker: MagicMock):
+        mocker.patch("fastgear_cli.core.format_cache.get_ruff_version", return_value=None)
+
+        assert build_format_cache_key("x=1\n", "pkg/__init__.py", []) is None
+
+    @pytest.mark.it("✅  Should evict the least recently used entries above the size bound")
+    def test_evicts_least_recently_used_entries(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        isolated_format_cache_dir: Path,
+    ):
+        monkeypatch.setattr("fastgear_cli.core.format_cache.FORMAT_CACHE_MAX_ENTRIES", 2)
+        keys = [build_format_cache_key(f"x={index}\n", "a.py", []) for index in range(3)]
+        for index, cache_key in enumerate(keys[:2]):
+            store_formatted_source(cache_key, f"x = {index}\n")
+            cache_path = next(isolated_format_cache_dir.glob(f"{cache_key}*"))
+            os.utime(cache_path, ns=(index * 1_000_000_000, index * 1_000_000_000))
+
+        load_formatted_source(keys[0])
+        store_formatted_source(keys[2], "x = 2\n")
+
+        assert load_formatted_source(keys[0]) == "x = 0\n"
+        assert load_formatted_source(keys[1]) is None
+        assert load_formatted_source(keys[2]) == "x = 2\n"
@@ -0,0 +1,396 @@
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core.formatting import (
+    format_python_source,
+    formatting_batch,
+    get_ruff_config_chain,
+    get_ruff_first_party_modules,
+    get_ruff_line_length,
+    read_python_file,
+    write_python_file,
+)
+
+pytest_plugins = ["tests.fixtures.core.formatting_fixtures"]
+
+
+def _ruff_arguments(mock_run: MagicMock) -> list[list[str]]:
+    return [call.args[0][3:] for call in mock_run.call_args_list]
+
+
+def _mock_ruff_stdout(mocker: MagicMock) -> MagicMock:
+    return mocker.patch(
+        "fastgear_cli.core.formatting.subprocess.run",
+        side_effect=lambda *_args, **kwargs: subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=kwargs.get("input")
+        ),
+    )
+
+
+@pytest.mark.describe("🧪  FormatPythonSource")
+class TestFormatPythonSource:
+    @pytest.mark.it("✅  Should pipe the content through ruff check and format via stdin")
+    def test_pipes_content_through_ruff_stdin(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mock_run = _mock_ruff_stdout(mocker)
+
+        result = format_python_source("x = 1\n", python_files[0], project_dir)
+
+        stdin_arguments = ["--stdin-filename", str(python_files[0].resolve()), "-"]
+        assert result == "x = 1\n"
+        assert _ruff_arguments(mock_run) == [
+            ["check", "--fix", *stdin_arguments],
+            ["format", *stdin_arguments],
+        ]
+        assert mock_run.call_args.kwargs["cwd"] == project_dir.resolve()
+
+    @pytest.mark.it("✅  Should reuse a cached result without spawning ruff again")
+    def test_reuses_cached_result(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mock_run = _mock_ruff_stdout(mocker)
+
+        first = format_python_source("x = 1\n", python_files[0], project_dir)
+        second = format_python_source("x = 1\n", python_files[0], project_dir)
+
+        assert first == second == "x = 1\n"
+        assert mock_run.call_count == 2
+
+    @pytest.mark.it("⚠️  Should keep the fixed content and skip formatting when check fails")
+    def test_keeps_fixed_content_when_check_fails(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mock_run = mocker.patch(
+            "fastgear_cli.core.formatting.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "ruff", output="fixed\n", stderr="boom"),
+        )
+        mock_secho = mocker.patch("fastgear_cli.core.formatting.typer.secho")
+
+        result = format_python_source("x = 1\n", python_files[0], project_dir)
+
+        assert result == "fixed\n"
+        assert mock_run.call_count == 1
+        assert "Failed to apply ruff rules to '__init__.py': boom" in mock_secho.call_args[0][0]
+
+    @pytest.mark.it("⚠️  Should return the content unchanged when ruff cannot be executed")
+    def test_returns_content_when_ruff_is_missing(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mocker.patch("fastgear_cli.core.formatting.subprocess.run", side_effect=FileNotFoundError)
+        mock_secho = mocker.patch("fastgear_cli.core.formatting.typer.secho")
+
+        result = format_python_source("x = 1\n", python_files[0], project_dir)
+
+        assert result == "x = 1\n"
+        assert "ruff not found" in mock_secho.call_args[0][0]
+
+    @pytest.mark.it("✅  Should apply the project ruff configuration")
+    def test_applies_project_configuration(
+        self,
+        project_dir: Path,
+        python_files: list[Path],
+        unformatted_content: str,
+        formatted_content: str,
+    ):
+        result = format_python_source(unformatted_content, python_files[0], project_dir)
+
+        assert result == formatted_content
+
+
+@pytest.mark.describe("🧪  WritePythonFile")
+class TestWritePythonFile:
+    @pytest.mark.it("✅  Should write the formatted content outside a batch")
+    def test_writes_formatted_content(
+        self,
+        project_dir: Path,
+        python_files: list[Path],
+        unformatted_content: str,
+        formatted_content: str,
+    ):
+        write_python_file(python_files[0], unformatted_content, project_dir)
+
+        assert python_files[0].read_text(encoding="utf-8") == formatted_content
+
+
+@pytest.mark.describe("🧪  ReadPythonFile")
+class TestReadPythonFile:
+    @pytest.mark.it("✅  Should return None when the file does not exist")
+    def test_returns_none_for_missing_file(self, python_files: list[Path]):
+        assert read_python_file(python_files[0]) is None
+
+    @pytest.mark.it("✅  Should return the pending content inside a batch")
+    def test_returns_pending_content_inside_batch(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        with formatting_batch():
+            write_python_file(python_files[0], "x = 1\n", project_dir)
+
+            assert read_python_file(python_files[0]) == "x = 1\n"
+            assert not python_files[0].exists()
+
+
+@pytest.mark.describe("🧪  FormattingBatch")
+class TestFormattingBatch:
+    @pytest.mark.it("✅  Should write each file once with a single ruff pass on exit")
+    def test_writes_once_with_single_ruff_pass(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        with formatting_batch() as queue:
+            for file_path in python_files:
+                write_python_file(file_path, "x = 1\n", project_dir)
+            write_python_file(python_files[0], "x = 2\n", project_dir)
+            assert len(queue) == 2
+            mock_run.assert_not_called()
+
+        assert [arguments[0] for arguments in _ruff_arguments(mock_run)] == ["check", "format"]
+        assert python_files[0].read_text(encoding="utf-8") == "x = 2\n"
+        assert python_files[1].read_text(encoding="utf-8") == "x = 1\n"
+
+    @pytest.mark.it("✅  Should leave files whose formatted content is unchanged untouched")
+    def test_skips_unchanged_files(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+        python_files[0].parent.mkdir(parents=True, exist_ok=True)
+        python_files[0].write_text("x = 1\n", encoding="utf-8")
+        mtime_ns = python_files[0].stat().st_mtime_ns - 1_000_000
+        os.utime(python_files[0], ns=(mtime_ns, mtime_ns))
+
+        with formatting_batch() as queue:
+            for file_path in python_files:
+                write_python_file(file_path, "x = 1\n", project_dir)
+
+        assert queue.unchanged_files == [python_files[0].resolve()]
+        assert queue.written_files == [python_files[1].resolve()]
+        assert queue.created_files == [python_files[1].resolve()]
+        assert python_files[0].stat().st_mtime_ns == mtime_ns
+
+    @pytest.mark.it("✅  Should only send files missing from the format cache to ruff")
+    def test_formats_only_uncached_files(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        for file_path in python_files:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+        with formatting_batch():
+            write_python_file(python_files[0], "x = 1\n", project_dir)
+        mock_run.reset_mock()
+
+        with formatting_batch():
+            write_python_file(python_files[0], "x = 1\n", project_dir)
+            write_python_file(python_files[1], "x = 1\n", project_dir)
+
+        format_arguments = _ruff_arguments(mock_run)[-1]
+        assert format_arguments[0] == "format"
+        assert format_arguments[-1].endswith("entities/__init__.py")
+        assert not any("controllers" in argument for argument in format_arguments)
+
+    @pytest.mark.it("✅  Should join an already active batch when nested")
+    def test_joins_active_batch_when_nested(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        with formatting_batch() as outer_queue:
+            with formatting_batch() as inner_queue:
+                write_python_file(python_files[0], "x = 1\n", project_dir)
+            assert inner_queue is outer_queue
+            assert not python_files[0].exists()
+            write_python_file(python_files[1], "x = 1\n", project_dir)
+
+        assert mock_run.call_count == 2
+
+    @pytest.mark.it("⚠️  Should report failures per file and format the remaining ones")
+    def test_reports_failures_per_file(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        def run(command: list[str], **_kwargs) -> subprocess.CompletedProcess:
+            if command[3] == "check" and any("controllers" in part for part in command):
+                raise subprocess.CalledProcessError(1, command, stderr="E999 controllers")
+            return subprocess.CompletedProcess(args=command, returncode=0, stdout="")
+
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run", side_effect=run)
+        mock_secho = mocker.patch("fastgear_cli.core.formatting.typer.secho")
+
+        with formatting_batch():
+            for file_path in python_files:
+                write_python_file(file_path, "x = 1\n", project_dir)
+
+        format_arguments = _ruff_arguments(mock_run)[-1]
+        assert format_arguments[0] == "format"
+        assert format_arguments[-1].endswith("entities/__init__.py")
+        mock_secho.assert_called_once()
+        assert "E999 controllers" in mock_secho.call_args[0][0]
+        assert python_files[0].read_text(encoding="utf-8") == "x = 1\n"
+
+    @pytest.mark.it("❌  Should discard pending files without running ruff when the command fails")
+    def test_discards_when_command_fails(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        def fail_after_writing() -> None:
+            with formatting_batch():
+                write_python_file(python_files[0], "x = 1\n", project_dir)
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            fail_after_writing()
+
+        assert not python_files[0].exists()
+        mock_run.assert_not_called()
+
+    @pytest.mark.it("✅  Should format pending files with the project configuration")
+    def test_formats_with_project_configuration(
+        self,
+        project_dir: Path,
+        python_files: list[Path],
+        unformatted_content: str,
+        formatted_content: str,
+    ):
+        with formatting_batch():
+            for file_path in python_files:
+                write_python_file(file_path, unformatted_content, project_dir)
+
+        for file_path in python_files:
+            assert file_path.read_text(encoding="utf-8") == formatted_content
+
+    @pytest.mark.it("✅  Should format pending files with a configuration extending another")
+    def test_formats_with_extended_configuration(
+        self,
+        project_dir: Path,
+        python_files: list[Path],
+        unformatted_content: str,
+        formatted_content: str,
+    ):
+        (project_dir.parent / "base.toml").write_text("line-length = 30\n", encoding="utf-8")
+        (project_dir / "pyproject.toml").write_text(
+            '[tool.ruff]\nextend = "../base.toml"\n',
+            encoding="utf-8",
+        )
+
+        with formatting_batch():
+            for file_path in python_files:
+                write_python_file(file_path, unformatted_content, project_dir)
+
+        for file_path in python_files:
+            assert file_path.read_text(encoding="utf-8") == formatted_content
+
+    @pytest.mark.it("✅  Should write pending files as-is without ruff when formatting is off")
+    def test_skips_ruff_when_formatting_is_off(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+        unformatted_content: str,
+    ):
+        mock_run = mocker.patch("fastgear_cli.core.formatting.subprocess.run")
+
+        with formatting_batch(format_files=False) as queue:
+            write_python_file(python_files[0], unformatted_content, project_dir)
+
+        mock_run.assert_not_called()
+        assert queue.written_files == [python_files[0].resolve()]
+        assert python_files[0].read_text(encoding="utf-8") == unformatted_content
+
+    @pytest.mark.it("✅  Should read the line length from the project ruff configuration")
+    def test_reads_ruff_line_length(self, project_dir: Path, python_files: list[Path]):
+        assert get_ruff_line_length(python_files[0]) == 30
+        assert get_ruff_line_length(project_dir.parent / "outside.py") == 88
+
+    @pytest.mark.it("✅  Should follow extend chains when reading ruff settings")
+    def test_follows_extend_chain(self, project_dir: Path, python_files: list[Path]):
+        config_path = project_dir / "pyproject.toml"
+        base_config_path = project_dir.parent / "base.toml"
+        config_path.write_text('[tool.ruff]\nextend = "../base.toml"\n', encoding="utf-8")
+        base_config_path.write_text(
+            'extend = "project/pyproject.toml"\nline-length = 40\n',
+            encoding="utf-8",
+        )
+
+        assert get_ruff_config_chain(config_path.resolve()) == [
+            config_path.resolve(),
+            base_config_path.resolve(),
+        ]
+        assert get_ruff_line_length(python_files[0]) == 40
+
+    @pytest.mark.it(
+        "✅  Should read first-party modules from the ruff src roots and isort settings"
+    )
+    def test_reads_ruff_first_party_modules(self, project_dir: Path, python_files: list[Path]):
+        (project_dir / "pyproject.toml").write_text(
+            "[tool.ruff]\n"
+            'src = ["lib"]\n'
+            "\n"
+            "[tool.ruff.lint.isort]\n"
+            'known-first-party = ["billing"]\n'
+            'known-third-party = ["vendored"]\n',
+            encoding="utf-8",
+        )
+        for module_path in ("lib/app", "lib/vendored", "lib/not-a-module", "src/other"):
+            (project_dir / module_path).mkdir(parents=True)
+        (project_dir / "lib" / "settings.py").write_text("", encoding="utf-8")
+        (project_dir / "lib" / "README.md").write_text("", encoding="utf-8")
+
+        assert get_ruff_first_party_modules(python_files[0]) == {"app", "billing", "settings"}
+        assert get_ruff_first_party_modules(project_dir.parent / "outside.py") == {"src"}
+
+    @pytest.mark.it("✅  Should compare against the journaled content instead of re-reading disk")
+    def test_skips_disk_compare_for_loaded_content(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        python_files: list[Path],
+    ):
+        python_files[0].parent.mkdir(parents=True, exist_ok=True)
+        python_files[0].write_text("x = 1\n", encoding="utf-8")
+        mock_write = mocker.patch("fastgear_cli.core.formatting.write_text_if_changed")
+
+        with formatting_batch(format_files=False) as queue:
+            content = read_python_file(python_files[0])
+            write_python_file(python_files[0], content, project_dir)
+
+        mock_write.assert_not_called()
+        assert queue.unchanged_files == [python_files[0].resolve()]
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.core.journal import FileJournal
+from fastgear_cli.core.transaction import get_write_path, write_transaction
+
+pytest_plugins = ["tests.fixtures.core.journal_fixtures"]
+
+
+@pytest.mark.describe("🧪  FileJournal")
+class TestFileJournal:
+    @pytest.mark.it("✅  Should read each file from disk only once")
+    def test_reads_file_once(self, journal_file: Path):
+        journal = FileJournal()
+
+        first_read = journal.read(journal_file)
+        journal_file.write_text("changed = True\n", encoding="utf-8")
+
+        assert first_read == "from .entities import Billing\n"
+        assert journal.read(journal_file) == first_read
+
+    @pytest.mark.it("✅  Should serve pending writes to later reads without touching disk")
+    def test_serves_pending_writes(self, journal_file: Path):
+        journal = FileJournal()
+
+        journal.write(journal_file, "updated = True\n")
+
+        assert journal_file in journal
+        assert journal.read(journal_file) == "updated = True\n"
+        assert journal_file.read_text(encoding="utf-8") == "from .entities import Billing\n"
+
+    @pytest.mark.it("✅  Should not remember missing files so later renders are picked up")
+    def test_does_not_cache_missing_files(self, tmp_path: Path):
+        journal = FileJournal()
+        file_path = tmp_path / "created.py"
+
+        assert journal.read(file_path) is None
+        file_path.write_text("x = 1\n", encoding="utf-8")
+        assert journal.read(file_path) == "x = 1\n"
+
+    @pytest.mark.it("✅  Should read staged content inside a write transaction")
+    def test_reads_staged_content(self, journal_file: Path, tmp_path: Path):
+        journal = FileJournal()
+
+        with write_transaction(tmp_path):
+            staged_path = get_write_path(journal_file)
+            staged_path.parent.mkdir(parents=True, exist_ok=True)
+            staged_path.write_text("staged = True\n", encoding="utf-8")
+            content = journal.read(journal_file)
+
+        assert content == "staged = True\n"
+
+    @pytest.mark.it("✅  Should hand over pending writes once when drained")
+    def test_drains_pending_writes(self, journal_file: Path):
+        journal = FileJournal()
+        journal.write(journal_file, "first = True\n")
+        journal.write(journal_file, "second = True\n")
+
+        pending = journal.drain()
+
+        assert pending == {journal_file.resolve(): "second = True\n"}
+        assert len(journal) == 0
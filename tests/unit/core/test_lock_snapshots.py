@@ -0,0 +1,110 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.core.lock_snapshots import (
+    LOCK_SNAPSHOT_MAX_AGE_SECONDS,
+    PROJECT_NAME_PLACEHOLDER,
+    LockSnapshot,
+)
+
+pytest_plugins = ["tests.fixtures.core.lock_snapshots_fixtures"]
+
+
+def _age_snapshot(snapshot: LockSnapshot) -> None:
+    stale_time = time.time() - LOCK_SNAPSHOT_MAX_AGE_SECONDS - 60
+    os.utime(snapshot.path, (stale_time, stale_time))
+
+
+@pytest.mark.describe("🧪  LockSnapshot")
+class TestLockSnapshot:
+    @pytest.mark.it("✅  Should share the snapshot key across project names")
+    def test_key_ignores_project_name(self, make_project):
+        first = LockSnapshot.from_pyproject(make_project("first-project") / "pyproject.toml")
+        second = LockSnapshot.from_pyproject(make_project("second-project") / "pyproject.toml")
+
+        assert first.key == second.key
+        assert first.project_name == "first-project"
+
+    @pytest.mark.it("✅  Should ignore settings that do not affect resolution")
+    def test_key_ignores_unrelated_settings(self, make_project):
+        first = LockSnapshot.from_pyproject(make_project("first") / "pyproject.toml")
+        second = LockSnapshot.from_pyproject(
+            make_project("second", line_length=80) / "pyproject.toml"
+        )
+
+        assert first.key == second.key
+
+    @pytest.mark.it("✅  Should change the snapshot key when the locked project inputs change")
+    @pytest.mark.parametrize(
+        ("original", "replacement"),
+        [
+            ("fastapi>=0.128.0", "fastapi>=0.129.0"),
+            ('version = "0.1.0"', 'version = "0.2.0"'),
+            ("[tool.uv]", '[build-system]\nrequires = ["hatchling"]\n\n[tool.uv]'),
+        ],
+        ids=["dependencies", "version", "build_system"],
+    )
+    def test_key_changes_with_lock_inputs(self, make_project, original: str, replacement: str):
+        pyproject_path = make_project("my-project") / "pyproject.toml"
+        first = LockSnapshot.from_pyproject(pyproject_path)
+        pyproject_path.write_text(pyproject_path.read_text().replace(original, replacement))
+
+        second = LockSnapshot.from_pyproject(pyproject_path)
+
+        assert first.key != second.key
+
+    @pytest.mark.it("⚠️  Should return None for an invalid pyproject.toml")
+    def test_returns_none_for_invalid_pyproject(self, tmp_path: Path):
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text("[project\n")
+
+        assert LockSnapshot.from_pyproject(pyproject_path) is None
+        assert LockSnapshot.from_pyproject(tmp_path / "missing.toml") is None
+
+    @pytest.mark.it("✅  Should store the lock with a placeholder project name")
+    def test_save_normalizes_project_name(self, make_project, lock_content):
+        project_dir = make_project("My_Project")
+        (project_dir / "uv.lock").write_text(lock_content("my-project"))
+        snapshot = LockSnapshot.from_pyproject(project_dir / "pyproject.toml")
+
+        snapshot.save(project_dir)
+
+        assert snapshot.path.read_text() == lock_content(PROJECT_NAME_PLACEHOLDER)
+
+    @pytest.mark.it("✅  Should restore a fresh snapshot for another project")
+    def test_restores_fresh_snapshot(self, make_project, lock_content):
+        source_dir = make_project("source-project")
+        (source_dir / "uv.lock").write_text(lock_content("source-project"))
+        LockSnapshot.from_pyproject(source_dir / "pyproject.toml").save(source_dir)
+        target_dir = make_project("target-project")
+
+        restored = LockSnapshot.from_pyproject(target_dir / "pyproject.toml").restore(target_dir)
+
+        assert restored
+        assert (target_dir / "uv.lock").read_text() == lock_content("target-project")
+
+    @pytest.mark.it("⚠️  Should not restore a missing snapshot")
+    def test_does_not_restore_missing_snapshot(self, make_project):
+        project_dir = make_project("my-project")
+
+        snapshot = LockSnapshot.from_pyproject(project_dir / "pyproject.toml")
+
+        assert not snapshot.restore(project_dir, allow_stale=True)
+        assert not (project_dir / "uv.lock").exists()
+
+    @pytest.mark.it("⚠️  Should only restore a stale snapshot when allowed")
+    def test_restores_stale_snapshot_only_when_allowed(self, make_project, lock_content):
+        project_dir = make_project("my-project")
+        (project_dir / "uv.lock").write_text(lock_content("my-project"))
+        snapshot = LockSnapshot.from_pyproject(project_dir / "pyproject.toml")
+        snapshot.save(project_dir)
+        (project_dir / "uv.lock").unlink()
+        _age_snapshot(snapshot)
+
+        assert not snapshot.is_fresh()
+        assert not snapshot.restore(project_dir)
+        assert snapshot.restore(project_dir, allow_stale=True)
+        assert (project_dir / "uv.lock").read_text() == lock_content("my-project")
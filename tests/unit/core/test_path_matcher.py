@@ -0,0 +1,122 @@
+import itertools
+
+import pytest
+
+from fastgear_cli.configs.settings import TEMPLATES_DIR
+from fastgear_cli.core.constants.enums import (
+    AgentToolsEnum,
+    CIProviderEnum,
+    DatabaseProviderEnum,
+)
+from fastgear_cli.core.models import ProjectInitConfig
+from fastgear_cli.core.path_matcher import ConditionalPathMatcher
+from fastgear_cli.core.template_manifest import scan_template_entries
+
+
+def _legacy_should_render(rel_path: str, conditional_files: dict, conditional_dirs: dict) -> bool:
+    parts = rel_path.split("/")
+    for index, single_part in enumerate(parts[1:-1]):
+        partial_path = "/".join(parts[1 : index + 2])
+        if partial_path in conditional_dirs and not conditional_dirs[partial_path]:
+            return False
+        if (
+            single_part in conditional_dirs
+            and partial_path not in conditional_dirs
+            and not conditional_dirs[single_part]
+        ):
+            return False
+
+    file_path = rel_path if len(parts) <= 1 else "/".join(parts[1:])
+    return conditional_files.get(file_path, True)
+
+
+def _includes(matcher: ConditionalPathMatcher, rel_path: str) -> bool:
+    return matcher.includes_dir(rel_path.rpartition("/")[0]) and matcher.includes_file(rel_path)
+
+
+@pytest.mark.describe("🧪  ConditionalPathMatcher")
+class TestConditionalPathMatcher:
+    @pytest.mark.it("✅  Should include everything without conditionals")
+    def test_includes_everything_without_conditionals(self):
+        matcher = ConditionalPathMatcher({}, {})
+
+        assert _includes(matcher, "project/docker/Dockerfile")
+        assert _includes(matcher, ".dockerignore")
+
+    @pytest.mark.it("✅  Should exclude a directory name at any depth")
+    def test_excludes_directory_name_at_any_depth(self):
+        matcher = ConditionalPathMatcher({}, {"common": False})
+
+        assert not _includes(matcher, "project/common/db.py")
+        assert not _includes(matcher, "project/src/core/common/db.py")
+        assert _includes(matcher, "project/src/core/db.py")
+
+    @pytest.mark.it("✅  Should prefer a full directory path over a directory name")
+    def test_prefers_full_path_over_name(self):
+        matcher = ConditionalPathMatcher({}, {"src/core": True, "core": False})
+
+        assert _includes(matcher, "project/src/core/db.py")
+        assert not _includes(matcher, "project/lib/core/db.py")
+
+    @pytest.mark.it("✅  Should exclude nested directories matched by a ** pattern")
+    def test_excludes_nested_directories_with_double_star(self):
+        matcher = ConditionalPathMatcher({}, {".github/**": False})
+
+        assert _includes(matcher, "project/.github/copilot-instructions.md")
+        assert not _includes(matcher, "project/.github/workflows/ci.yml")
+        assert not _includes(matcher, "project/.github/actions/setup/action.yml")
+        assert not matcher.includes_dir("project/.github/workflows")
+
+    @pytest.mark.it("✅  Should match file patterns relative to the generated root")
+    def test_matches_file_patterns(self):
+        matcher = ConditionalPathMatcher({"docker/*.yaml": False, "**/*.md": False}, {})
+
+        assert not _includes(matcher, "project/docker/local.yaml")
+        assert _includes(matcher, "project/docker/nested/local.yaml")
+        assert not _includes(matcher, "project/README.md")
+        assert not _includes(matcher, "project/src/docs/guide.md")
+        assert _includes(matcher, "project/src/main.py")
+
+    @pytest.mark.it("✅  Should prefer a literal file rule over a pattern")
+    def test_prefers_literal_file_rule(self):
+        matcher = ConditionalPathMatcher({"README.md": True, "*.md": False}, {})
+
+        assert _includes(matcher, "project/README.md")
+        assert not _includes(matcher, "project/CHANGELOG.md")
+
+    @pytest.mark.it("✅  Should support character classes in patterns")
+    def test_supports_character_classes(self):
+        matcher = ConditionalPathMatcher({"env.[!p]*.toml": False}, {})
+
+        assert not _includes(matcher, "project/env.local.toml")
+        assert _includes(matcher, "project/env.prod.toml")
+
+    @pytest.mark.it("✅  Should match the previous rules for every new_project option combination")
+    @pytest.mark.parametrize(
+        "options",
+        list(
+            itertools.product(
+                (True, False),
+                ([], [AgentToolsEnum.GITHUB_COPILOT]),
+                (None, CIProviderEnum.GITHUB_ACTIONS),
+                (None, DatabaseProviderEnum.POSTGRESQL),
+            )
+        ),
+    )
+    def test_matches_previous_rules_for_new_project(self, options: tuple):
+        use_docker, agent_tools, ci_provider, database_provider = options
+        config = ProjectInitConfig(
+            project_name="my-project",
+            project_title="My Project",
+            use_docker=use_docker,
+            agent_tools=agent_tools,
+            ci_provider=ci_provider,
+            use_database=database_provider is not None,
+            database_provider=database_provider,
+        )
+        matcher = ConditionalPathMatcher(config.conditional_files, config.conditional_dirs)
+
+        for entry in scan_template_entries(TEMPLATES_DIR / "new_project"):
+            assert _includes(matcher, entry.rel_path) == _legacy_should_render(
+                entry.rel_path, config.conditional_files, config.conditional_dirs
+            ), entry.rel_path
@@ -0,0 +1,78 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core import path_renderer
+from fastgear_cli.core.path_renderer import PathRenderer
+from fastgear_cli.core.template_env import get_path_template, get_template_environment
+
+
+@pytest.fixture
+def path_template_root(tmp_path: Path) -> Path:
+    return tmp_path
+
+
+@pytest.fixture
+def path_context() -> dict:
+    return {"project_name": "billing", "element_name": "invoice", "use_docker": True}
+
+
+@pytest.mark.describe("🧪  PathRenderer")
+class TestPathRenderer:
+    @pytest.mark.it("✅  Should render templated segments and keep plain paths unchanged")
+    def test_renders_templated_segments(self, path_template_root: Path, path_context: dict):
+        renderer = PathRenderer(get_template_environment(path_template_root), path_context)
+
+        assert renderer.render("{{project_name}}/src/{{ element_name }}_entity.py.j2") == (
+            "billing/src/invoice_entity.py.j2"
+        )
+        assert renderer.render("docker/Dockerfile") == "docker/Dockerfile"
+
+    @pytest.mark.it("✅  Should render each distinct segment once per call")
+    def test_renders_each_segment_once(
+        self,
+        mocker: MagicMock,
+        path_template_root: Path,
+        path_context: dict,
+    ):
+        compile_spy = mocker.spy(path_renderer, "get_path_template")
+        renderer = PathRenderer(get_template_environment(path_template_root), path_context)
+
+        for name in ("a.py", "b.py", "c.py"):
+            renderer.render(f"{{{{project_name}}}}/src/{{{{element_name}}}}/{name}")
+
+        assert [call.args[1] for call in compile_spy.call_args_list] == [
+            "{{project_name}}",
+            "{{element_name}}",
+        ]
+
+    @pytest.mark.it("✅  Should reuse compiled path templates across calls")
+    def test_reuses_compiled_templates(
+        self,
+        mocker: MagicMock,
+        path_template_root: Path,
+        path_context: dict,
+    ):
+        env = get_template_environment(path_template_root)
+        get_path_template.cache_clear()
+        from_string = mocker.spy(env, "from_string")
+
+        PathRenderer(env, path_context).render("{{project_name}}/README.md")
+        PathRenderer(env, {**path_context, "project_name": "orders"}).render(
+            "{{project_name}}/README.md"
+        )
+
+        from_string.assert_called_once_with("{{project_name}}")
+
+    @pytest.mark.it("⚠️  Should render the whole path when an expression spans segments")
+    def test_renders_whole_path_for_spanning_expressions(
+        self,
+        path_template_root: Path,
+        path_context: dict,
+    ):
+        renderer = PathRenderer(get_template_environment(path_template_root), path_context)
+
+        rendered = renderer.render("{% if use_docker %}docker/{% endif %}compose.yml")
+
+        assert rendered == "docker/compose.yml"
@@ -1,11 +1,16 @@
+import threading
+import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
+from fastgear_cli.core import render
 from fastgear_cli.core.render import (
     _should_render_dir,
     _should_render_file,
     render_template,
+    run_write_tasks,
 )
 
 pytest_plugins = ["tests.fixtures.core.render_fixtures"]
@@ -239,6 +244,186 @@ class TestRenderTemplateDir:
         assert output_file.read_text().endswith("\n")
 
 
+@pytest.mark.describe("🧪  RenderTemplateConcurrency")
+class TestRenderTemplateConcurrency:
+    @pytest.mark.it("✅  Should return files in template order regardless of completion order")
+    def test_returns_files_in_template_order(
+        self,
+        mocker: MagicMock,
+        template_with_many_files: Path,
+        output_root: Path,
+        simple_context: dict,
+    ):
+        write_entry = render._write_entry
+
+        def slow_first_entries(env, template_root, entry, out_path, *args):
+            if entry.rel_path.startswith("module_00"):
+                time.sleep(0.05)
+            return write_entry(env, template_root, entry, out_path, *args)
+
+        mocker.patch("fastgear_cli.core.render._write_entry", side_effect=slow_first_entries)
+        written_files: list[Path] = []
+
+        files = render_template(
+            template_with_many_files,
+            output_root,
+            simple_context,
+            {},
+            {},
+            on_file_written=written_files.append,
+        )
+
+        expected = [
+            output_root / f"module_{index:02}" / name
+            for index in range(12)
+            for name in ("__init__.py", "static.txt")
+        ]
+        assert files == expected
+        assert sorted(written_files) == expected
+        assert written_files != expected
+        assert (output_root / "module_07" / "__init__.py").read_text() == "# My Project 7\n"
+
+    @pytest.mark.it("✅  Should render files on worker threads and notify on the caller thread")
+    def test_renders_on_worker_threads(
+        self,
+        mocker: MagicMock,
+        template_with_many_files: Path,
+        output_root: Path,
+        simple_context: dict,
+    ):
+        write_entry = render._write_entry
+        worker_threads: set[str] = set()
+
+        def record_thread(*args):
+            worker_threads.add(threading.current_thread().name)
+            return write_entry(*args)
+
+        mocker.patch("fastgear_cli.core.render._write_entry", side_effect=record_thread)
+        callback_threads: set[str] = set()
+
+        render_template(
+            template_with_many_files,
+            output_root,
+            simple_context,
+            {},
+            {},
+            on_file_written=lambda _path: callback_threads.add(threading.current_thread().name),
+        )
+
+        assert all(name.startswith("fastgear-render") for name in worker_threads)
+        assert callback_threads == {threading.current_thread().name}
+
+    @pytest.mark.it("❌  Should propagate write errors and cancel pending writes")
+    def test_propagates_write_errors(self):
+        started: list[int] = []
+
+        def failing_task() -> Path:
+            raise PermissionError
+
+        def slow_task(index: int) -> Path:
+            started.append(index)
+            time.sleep(0.01)
+            return Path(f"file_{index}")
+
+        tasks = [failing_task, *(lambda index=index: slow_task(index) for index in range(50))]
+
+        with pytest.raises(PermissionError):
+            run_write_tasks(tasks)
+
+        assert len(started) < 50
+
+
+@pytest.mark.describe("🧪  RenderTemplateFilesystemAccess")
+class TestRenderTemplateFilesystemAccess:
+    @pytest.mark.it("✅  Should detect conflicts without a stat per output file")
+    def test_detects_conflicts_without_per_file_stat(
+        self,
+        mocker: MagicMock,
+        template_with_many_files: Path,
+        output_root: Path,
+        simple_context: dict,
+    ):
+        (output_root / "module_03").mkdir()
+        (output_root / "module_03" / "static.txt").write_text("existing\n")
+        exists = mocker.spy(Path, "exists")
+
+        files = render_template(template_with_many_files, output_root, simple_context, {}, {})
+
+        exists.assert_not_called()
+        assert output_root / "module_03" / "static.txt" not in files
+        assert (output_root / "module_03" / "static.txt").read_text() == "existing\n"
+        assert len(files) == 23
+
+    @pytest.mark.it("✅  Should create each output directory exactly once")
+    def test_creates_each_directory_once(
+        self,
+        mocker: MagicMock,
+        template_with_many_files: Path,
+        output_root: Path,
+        simple_context: dict,
+    ):
+        mkdir = mocker.spy(Path, "mkdir")
+
+        render_template(template_with_many_files, output_root, simple_context, {}, {})
+
+        created = [call.args[0] for call in mkdir.call_args_list]
+        assert sorted(created) == [output_root / f"module_{index:02}" for index in range(12)]
+
+
+@pytest.mark.describe("🧪  RenderTemplateStreaming")
+class TestRenderTemplateStreaming:
+    @pytest.mark.it("✅  Should stream output to disk once it grows past the threshold")
+    def test_streams_output_past_threshold(
+        self,
+        template_with_large_output: Path,
+        output_root: Path,
+    ):
+        out_path = output_root / "seed.json"
+        file_exists_during_render: list[bool] = []
+
+        def probe(index: int) -> str:
+            file_exists_during_render.append(out_path.exists())
+            return f"{index:04}"
+
+        render_template(
+            template_with_large_output,
+            output_root,
+            {"count": 100, "probe": probe},
+            {},
+            {},
+            stream_threshold=40,
+        )
+
+        assert out_path.read_text() == "".join(f"{index:04}" for index in range(100)) + "\n"
+        assert not any(file_exists_during_render[:10])
+        assert all(file_exists_during_render[11:])
+
+    @pytest.mark.it("✅  Should render in one write when streaming is disabled")
+    def test_renders_in_one_write_when_streaming_disabled(
+        self,
+        template_with_large_output: Path,
+        output_root: Path,
+    ):
+        out_path = output_root / "seed.json"
+        file_exists_during_render: list[bool] = []
+
+        def probe(index: int) -> str:
+            file_exists_during_render.append(out_path.exists())
+            return f"{index:04}"
+
+        render_template(
+            template_with_large_output,
+            output_root,
+            {"count": 100, "probe": probe},
+            {},
+            {},
+            stream_threshold=None,
+        )
+
+        assert out_path.read_text() == "".join(f"{index:04}" for index in range(100)) + "\n"
+        assert not any(file_exists_during_render)
+
+
 @pytest.mark.describe("🧪  ShouldRenderDir")
 class TestShouldRenderDir:
     @pytest.mark.it("✅  Should return True when no conditional dirs")
@@ -0,0 +1,225 @@
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.configs.settings import TEMPLATES_DIR
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
+from fastgear_cli.core.render import render_template
+from fastgear_cli.core.render_cache import (
+    build_render_cache_key,
+    get_render_cache_dir,
+    is_render_cacheable,
+    render_template_cached,
+)
+from fastgear_cli.core.template_manifest import MANIFEST_FILE_NAME, write_manifest
+from tests.helpers.file_tree_helpers import read_tree
+
+pytest_plugins = [
+    "tests.fixtures.core.render_cache_fixtures",
+    "tests.fixtures.core.template_manifest_fixtures",
+]
+
+
+@pytest.mark.describe("🧪  RenderTemplateCached")
+class TestRenderTemplateCached:
+    @pytest.mark.it("✅  Should produce the same tree as a direct render")
+    def test_matches_direct_render(
+        self,
+        tmp_path: Path,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        conditional_dirs = {"docker": False}
+        render_template(
+            cacheable_template_root, tmp_path / "direct", render_context, {}, conditional_dirs
+        )
+
+        first_files = render_template_cached(
+            cacheable_template_root, tmp_path / "first", render_context, {}, conditional_dirs
+        )
+        second_files = render_template_cached(
+            cacheable_template_root, tmp_path / "second", render_context, {}, conditional_dirs
+        )
+
+        assert read_tree(tmp_path / "first") == read_tree(tmp_path / "direct")
+        assert read_tree(tmp_path / "second") == read_tree(tmp_path / "direct")
+        assert [path.relative_to(tmp_path / "second") for path in second_files] == [
+            path.relative_to(tmp_path / "first") for path in first_files
+        ]
+
+    @pytest.mark.it("✅  Should reuse the cached tree for another project name")
+    def test_reuses_tree_for_another_project_name(
+        self,
+        mocker: MagicMock,
+        tmp_path: Path,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        render_template_cached(cacheable_template_root, tmp_path / "first", render_context, {}, {})
+        mock_render = mocker.patch("fastgear_cli.core.render_cache.render_template")
+        second_context = {
+            **render_context,
+            "project_name": "second-service",
+            "project_title": "Second Service",
+        }
+
+        files = render_template_cached(
+            cacheable_template_root, tmp_path / "second", second_context, {}, {}
+        )
+
+        mock_render.assert_not_called()
+        project_dir = tmp_path / "second" / "second-service"
+        assert project_dir / "pyproject.toml" in files
+        assert (project_dir / "README.md").read_text() == "# Second Service\n"
+        assert (project_dir / "pyproject.toml").read_text() == (
+            'name = "second-service"\ndocker = true\n'
+        )
+
+    @pytest.mark.it("✅  Should share the key across project names only")
+    def test_key_ignores_only_project_name_and_title(
+        self,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        key = build_render_cache_key(cacheable_template_root, render_context, {}, {})
+        renamed_context = {**render_context, "project_name": "other", "project_title": "Other"}
+
+        assert build_render_cache_key(cacheable_template_root, renamed_context, {}, {}) == key
+        assert (
+            build_render_cache_key(
+                cacheable_template_root, {**render_context, "use_docker": False}, {}, {}
+            )
+            != key
+        )
+        assert (
+            build_render_cache_key(cacheable_template_root, render_context, {}, {"docker": False})
+            != key
+        )
+
+    @pytest.mark.it("✅  Should change the key when a template changes")
+    def test_key_changes_with_templates(
+        self,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        key = build_render_cache_key(cacheable_template_root, render_context, {}, {})
+
+        (cacheable_template_root / "{{project_name}}" / "src" / "main.py").write_text(
+            "print('changed')\n"
+        )
+
+        assert build_render_cache_key(cacheable_template_root, render_context, {}, {}) != key
+
+    @pytest.mark.it("✅  Should key packaged templates on the manifest instead of file stats")
+    def test_key_skips_fingerprint_for_packaged_templates(
+        self,
+        render_cache_dir: Path,
+        templates_dir: Path,
+        packaged_manifest_dir: Path,
+        render_context: dict,
+    ):
+        shutil.copytree(templates_dir, packaged_manifest_dir, dirs_exist_ok=True)
+        write_manifest(packaged_manifest_dir / MANIFEST_FILE_NAME, templates_dir)
+        template_root = packaged_manifest_dir / "new_project"
+        key = build_render_cache_key(template_root, render_context, {}, {})
+
+        (template_root / "{{project_name}}" / "README.md.j2").write_text("# changed\n")
+
+        assert build_render_cache_key(template_root, render_context, {}, {}) == key
+
+    @pytest.mark.it("✅  Should skip existing files and notify written files")
+    def test_skips_existing_files_and_notifies(
+        self,
+        tmp_path: Path,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        render_template_cached(cacheable_template_root, tmp_path / "warm", render_context, {}, {})
+        project_dir = tmp_path / "output" / "first-service"
+        project_dir.mkdir(parents=True)
+        (project_dir / "README.md").write_text("existing")
+        written_files: list[Path] = []
+
+        files = render_template_cached(
+            cacheable_template_root,
+            tmp_path / "output",
+            render_context,
+            {},
+            {},
+            on_file_written=written_files.append,
+        )
+
+        assert project_dir / "README.md" not in files
+        assert (project_dir / "README.md").read_text() == "existing"
+        assert sorted(written_files) == sorted(files)
+
+    @pytest.mark.it("✅  Should hardlink only packaged static files and never cache entries")
+    def test_never_hardlinks_cache_entries(
+        self,
+        tmp_path: Path,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        render_template_cached(cacheable_template_root, tmp_path / "warm", render_context, {}, {})
+
+        render_template_cached(
+            cacheable_template_root,
+            tmp_path / "output",
+            render_context,
+            {},
+            {},
+            static_copy_mode=StaticCopyModeEnum.HARDLINK,
+        )
+
+        project_dir = tmp_path / "output" / "first-service"
+        template_dir = cacheable_template_root / "{{project_name}}"
+        assert (project_dir / "src" / "main.py").samefile(template_dir / "src" / "main.py")
+        cache_files = [path for path in render_cache_dir.rglob("*") if path.is_file()]
+        assert all(
+            not (project_dir / name).samefile(cache_file)
+            for name in ("README.md", "pyproject.toml", "src/main.py")
+            for cache_file in cache_files
+        )
+
+    @pytest.mark.it("⚠️  Should rebuild the cached tree when a cached file is missing")
+    def test_rebuilds_incomplete_cache_entry(
+        self,
+        tmp_path: Path,
+        render_cache_dir: Path,
+        cacheable_template_root: Path,
+        render_context: dict,
+    ):
+        render_template_cached(cacheable_template_root, tmp_path / "first", render_context, {}, {})
+        for cached_file in get_render_cache_dir().rglob("main.py"):
+            cached_file.unlink()
+
+        render_template_cached(cacheable_template_root, tmp_path / "second", render_context, {}, {})
+
+        assert (tmp_path / "second" / "first-service" / "src" / "main.py").exists()
+
+    @pytest.mark.it("⚠️  Should render directly when a template transforms the project name")
+    def test_renders_directly_when_not_cacheable(
+        self,
+        tmp_path: Path,
+        render_cache_dir: Path,
+        uncacheable_template_root: Path,
+        render_context: dict,
+    ):
+        assert not is_render_cacheable(uncacheable_template_root)
+
+        render_template_cached(uncacheable_template_root, tmp_path, render_context, {}, {})
+
+        assert (tmp_path / "first-service" / "README.md").read_text() == "# FIRST-SERVICE\n"
+        assert not get_render_cache_dir().exists()
+
+    @pytest.mark.it("✅  Should cache the packaged new_project template")
+    def test_new_project_template_is_cacheable(self):
+        assert is_render_cacheable(TEMPLATES_DIR / "new_project")
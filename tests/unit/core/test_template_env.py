@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli import __version__
+from fastgear_cli.core.template_env import get_bytecode_cache, get_template_environment
+from fastgear_cli.core.template_manifest import MANIFEST_FILE_NAME, clear_packaged_manifest
+
+pytest_plugins = [
+    "tests.fixtures.core.template_env_fixtures",
+    "tests.fixtures.core.template_manifest_fixtures",
+]
+
+
+@pytest.mark.describe("🧪  TemplateEnvironment")
+class TestTemplateEnvironment:
+    @pytest.mark.it("✅  Should reuse the same environment for the same template root")
+    def test_reuses_environment_for_same_root(self, cache_dir: Path, template_root: Path):
+        first = get_template_environment(template_root)
+        second = get_template_environment(template_root)
+
+        assert first is second
+
+    @pytest.mark.it("✅  Should create a separate environment per template root")
+    def test_creates_environment_per_root(
+        self,
+        cache_dir: Path,
+        template_root: Path,
+        tmp_path: Path,
+    ):
+        other_root = tmp_path / "other"
+        other_root.mkdir()
+
+        assert get_template_environment(template_root) is not get_template_environment(other_root)
+
+    @pytest.mark.it("✅  Should keep trailing newlines when rendering")
+    def test_keeps_trailing_newlines(self, cache_dir: Path, template_root: Path):
+        env = get_template_environment(template_root)
+
+        content = env.get_template("README.md.j2").render(project_title="Sample")
+
+        assert content == "# Sample\n"
+
+    @pytest.mark.it("✅  Should persist compiled templates under the versioned cache dir")
+    def test_persists_bytecode_under_versioned_cache_dir(
+        self,
+        cache_dir: Path,
+        template_root: Path,
+    ):
+        env = get_template_environment(template_root)
+
+        env.get_template("README.md.j2")
+
+        bytecode_dir = cache_dir / __version__ / "jinja"
+        assert any(bytecode_dir.iterdir())
+
+    @pytest.mark.it("⚠️  Should disable the bytecode cache when the cache dir is not writable")
+    def test_disables_bytecode_cache_when_not_writable(self, cache_dir: Path):
+        cache_dir.write_text("not a directory")
+
+        assert get_bytecode_cache() is None
+
+
+@pytest.mark.describe("🧪  CompiledTemplates")
+class TestCompiledTemplates:
+    @pytest.mark.it("✅  Should load templates from the packaged compiled archive")
+    def test_loads_templates_from_compiled_archive(
+        self,
+        cache_dir: Path,
+        compiled_templates_dir: Path,
+    ):
+        template_root = compiled_templates_dir / "new_project"
+        (template_root / "{{project_name}}" / "README.md.j2").unlink()
+
+        template = get_template_environment(template_root).get_template(
+            "{{project_name}}/README.md.j2"
+        )
+
+        assert template.render(project_title="Sample") == "# Sample\n"
+
+    @pytest.mark.it("✅  Should fall back to template sources missing from the archive")
+    def test_falls_back_to_sources_missing_from_archive(
+        self,
+        cache_dir: Path,
+        compiled_templates_dir: Path,
+    ):
+        template_root = compiled_templates_dir / "new_project"
+        (template_root / "CHANGELOG.md.j2").write_text("{{ project_title }} changes\n")
+
+        template = get_template_environment(template_root).get_template("CHANGELOG.md.j2")
+
+        assert template.render(project_title="Sample") == "Sample changes\n"
+
+    @pytest.mark.it("⚠️  Should ignore archives compiled by another Jinja version")
+    def test_ignores_archives_from_other_jinja_version(
+        self,
+        cache_dir: Path,
+        compiled_templates_dir: Path,
+    ):
+        manifest_path = compiled_templates_dir / MANIFEST_FILE_NAME
+        manifest = json.loads(manifest_path.read_text())
+        manifest["compiled"]["jinja_version"] = "0.0.0"
+        manifest_path.write_text(json.dumps(manifest))
+        clear_packaged_manifest()
+        template_root = compiled_templates_dir / "new_project"
+        (template_root / "{{project_name}}" / "README.md.j2").write_text(
+            "# Live {{ project_title }}\n"
+        )
+
+        template = get_template_environment(template_root).get_template(
+            "{{project_name}}/README.md.j2"
+        )
+
+        assert template.render(project_title="Sample") == "# Live Sample\n"
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.configs.settings import TEMPLATES_DIR
+from fastgear_cli.core.template_manifest import (
+    MANIFEST_FILE_NAME,
+    TemplateEntry,
+    build_manifest,
+    get_template_entries,
+    scan_template_entries,
+    write_manifest,
+)
+
+pytest_plugins = ["tests.fixtures.core.template_manifest_fixtures"]
+
+
+@pytest.mark.describe("🧪  TemplateEntry")
+class TestTemplateEntry:
+    @pytest.mark.it("✅  Should flag Jinja templates and templated paths")
+    def test_flags_templates_and_templated_paths(self):
+        entry = TemplateEntry.from_rel_path("{{project_name}}/README.md.j2")
+
+        assert entry.is_template is True
+        assert entry.has_jinja_path is True
+
+    @pytest.mark.it("✅  Should flag static files with plain paths")
+    def test_flags_static_files_with_plain_paths(self):
+        entry = TemplateEntry.from_rel_path("project/docker/Dockerfile")
+
+        assert entry.is_template is False
+        assert entry.has_jinja_path is False
+
+
+@pytest.mark.describe("🧪  ScanTemplateEntries")
+class TestScanTemplateEntries:
+    @pytest.mark.it("✅  Should list files in a deterministic order without directories")
+    def test_lists_files_in_deterministic_order(self, templates_dir: Path):
+        entries = scan_template_entries(templates_dir / "new_project")
+
+        assert [entry.rel_path for entry in entries] == [
+            "{{project_name}}/README.md.j2",
+            "{{project_name}}/docker/Dockerfile",
+        ]
+
+    @pytest.mark.it("✅  Should not enumerate directories excluded by include_dir")
+    def test_prunes_excluded_directories(self, templates_dir: Path):
+        visited_dirs: list[str] = []
+
+        def include_dir(rel_dir: str) -> bool:
+            visited_dirs.append(rel_dir)
+            return not rel_dir.endswith("docker")
+
+        (templates_dir / "new_project" / "{{project_name}}" / "docker" / "nested").mkdir()
+        entries = scan_template_entries(templates_dir / "new_project", include_dir=include_dir)
+
+        assert [entry.rel_path for entry in entries] == ["{{project_name}}/README.md.j2"]
+        assert visited_dirs == ["{{project_name}}", "{{project_name}}/docker"]
+
+
+@pytest.mark.describe("🧪  BuildManifest")
+class TestBuildManifest:
+    @pytest.mark.it("✅  Should index every template root")
+    def test_indexes_every_template_root(self, templates_dir: Path):
+        manifest = build_manifest(templates_dir)
+
+        assert set(manifest["templates"]) == {"new_project", "add/entity/folder"}
+
+    @pytest.mark.it("✅  Should index the bundled templates")
+    def test_indexes_bundled_templates(self):
+        manifest = build_manifest()
+
+        assert "new_project" in manifest["templates"]
+        assert "add/module/folder" in manifest["templates"]
+
+
+@pytest.mark.describe("🧪  GetTemplateEntries")
+class TestGetTemplateEntries:
+    @pytest.mark.it("✅  Should read entries from the packaged manifest when available")
+    def test_reads_entries_from_packaged_manifest(
+        self,
+        templates_dir: Path,
+        packaged_manifest_dir: Path,
+    ):
+        write_manifest(packaged_manifest_dir / MANIFEST_FILE_NAME, templates_dir)
+
+        entries = get_template_entries(packaged_manifest_dir / "add" / "entity" / "folder")
+
+        assert [entry.rel_path for entry in entries] == ["entities/{{element_name}}_entity.py.j2"]
+
+    @pytest.mark.it("✅  Should check each packaged directory once when filtering")
+    def test_filters_packaged_entries_by_directory(
+        self,
+        templates_dir: Path,
+        packaged_manifest_dir: Path,
+    ):
+        (templates_dir / "new_project" / "{{project_name}}" / "docker" / "compose.yml").write_text(
+            "services: {}\n"
+        )
+        write_manifest(packaged_manifest_dir / MANIFEST_FILE_NAME, templates_dir)
+        visited_dirs: list[str] = []
+
+        def include_dir(rel_dir: str) -> bool:
+            visited_dirs.append(rel_dir)
+            return not rel_dir.endswith("docker")
+
+        entries = get_template_entries(
+            packaged_manifest_dir / "new_project", include_dir=include_dir
+        )
+
+        assert [entry.rel_path for entry in entries] == ["{{project_name}}/README.md.j2"]
+        assert visited_dirs == ["{{project_name}}", "{{project_name}}/docker"]
+
+    @pytest.mark.it("✅  Should fall back to a live scan when the manifest is stale")
+    def test_falls_back_to_live_scan_when_manifest_is_stale(
+        self,
+        templates_dir: Path,
+        packaged_manifest_dir: Path,
+    ):
+        manifest = build_manifest(templates_dir)
+        manifest["version"] = "0.0.0"
+        (packaged_manifest_dir / MANIFEST_FILE_NAME).write_text(json.dumps(manifest))
+        (packaged_manifest_dir / "new_project").mkdir()
+        (packaged_manifest_dir / "new_project" / "live.txt").write_text("live")
+
+        entries = get_template_entries(packaged_manifest_dir / "new_project")
+
+        assert [entry.rel_path for entry in entries] == ["live.txt"]
+
+    @pytest.mark.it("✅  Should scan template roots outside the bundled templates")
+    def test_scans_roots_outside_bundled_templates(self, templates_dir: Path):
+        entries = get_template_entries(templates_dir / "new_project")
+
+        assert len(entries) == 2
+
+    @pytest.mark.it("✅  Should match a live scan for the bundled templates")
+    def test_matches_live_scan_for_bundled_templates(self):
+        template_root = TEMPLATES_DIR / "new_project"
+
+        assert get_template_entries(template_root) == scan_template_entries(template_root)
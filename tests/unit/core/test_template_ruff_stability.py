@@ -0,0 +1,144 @@
+import importlib.util
+import itertools
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fastgear_cli.cli.commands.add import add_app
+from fastgear_cli.core.constants.enums import (
+    AgentToolsEnum,
+    CIProviderEnum,
+    DatabaseProviderEnum,
+)
+from fastgear_cli.core.filesystem import create_template
+from fastgear_cli.core.models import ProjectInitConfig
+
+runner = CliRunner()
+
+PROJECT_INIT_OPTIONS = list(
+    itertools.product(
+        (True, False),
+        ([], [AgentToolsEnum.GITHUB_COPILOT]),
+        (None, CIProviderEnum.GITHUB_ACTIONS),
+        (None, DatabaseProviderEnum.POSTGRESQL),
+    )
+)
+
+
+def _project_init_option_id(options: tuple) -> str:
+    use_docker, agent_tools, ci_provider, database_provider = options
+    return "-".join(
+        [
+            "docker" if use_docker else "no_docker",
+            "copilot" if agent_tools else "no_agents",
+            "actions" if ci_provider else "no_ci",
+            "postgresql" if database_provider else "no_database",
+        ]
+    )
+
+
+def _create_project(base_dir: Path, options: tuple) -> Path:
+    use_docker, agent_tools, ci_provider, database_provider = options
+    config = ProjectInitConfig(
+        base_dir=base_dir,
+        project_name="sample_api",
+        project_title="Sample Api",
+        use_docker=use_docker,
+        agent_tools=agent_tools,
+        ci_provider=ci_provider,
+        use_database=database_provider is not None,
+        database_provider=database_provider,
+    )
+    create_template(
+        "new_project",
+        config.base_dir,
+        config.context,
+        config.conditional_files,
+        config.conditional_dirs,
+    )
+    return config.project_dir
+
+
+def _import_path(use_folders: bool, folder: str, module: str, symbol: str) -> str:
+    package = f"src.modules.billing.{folder}" if use_folders else "src.modules.billing"
+    return f"{package}.{module}.{symbol}"
+
+
+def _build_add_commands(*, use_folders: bool) -> list[list[str]]:
+    modules_path = ["--path", "src/modules"]
+    billing_path = ["--path", "src/modules/billing"]
+    commands = [
+        ["module", "billing", *modules_path, "--module-components", "controller,entity"],
+        ["module", "users", *modules_path, "--module-components", "entity"],
+        ["module", "orders", *modules_path, "--module-components", "controller"],
+        ["entity", "invoice", *billing_path],
+        ["entity", "line_item", *billing_path],
+        [
+            "repository",
+            "invoice",
+            *billing_path,
+            "--entity-path",
+            _import_path(use_folders, "entities", "invoice_entity", "Invoice"),
+        ],
+        [
+            "service",
+            "invoice",
+            *billing_path,
+            "--repository-path",
+            _import_path(use_folders, "repositories", "invoice_repository", "InvoiceRepository"),
+        ],
+        [
+            "controller",
+            "invoice",
+            *billing_path,
+            "--service-path",
+            _import_path(use_folders, "services", "invoice_service", "InvoiceService"),
+        ],
+    ]
+    folders_flag = "--use-folders" if use_folders else "--no-use-folders"
+    return [[*command, folders_flag, "--no-format"] for command in commands]
+
+
+def _run_ruff(project_dir: Path, *arguments: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "ruff", *arguments, "--quiet", "."],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, f"ruff {' '.join(arguments)}:\n{result.stdout}{result.stderr}"
+
+
+@pytest.mark.skipif(importlib.util.find_spec("ruff") is None, reason="ruff is not installed")
+@pytest.mark.describe("🧪  TemplateRuffStability")
+class TestTemplateRuffStability:
+    @pytest.mark.it("✅  Should render new projects and fg add output that ruff leaves untouched")
+    @pytest.mark.parametrize("options", PROJECT_INIT_OPTIONS, ids=_project_init_option_id)
+    @pytest.mark.parametrize("use_folders", [True, False], ids=["folders", "flat"])
+    def test_generated_code_is_ruff_clean(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        options: tuple,
+        use_folders: bool,
+    ):
+        project_dir = _create_project(tmp_path, options)
+        monkeypatch.chdir(project_dir)
+        for command in _build_add_commands(use_folders=use_folders):
+            result = runner.invoke(add_app, command)
+            assert result.exit_code == 0, result.output
+
+        generated = {path: path.read_text() for path in project_dir.rglob("*.py")}
+        _run_ruff(project_dir, "check", "--fix", "--extend-ignore", "CPY001")
+        _run_ruff(project_dir, "format")
+
+        changed = [
+            path.relative_to(project_dir).as_posix()
+            for path, content in generated.items()
+            if path.read_text() != content
+        ]
+        assert changed == []
@@ -0,0 +1,179 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core import transaction
+from fastgear_cli.core.render import render_template
+from fastgear_cli.core.transaction import (
+    STAGING_DIR_PREFIX,
+    captured_write_transaction,
+    get_read_path,
+    get_write_path,
+    write_transaction,
+)
+
+pytest_plugins = ["tests.fixtures.core.transaction_fixtures"]
+
+
+def _staging_dirs(root: Path) -> list[Path]:
+    return [
+        *root.glob(f"{STAGING_DIR_PREFIX}*"),
+        *Path(tempfile.gettempdir()).glob(f"{STAGING_DIR_PREFIX}*"),
+    ]
+
+
+def _write_staged(target: Path, content: str) -> None:
+    write_path = get_write_path(target)
+    write_path.parent.mkdir(parents=True, exist_ok=True)
+    write_path.write_text(content, encoding="utf-8")
+
+
+def _write_in_transaction(root: Path, targets: list[Path], *, fail: bool = False) -> None:
+    with write_transaction(root):
+        for target in targets:
+            _write_staged(target, "changed = True\n")
+        if fail:
+            raise RuntimeError
+
+
+@pytest.mark.describe("🧪  WriteTransaction")
+class TestWriteTransaction:
+    @pytest.mark.it("✅  Should expose staged files only when the transaction commits")
+    def test_exposes_files_on_commit(self, transaction_root: Path):
+        new_file = transaction_root / "src" / "billing" / "__init__.py"
+        existing_file = transaction_root / "src" / "__init__.py"
+
+        with write_transaction(transaction_root):
+            _write_staged(new_file, "new = True\n")
+            _write_staged(existing_file, "x = 1\n")
+
+            assert not new_file.parent.exists()
+            assert existing_file.read_text(encoding="utf-8") == "original = True\n"
+            assert get_read_path(existing_file).read_text(encoding="utf-8") == "x = 1\n"
+
+        assert new_file.read_text(encoding="utf-8") == "new = True\n"
+        assert existing_file.read_text(encoding="utf-8") == "x = 1\n"
+        assert not _staging_dirs(transaction_root)
+
+    @pytest.mark.it("✅  Should stage files outside the project tree")
+    def test_stages_outside_project_tree(self, transaction_root: Path, staging_temp_dir: Path):
+        target = transaction_root / "src" / "billing.py"
+
+        with write_transaction(transaction_root):
+            staged_path = get_write_path(target)
+
+            assert not staged_path.is_relative_to(transaction_root)
+            assert staged_path.is_relative_to(staging_temp_dir)
+            assert not list(transaction_root.rglob(f"{STAGING_DIR_PREFIX}*"))
+
+    @pytest.mark.it("⚠️  Should stage inside the project when other locations are on another device")
+    def test_stages_in_tree_across_devices(self, mocker: MagicMock, transaction_root: Path):
+        mocker.patch(
+            "fastgear_cli.core.transaction._get_device",
+            side_effect=lambda path: 1 if path.is_relative_to(transaction_root) else 2,
+        )
+        target = transaction_root / "src" / "billing.py"
+
+        with write_transaction(transaction_root):
+            _write_staged(target, "x = 1\n")
+
+            assert get_write_path(target).is_relative_to(transaction_root)
+
+        assert target.read_text(encoding="utf-8") == "x = 1\n"
+        assert not _staging_dirs(transaction_root)
+
+    @pytest.mark.it("✅  Should write in place when no transaction is active")
+    def test_writes_in_place_without_transaction(self, transaction_root: Path):
+        target = transaction_root / "src" / "__init__.py"
+
+        assert get_write_path(target) == target
+        assert get_read_path(target) == target
+
+    @pytest.mark.it("✅  Should join an already active transaction when nested")
+    def test_joins_active_transaction(self, transaction_root: Path):
+        with write_transaction(transaction_root) as outer:
+            with write_transaction(transaction_root) as inner:
+                _write_staged(transaction_root / "src" / "nested.py", "")
+
+            assert inner is outer
+            assert not (transaction_root / "src" / "nested.py").exists()
+
+        assert (transaction_root / "src" / "nested.py").exists()
+
+    @pytest.mark.it("❌  Should discard staged files when the command fails")
+    def test_discards_staged_files_on_failure(self, transaction_root: Path):
+        target = transaction_root / "src" / "billing" / "__init__.py"
+
+        with pytest.raises(RuntimeError):
+            _write_in_transaction(transaction_root, [target], fail=True)
+
+        assert not target.parent.exists()
+        assert not _staging_dirs(transaction_root)
+
+    @pytest.mark.it("❌  Should roll back committed files when a later rename fails")
+    def test_rolls_back_when_commit_fails(self, mocker: MagicMock, transaction_root: Path):
+        existing_file = transaction_root / "src" / "__init__.py"
+        new_file = transaction_root / "src" / "billing" / "__init__.py"
+        failing_file = transaction_root / "src" / "billing" / "entities.py"
+        move = transaction._move
+
+        def fail_last_move(source: Path, destination: Path) -> None:
+            if destination == failing_file:
+                raise OSError("disk full")
+            move(source, destination)
+
+        mocker.patch("fastgear_cli.core.transaction._move", side_effect=fail_last_move)
+
+        with pytest.raises(OSError, match="disk full"):
+            _write_in_transaction(transaction_root, [existing_file, new_file, failing_file])
+
+        assert existing_file.read_text(encoding="utf-8") == "original = True\n"
+        assert not new_file.parent.exists()
+        assert not _staging_dirs(transaction_root)
+
+    @pytest.mark.it("✅  Should stage rendered templates until the transaction commits")
+    def test_stages_rendered_templates(
+        self,
+        transaction_root: Path,
+        transaction_template_root: Path,
+    ):
+        with write_transaction(transaction_root):
+            files = render_template(
+                transaction_template_root,
+                transaction_root,
+                {"element_name": "billing"},
+                {},
+                {},
+            )
+            second_files = render_template(
+                transaction_template_root,
+                transaction_root,
+                {"element_name": "billing"},
+                {},
+                {},
+            )
+
+            assert not (transaction_root / "src" / "billing").exists()
+
+        assert sorted(files) == [
+            transaction_root / "src" / "billing" / "__init__.py",
+            transaction_root / "src" / "billing" / "py.typed",
+        ]
+        assert second_files == []
+        assert (transaction_root / "src" / "billing" / "__init__.py").read_text() == (
+            "name = 'billing'\n"
+        )
+
+    @pytest.mark.it("✅  Should hand captured files back and leave the tree untouched")
+    def test_captures_staged_files(self, transaction_root: Path):
+        target = transaction_root / "src" / "billing" / "__init__.py"
+
+        with captured_write_transaction(transaction_root) as captured:
+            _write_staged(target, "captured = True\n")
+            staged_files = captured.read_staged_files()
+
+        assert staged_files == {target.resolve(): b"captured = True\n"}
+        assert not target.parent.exists()
+        assert not _staging_dirs(transaction_root)
@@ -0,0 +1,219 @@
+import os
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core.lock_snapshots import LOCK_SNAPSHOT_MAX_AGE_SECONDS, LockSnapshot
+from fastgear_cli.core.uv_lock import UvLockJob, background_uv_lock
+
+pytest_plugins = [
+    "tests.fixtures.core.lock_snapshots_fixtures",
+    "tests.fixtures.core.uv_lock_fixtures",
+]
+
+
+@pytest.mark.describe("🧪  UvLockJob")
+class TestUvLockJob:
+    @pytest.mark.it("✅  Should start uv lock when pyproject.toml is written")
+    def test_starts_when_pyproject_is_written(self, project_dir: Path, mock_popen: MagicMock):
+        job = UvLockJob(project_dir)
+
+        job.notify_file_written(project_dir / "README.md")
+        assert not job.started
+
+        job.notify_file_written(project_dir / "pyproject.toml")
+
+        assert job.started
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["uv", "lock"]
+        assert mock_popen.call_args.kwargs["cwd"] == project_dir
+
+    @pytest.mark.it("✅  Should ignore pyproject.toml files outside the project root")
+    def test_ignores_nested_pyproject(self, project_dir: Path, mock_popen: MagicMock):
+        job = UvLockJob(project_dir)
+
+        job.notify_file_written(project_dir / "docs" / "pyproject.toml")
+
+        assert not job.started
+        mock_popen.assert_not_called()
+
+    @pytest.mark.it("✅  Should start uv lock only once")
+    def test_starts_only_once(self, project_dir: Path, mock_popen: MagicMock):
+        job = UvLockJob(project_dir)
+
+        job.start()
+        job.notify_file_written(project_dir / "pyproject.toml")
+        job.wait()
+
+        mock_popen.assert_called_once()
+
+    @pytest.mark.it("✅  Should start uv lock on wait when it was not started yet")
+    def test_wait_starts_pending_job(self, project_dir: Path, mock_popen: MagicMock):
+        UvLockJob(project_dir).wait()
+
+        mock_popen.assert_called_once()
+
+    @pytest.mark.it("⚠️  Should report uv lock failures on wait")
+    def test_reports_failure(
+        self,
+        project_dir: Path,
+        mock_popen: MagicMock,
+        uv_lock_process: MagicMock,
+        capsys: pytest.CaptureFixture,
+    ):
+        uv_lock_process.communicate.return_value = ("", "resolution failed")
+        uv_lock_process.returncode = 1
+
+        UvLockJob(project_dir).wait()
+
+        assert "Failed to generate uv.lock: resolution failed" in capsys.readouterr().out
+
+    @pytest.mark.it("⚠️  Should report a missing uv executable")
+    def test_reports_missing_uv(
+        self,
+        mocker: MagicMock,
+        project_dir: Path,
+        capsys: pytest.CaptureFixture,
+    ):
+        mocker.patch("fastgear_cli.core.uv_lock.subprocess.Popen", side_effect=FileNotFoundError)
+
+        UvLockJob(project_dir).wait()
+
+        assert "uv not found" in capsys.readouterr().out
+
+    @pytest.mark.it("✅  Should terminate a running uv lock on cancel")
+    def test_cancel_terminates_process(
+        self,
+        project_dir: Path,
+        mock_popen: MagicMock,
+        uv_lock_process: MagicMock,
+    ):
+        job = UvLockJob(project_dir)
+        job.start()
+
+        job.cancel()
+
+        uv_lock_process.terminate.assert_called_once()
+        uv_lock_process.kill.assert_not_called()
+
+    @pytest.mark.it("✅  Should kill uv lock when it does not stop after terminate")
+    def test_cancel_kills_stuck_process(
+        self,
+        project_dir: Path,
+        mock_popen: MagicMock,
+        uv_lock_process: MagicMock,
+    ):
+        uv_lock_process.communicate.side_effect = [
+            subprocess.TimeoutExpired("uv lock", 5),
+            ("", ""),
+        ]
+        job = UvLockJob(project_dir)
+        job.start()
+
+        job.cancel()
+
+        uv_lock_process.kill.assert_called_once()
+
+
+@pytest.mark.describe("🧪  BackgroundUvLock")
+class TestBackgroundUvLock:
+    @pytest.mark.it("✅  Should join uv lock when the block succeeds")
+    def test_joins_on_success(
+        self,
+        project_dir: Path,
+        mock_popen: MagicMock,
+        uv_lock_process: MagicMock,
+    ):
+        with background_uv_lock(project_dir) as job:
+            job.notify_file_written(project_dir / "pyproject.toml")
+
+        uv_lock_process.communicate.assert_called_once_with()
+        uv_lock_process.terminate.assert_not_called()
+
+    @pytest.mark.it("❌  Should cancel uv lock when the block raises")
+    def test_cancels_on_error(
+        self,
+        project_dir: Path,
+        mock_popen: MagicMock,
+        uv_lock_process: MagicMock,
+    ):
+        def generate_and_fail() -> None:
+            with background_uv_lock(project_dir) as job:
+                job.notify_file_written(project_dir / "pyproject.toml")
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            generate_and_fail()
+
+        uv_lock_process.terminate.assert_called_once()
+
+
+@pytest.mark.describe("🧪  UvLockJobSnapshots")
+class TestUvLockJobSnapshots:
+    @pytest.mark.it("✅  Should restore a cached snapshot without running uv")
+    def test_restores_snapshot_without_uv(
+        self,
+        make_project,
+        lock_content,
+        mock_popen: MagicMock,
+        capsys: pytest.CaptureFixture,
+    ):
+        source_dir = make_project("source-project")
+        (source_dir / "uv.lock").write_text(lock_content("source-project"))
+        LockSnapshot.from_pyproject(source_dir / "pyproject.toml").save(source_dir)
+        project_dir = make_project("my-project")
+
+        with background_uv_lock(project_dir) as job:
+            job.notify_file_written(project_dir / "pyproject.toml")
+
+        mock_popen.assert_not_called()
+        assert (project_dir / "uv.lock").read_text() == lock_content("my-project")
+        assert "Restored uv.lock from a cached snapshot" in capsys.readouterr().out
+
+    @pytest.mark.it("✅  Should store a snapshot after uv lock succeeds")
+    def test_stores_snapshot_after_success(
+        self,
+        make_project,
+        lock_content,
+        uv_lock_process: MagicMock,
+        mock_popen: MagicMock,
+    ):
+        project_dir = make_project("my-project")
+        uv_lock_process.communicate.side_effect = lambda: (
+            (project_dir / "uv.lock").write_text(lock_content("my-project")),
+            "",
+        )
+
+        with background_uv_lock(project_dir) as job:
+            job.notify_file_written(project_dir / "pyproject.toml")
+
+        mock_popen.assert_called_once()
+        snapshot = LockSnapshot.from_pyproject(project_dir / "pyproject.toml")
+        assert snapshot.is_fresh()
+
+    @pytest.mark.it("⚠️  Should fall back to an outdated snapshot when uv is missing")
+    def test_falls_back_to_stale_snapshot(
+        self,
+        mocker: MagicMock,
+        make_project,
+        lock_content,
+        capsys: pytest.CaptureFixture,
+    ):
+        source_dir = make_project("source-project")
+        (source_dir / "uv.lock").write_text(lock_content("source-project"))
+        snapshot = LockSnapshot.from_pyproject(source_dir / "pyproject.toml")
+        snapshot.save(source_dir)
+        stale_time = time.time() - LOCK_SNAPSHOT_MAX_AGE_SECONDS - 60
+        os.utime(snapshot.path, (stale_time, stale_time))
+        mocker.patch("fastgear_cli.core.uv_lock.subprocess.Popen", side_effect=FileNotFoundError)
+        project_dir = make_project("my-project")
+
+        UvLockJob(project_dir).wait()
+
+        assert (project_dir / "uv.lock").read_text() == lock_content("my-project")
+        output = capsys.readouterr().out
+        assert "outdated cached snapshot" in output
+        assert "uv not found" not in output
@@ -0,0 +1,79 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core.utils import directory_snapshot_utils
+from fastgear_cli.core.utils.directory_snapshot_utils import DirectorySnapshot
+
+pytest_plugins = ["tests.fixtures.core.utils.directory_snapshot_utils_fixtures"]
+
+
+@pytest.mark.describe("🧪  DirectorySnapshot")
+class TestDirectorySnapshot:
+    @pytest.mark.it("✅  Should report existing files and directories")
+    def test_reports_existing_entries(self, output_tree: Path):
+        snapshot = DirectorySnapshot(output_tree)
+
+        assert snapshot.exists(output_tree / "README.md")
+        assert snapshot.exists(output_tree / "src" / "main.py")
+        assert snapshot.is_dir(output_tree / "src" / "core")
+        assert not snapshot.is_dir(output_tree / "src" / "main.py")
+        assert not snapshot.exists(output_tree / "src" / "other.py")
+
+    @pytest.mark.it("✅  Should scan each directory at most once")
+    def test_scans_each_directory_once(self, mocker: MagicMock, output_tree: Path):
+        scandir = mocker.spy(directory_snapshot_utils.os, "scandir")
+        snapshot = DirectorySnapshot(output_tree)
+
+        for name in ("main.py", "app.py", "settings.py"):
+            snapshot.exists(output_tree / "src" / name)
+        snapshot.exists(output_tree / "README.md")
+
+        assert [call.args[0] for call in scandir.call_args_list] == [
+            output_tree,
+            output_tree / "src",
+        ]
+
+    @pytest.mark.it("✅  Should not scan below a missing directory")
+    def test_does_not_scan_missing_subtrees(self, mocker: MagicMock, output_tree: Path):
+        scandir = mocker.spy(directory_snapshot_utils.os, "scandir")
+        snapshot = DirectorySnapshot(output_tree)
+
+        assert not snapshot.exists(output_tree / "docs" / "guide" / "index.md")
+        assert not snapshot.exists(output_tree / "docs" / "api" / "index.md")
+
+        assert [call.args[0] for call in scandir.call_args_list] == [output_tree]
+
+    @pytest.mark.it("✅  Should create each missing parent directory exactly once")
+    def test_creates_each_directory_once(self, mocker: MagicMock, output_tree: Path):
+        mkdir = mocker.spy(Path, "mkdir")
+        snapshot = DirectorySnapshot(output_tree)
+
+        snapshot.create_parent_directories(
+            [
+                output_tree / "docs" / "guide" / "index.md",
+                output_tree / "docs" / "guide" / "setup.md",
+                output_tree / "docs" / "api" / "index.md",
+                output_tree / "src" / "core" / "config.py",
+            ]
+        )
+
+        created = [call.args[0] for call in mkdir.call_args_list]
+        assert sorted(created) == [
+            output_tree / "docs",
+            output_tree / "docs" / "api",
+            output_tree / "docs" / "guide",
+        ]
+        assert created[0] == output_tree / "docs"
+        assert (output_tree / "docs" / "guide").is_dir()
+
+    @pytest.mark.it("✅  Should create a missing output root")
+    def test_creates_missing_root(self, tmp_path: Path):
+        root = tmp_path / "new" / "project"
+        snapshot = DirectorySnapshot(root)
+
+        assert not snapshot.exists(root / "README.md")
+        snapshot.create_parent_directories([root / "src" / "main.py"])
+
+        assert (root / "src").is_dir()
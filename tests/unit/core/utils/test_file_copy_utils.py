@@ -0,0 +1,72 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fastgear_cli.core.constants.enums import StaticCopyModeEnum
+from fastgear_cli.core.utils.file_copy_utils import copy_static_file
+
+pytest_plugins = ["tests.fixtures.core.utils.file_copy_utils_fixtures"]
+
+
+@pytest.mark.describe("🧪  CopyStaticFile")
+class TestCopyStaticFile:
+    @pytest.mark.it("✅  Should copy the file into an independent inode by default")
+    def test_copies_by_default(self, static_file: Path, destination_file: Path):
+        destination_file.parent.mkdir()
+
+        copy_static_file(static_file, destination_file)
+
+        assert destination_file.read_bytes() == static_file.read_bytes()
+        assert destination_file.stat().st_ino != static_file.stat().st_ino
+
+    @pytest.mark.it("✅  Should hardlink the file in hardlink mode")
+    def test_hardlinks_file(self, static_file: Path, destination_file: Path):
+        destination_file.parent.mkdir()
+
+        copy_static_file(static_file, destination_file, StaticCopyModeEnum.HARDLINK)
+
+        assert destination_file.stat().st_ino == static_file.stat().st_ino
+
+    @pytest.mark.it("⚠️  Should fall back to a copy when hardlinking fails")
+    def test_falls_back_when_hardlink_fails(
+        self,
+        mocker: MagicMock,
+        static_file: Path,
+        destination_file: Path,
+    ):
+        destination_file.parent.mkdir()
+        mocker.patch("fastgear_cli.core.utils.file_copy_utils.os.link", side_effect=OSError)
+
+        copy_static_file(static_file, destination_file, StaticCopyModeEnum.HARDLINK)
+
+        assert destination_file.read_bytes() == static_file.read_bytes()
+        assert destination_file.stat().st_ino != static_file.stat().st_ino
+
+    @pytest.mark.it("✅  Should produce identical content in reflink mode")
+    def test_reflinks_or_copies_file(self, static_file: Path, destination_file: Path):
+        destination_file.parent.mkdir()
+
+        copy_static_file(static_file, destination_file, StaticCopyModeEnum.REFLINK)
+
+        assert destination_file.read_bytes() == static_file.read_bytes()
+        assert destination_file.stat().st_ino != static_file.stat().st_ino
+
+    @pytest.mark.it("⚠️  Should fall back to a copy when reflinks are unsupported")
+    def test_falls_back_when_reflink_fails(
+        self,
+        mocker: MagicMock,
+        static_file: Path,
+        destination_file: Path,
+    ):
+        destination_file.parent.mkdir()
+        mocker.patch("fastgear_cli.core.utils.file_copy_utils.sys.platform", "linux")
+        mocker.patch("fcntl.ioctl", side_effect=OSError)
+        mock_copyfile = mocker.patch(
+            "fastgear_cli.core.utils.file_copy_utils.shutil.copyfile",
+        )
+
+        copy_static_file(static_file, destination_file, StaticCopyModeEnum.REFLINK)
+
+        mock_copyfile.assert_called_once_with(static_file, destination_file)
+        assert not destination_file.exists()
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from fastgear_cli.core.utils.file_write_utils import write_text_if_changed
+
+pytest_plugins = ["tests.fixtures.core.utils.file_write_utils_fixtures"]
+
+
+@pytest.mark.describe("🧪  WriteTextIfChanged")
+class TestWriteTextIfChanged:
+    @pytest.mark.it("✅  Should skip the write and keep the mtime when content is identical")
+    def test_skips_identical_content(self, existing_file: Path):
+        written = write_text_if_changed(existing_file, "x = 1\n")
+
+        assert written is False
+        assert existing_file.stat().st_mtime_ns == 1_000_000_000
+
+    @pytest.mark.it("✅  Should write when the content differs")
+    def test_writes_changed_content(self, existing_file: Path):
+        written = write_text_if_changed(existing_file, "x = 2\n")
+
+        assert written is True
+        assert existing_file.read_text(encoding="utf-8") == "x = 2\n"
+        assert existing_file.stat().st_mtime_ns != 1_000_000_000
+
+    @pytest.mark.it("✅  Should write when the content has the same size but differs")
+    def test_writes_same_size_changed_content(self, existing_file: Path):
+        assert write_text_if_changed(existing_file, "y = 1\n") is True
+        assert existing_file.read_text(encoding="utf-8") == "y = 1\n"
+
+    @pytest.mark.it("✅  Should create missing parent directories for new files")
+    def test_creates_new_files(self, tmp_path: Path):
+        file_path = tmp_path / "new" / "package" / "__init__.py"
+
+        assert write_text_if_changed(file_path, "x = 1\n") is True
+        assert file_path.read_text(encoding="utf-8") == "x = 1\n"
@@ -0,0 +1,112 @@
+import pytest
+
+from fastgear_cli.core.utils.import_block_utils import merge_import_line
+
+
+@pytest.mark.describe("🧪  MergeImportLine")
+class TestMergeImportLine:
+    @pytest.mark.it("✅  Should combine members imported from the same module")
+    def test_combine_same_module_members(self):
+        content = "from .controllers import invoice_router\n\nrouter = APIRouter()\n"
+
+        result = merge_import_line(content, "from .controllers import billing_router")
+
+        assert result == (
+            "from .controllers import billing_router, invoice_router\n\nrouter = APIRouter()\n"
+        )
+
+    @pytest.mark.it("✅  Should order sections like ruff isort")
+    def test_order_sections(self):
+        content = "from .entities import Billing\n\nbilling_entities = [Billing]\n"
+
+        result = merge_import_line(content, "from fastapi import APIRouter")
+        result = merge_import_line(result, "import os")
+        result = merge_import_line(result, "from src.core import settings")
+
+        assert result == (
+            "import os\n"
+            "\n"
+            "from fastapi import APIRouter\n"
+            "\n"
+            "from src.core import settings\n"
+            "\n"
+            "from .entities import Billing\n"
+            "\n"
+            "billing_entities = [Billing]\n"
+        )
+
+    @pytest.mark.it("✅  Should place configured first-party modules in their own section")
+    def test_configured_first_party_modules(self):
+        content = "from fastapi import APIRouter\n\nrouter = APIRouter()\n"
+
+        result = merge_import_line(
+            content,
+            "from app.core import settings",
+            first_party_modules=frozenset({"app"}),
+        )
+
+        assert result == (
+            "from fastapi import APIRouter\n"
+            "\n"
+            "from app.core import settings\n"
+            "\n"
+            "router = APIRouter()\n"
+        )
+
+    @pytest.mark.it("✅  Should not duplicate an import that follows other statements")
+    def test_skip_import_after_other_code(self):
+        content = "import logging\n\nlogger = logging.getLogger()\n\nfrom .entities import User\n"
+
+        result = merge_import_line(content, "from .entities import User")
+
+        assert result == content
+
+    @pytest.mark.it("⚠️  Should append instead of rewriting when an import shares its line")
+    def test_append_when_import_shares_line(self):
+        content = "from .b import B; x = 1\n"
+
+        result = merge_import_line(content, "from .a import A")
+
+        assert result == "from .b import B; x = 1\nfrom .a import A\n"
+
+    @pytest.mark.it("✅  Should keep two blank lines before a class definition")
+    def test_blank_lines_before_class(self):
+        content = "from fastapi import APIRouter\n\n\nclass Billing:\n    pass\n"
+
+        result = merge_import_line(content, "from .entities import Invoice")
+
+        assert result == (
+            "from fastapi import APIRouter\n"
+            "\n"
+            "from .entities import Invoice\n"
+            "\n"
+            "\n"
+            "class Billing:\n"
+            "    pass\n"
+        )
+
+    @pytest.mark.it("✅  Should wrap imports longer than the line length")
+    def test_wrap_long_import(self):
+        content = "from .entities import Billing\n"
+
+        result = merge_import_line(content, "from .entities import Invoice", line_length=30)
+
+        assert result == "from .entities import (\n    Billing,\n    Invoice,\n)\n"
+
+    @pytest.mark.it("✅  Should return the content unchanged when the import already exists")
+    def test_return_unchanged_when_imported(self):
+        content = "from .entities import Invoice, Billing\n"
+
+        result = merge_import_line(content, "from .entities import Billing")
+
+        assert result is content
+
+    @pytest.mark.it("⚠️  Should append after a commented import block instead of rewriting it")
+    def test_append_after_commented_block(self):
+        content = '"""Billing."""\n\nfrom .b import (\n    B,  # noqa\n)\n\nx = 1\n'
+
+        result = merge_import_line(content, "from .a import A")
+
+        assert result == (
+            '"""Billing."""\n\nfrom .b import (\n    B,  # noqa\n)\nfrom .a import A\n\nx = 1\n'
+        )
@@ -6,6 +6,7 @@ from fastgear_cli.core.utils.init_content_merge_utils import (
     merge_required_line,
     merge_symbol_list_assignment,
     parse_symbol_list_assignment,
+    render_list_assignment,
 )
 
 
@@ -213,3 +214,28 @@ class TestParseSymbolListAssignment:
         result = parse_symbol_list_assignment(line)
 
         assert result is None
+
+
+@pytest.mark.describe("🧪  RenderListAssignment")
+class TestRenderListAssignment:
+    @pytest.mark.it("✅  Should render a single line when it fits the line length")
+    def test_render_single_line(self):
+        result = render_list_assignment("entities", ["Billing", "Invoice"])
+
+        assert result == "entities = [Billing, Invoice]"
+
+    @pytest.mark.it("✅  Should explode the list when it exceeds the line length")
+    def test_explode_long_list(self):
+        result = render_list_assignment("entities", ["Billing", "Invoice"], line_length=20)
+
+        assert result == "entities = [\n    Billing,\n    Invoice,\n]"
+
+    @pytest.mark.it("✅  Should keep a list with a trailing comma exploded")
+    def test_keep_exploded_list(self):
+        result = merge_symbol_list_assignment(
+            current="entities = [\n    Billing,\n]\n",
+            list_name="entities",
+            symbol_name="Invoice",
+        )
+
+        assert result == "entities = [\n    Billing,\n    Invoice,\n]\n"
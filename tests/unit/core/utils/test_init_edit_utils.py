@@ -0,0 +1,194 @@
+import pytest
+
+from fastgear_cli.core.utils.init_edit_utils import InitFileEdits, apply_init_edits
+
+
+@pytest.mark.describe("🧪  ApplyInitEdits")
+class TestApplyInitEdits:
+    @pytest.mark.it("✅  Should apply imports, list extensions and anchored lines in one pass")
+    def test_apply_all_edits(self):
+        content = (
+            "from fastapi import APIRouter\n"
+            "\n"
+            "from .controllers import billing_router\n"
+            "from .entities import Billing\n"
+            "\n"
+            "billing_module_router = APIRouter()\n"
+            "billing_module_router.include_router(billing_router)\n"
+            "\n"
+            "billing_entities = [Billing]\n"
+        )
+        edits = InitFileEdits()
+        edits.add_import("from .controllers import invoice_router")
+        edits.add_import("from .entities import Invoice")
+        edits.add_line(
+            "billing_module_router.include_router(invoice_router)",
+            anchor_line="billing_module_router = APIRouter()",
+        )
+        edits.extend_list("billing_entities", ["Invoice"])
+
+        result = apply_init_edits(content, edits)
+
+        assert result == (
+            "from fastapi import APIRouter\n"
+            "\n"
+            "from .controllers import billing_router, invoice_router\n"
+            "from .entities import Billing, Invoice\n"
+            "\n"
+            "billing_module_router = APIRouter()\n"
+            "billing_module_router.include_router(invoice_router)\n"
+            "billing_module_router.include_router(billing_router)\n"
+            "\n"
+            "billing_entities = [Billing, Invoice]\n"
+        )
+
+    @pytest.mark.it("✅  Should extend multi-line lists in place and keep their comments")
+    def test_extend_multiline_list(self):
+        content = (
+            "from .entities import Billing\n"
+            "\n"
+            "billing_entities = [\n"
+            "    Billing,  # main entity\n"
+            "]\n"
+        )
+        edits = InitFileEdits()
+        edits.extend_list("billing_entities", ["Invoice"])
+
+        result = apply_init_edits(content, edits)
+
+        assert result == (
+            "from .entities import Billing\n"
+            "\n"
+            "billing_entities = [\n"
+            "    Billing,  # main entity\n"
+            "    Invoice,\n"
+            "]\n"
+        )
+
+    @pytest.mark.it("✅  Should append missing lines and lists after the existing content")
+    def test_append_missing_statements(self):
+        content = "from .entities import Users\n\nusers_entities = [Users]\n"
+        edits = InitFileEdits()
+        edits.add_import("from fastapi import APIRouter")
+        edits.add_line("users_module_router = APIRouter()")
+        edits.add_line(
+            "users_module_router.include_router(users_router)",
+            anchor_line="users_module_router = APIRouter()",
+        )
+        edits.extend_list("__all__", ["Users"], quoted=True)
+
+        result = apply_init_edits(content, edits)
+
+        assert result == (
+            "from fastapi import APIRouter\n"
+            "\n"
+            "from .entities import Users\n"
+            "\n"
+            "users_entities = [Users]\n"
+            "\n"
+            "users_module_router = APIRouter()\n"
+            "users_module_router.include_router(users_router)\n"
+            "\n"
+            '__all__ = ["Users"]\n'
+        )
+
+    @pytest.mark.it("✅  Should extend a quoted __all__ list")
+    def test_extend_quoted_list(self):
+        content = "from .billing_entity import Billing\n\n__all__ = ['Billing']\n"
+        edits = InitFileEdits()
+        edits.add_import("from .invoice_entity import Invoice")
+        edits.extend_list("__all__", ["Invoice"], quoted=True)
+
+        result = apply_init_edits(content, edits)
+
+        assert result == (
+            "from .billing_entity import Billing\n"
+            "from .invoice_entity import Invoice\n"
+            "\n"
+            '__all__ = ["Billing", "Invoice"]\n'
+        )
+
+    @pytest.mark.it("✅  Should return the content unchanged when every edit is present")
+    def test_return_unchanged_content(self):
+        content = "from .entities import Billing\n\nbilling_entities = [Billing]\n"
+        edits = InitFileEdits()
+        edits.add_import("from .entities import Billing")
+        edits.extend_list("billing_entities", ["Billing"])
+
+        result = apply_init_edits(content, edits)
+
+        assert result is content
+
+    @pytest.mark.it("✅  Should not duplicate an import that follows other statements")
+    def test_skip_import_after_other_code(self):
+        content = (
+            "import logging\n"
+            "\n"
+            "logger = logging.getLogger(__name__)\n"
+            "\n"
+            "from .user_entity import User\n"
+            "\n"
+            '__all__ = ["User"]\n'
+        )
+        edits = InitFileEdits()
+        edits.add_import("from .user_entity import User")
+        edits.extend_list("__all__", ["User"], quoted=True)
+
+        result = apply_init_edits(content, edits)
+
+        assert result is content
+
+    @pytest.mark.it("⚠️  Should keep statements sharing a line with the import block")
+    def test_keep_statement_on_import_line(self):
+        content = 'from .b import B; __all__ = ["B"]\n'
+        edits = InitFileEdits()
+        edits.add_import("from .a import A")
+        edits.extend_list("__all__", ["A"], quoted=True)
+
+        result = apply_init_edits(content, edits)
+
+        assert result == 'from .b import B; __all__ = ["B", "A"]\nfrom .a import A\n'
+
+    @pytest.mark.it("✅  Should keep commented import blocks and the docstring in place")
+    def test_keep_commented_import_block(self):
+        content = '"""Entities."""\n\nfrom .b import (\n    B,  # noqa\n)\n\n__all__ = ["B"]\n'
+        edits = InitFileEdits()
+        edits.add_import("from .a import A")
+        edits.extend_list("__all__", ["A"], quoted=True)
+
+        result = apply_init_edits(content, edits)
+
+        assert result == (
+            '"""Entities."""\n'
+            "\n"
+            "from .b import (\n"
+            "    B,  # noqa\n"
+            ")\n"
+            "from .a import A\n"
+            "\n"
+            '__all__ = ["B", "A"]\n'
+        )
+        compile(result, "__init__.py", "exec")
+
+    @pytest.mark.it("✅  Should extend annotated and tuple __all__ assignments")
+    def test_extend_annotated_and_tuple_lists(self):
+        edits = InitFileEdits()
+        edits.extend_list("__all__", ["A"], quoted=True)
+
+        annotated = apply_init_edits('__all__: list[str] = ["B"]\n', edits)
+        single_tuple = apply_init_edits('__all__ = ("B",)\n', edits)
+        bare_tuple = apply_init_edits('__all__ = "B", "C"\n', edits)
+
+        assert annotated == '__all__: list[str] = ["B", "A"]\n'
+        assert single_tuple == '__all__ = ("B", "A")\n'
+        assert bare_tuple == '__all__ = ("B", "C", "A")\n'
+
+    @pytest.mark.it("⚠️  Should fall back to line-based merges when the file does not parse")
+    def test_fall_back_on_syntax_error(self):
+        content = "from .entities import Billing\n\nbilling_entities = [Billing\n"
+        edits = InitFileEdits()
+        edits.add_import("from .entities import Invoice")
+
+        result = apply_init_edits(content, edits)
+
+        assert "from .entities import Invoice" in result.splitlines()